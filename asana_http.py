@@ -0,0 +1,74 @@
+"""
+Async Asana REST client for Botsana.
+Covers the task writes the bot makes most often without tying up a worker thread per call.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import httpx
+from asana.error import AsanaError, ForbiddenError, NotFoundError
+
+logger = logging.getLogger(__name__)
+
+ASANA_API_URL = "https://app.asana.com/api/1.0"
+
+
+class AsanaHTTP:
+    """Talks to the Asana task endpoints over a shared httpx.AsyncClient.
+
+    Errors are raised as the SDK's asana.error types so existing handlers keep working.
+    """
+
+    def __init__(self, access_token: str, max_retries: int = 3):
+        self.max_retries = max_retries
+        self.client = httpx.AsyncClient(
+            base_url=ASANA_API_URL,
+            headers={'Authorization': f'Bearer {access_token}', 'Accept': 'application/json'},
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+
+    async def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """Send a request, waiting out 429s per Retry-After, and return the response's data."""
+        for attempt in range(self.max_retries + 1):
+            response = await self.client.request(method, path, **kwargs)
+            if response.status_code == 429 and attempt < self.max_retries:
+                try:
+                    delay = float(response.headers.get('Retry-After', 2 ** attempt))
+                except ValueError:
+                    delay = 2 ** attempt
+                logger.warning(f"Asana rate limited {method} {path}, retrying in {delay}s")
+                await asyncio.sleep(delay)
+                continue
+            break
+
+        if response.status_code == 404:
+            raise NotFoundError(response)
+        if response.status_code == 403:
+            raise ForbiddenError(response)
+        if response.is_error:
+            raise AsanaError(message=response.reason_phrase, status=response.status_code, response=response)
+        return response.json()['data']
+
+    async def get_task(self, task_id: str, opt_fields: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch a single task."""
+        params = {'opt_fields': opt_fields} if opt_fields else None
+        return await self._request('GET', f'/tasks/{task_id}', params=params)
+
+    async def create_task(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a task from the given fields."""
+        return await self._request('POST', '/tasks', json={'data': data})
+
+    async def update_task(self, task_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update the given fields on a task."""
+        return await self._request('PUT', f'/tasks/{task_id}', json={'data': data})
+
+    async def complete_task(self, task_id: str) -> Dict[str, Any]:
+        """Mark a task as completed."""
+        return await self.update_task(task_id, {'completed': True})
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self.client.aclose()
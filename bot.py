@@ -12,18 +12,29 @@ from dotenv import load_dotenv
 import logging
 from typing import Optional, List, Dict, Any
 import asyncio
+import contextlib
+import functools
+from dataclasses import dataclass
+import hashlib
+import platform
+import time
+from collections import OrderedDict
+from itertools import islice
 from asana.error import AsanaError, NotFoundError, ForbiddenError
 from flask import Flask, request, jsonify
 import threading
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 import json
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 import httpx
 from config import bot_config
 from error_logger import init_error_logger
-from database import db_manager, ErrorLog
-from sqlalchemy import text
+from asana_http import AsanaHTTP
+from cache import TTLCache, async_ttl_cache
+from embeds import ERROR_COLOR, INFO_COLOR, NEUTRAL_COLOR, NOTICE_COLOR, SUCCESS_COLOR, WARNING_COLOR, admin_required_embed, build_embed, embed_dict, embed_from_template, already_clocked_in_embed, error_embed, success_embed
+from database import db_manager, ErrorLog, TimeEntry, build_saved_search_summaries, build_task_template_summary
+from sqlalchemy import func, text
 
 # Load environment variables
 load_dotenv()
@@ -55,6 +66,7 @@ bot = commands.Bot(command_prefix='!', intents=intents)
 
 # Initialize Asana client
 asana_client = asana.Client.access_token(ASANA_ACCESS_TOKEN)
+asana_http = AsanaHTTP(ASANA_ACCESS_TOKEN)
 
 @bot.event
 async def on_ready():
@@ -69,6 +81,12 @@ async def on_ready():
     except Exception as e:
         logger.error(f'Failed to sync commands: {e}')
 
+    # Flush batched saved search usage counts every few seconds
+    scheduler.add_job(flush_saved_search_usage, 'interval', seconds=5,
+                      id='flush_saved_search_usage', replace_existing=True)
+    if not scheduler.running:
+        scheduler.start()
+
 @bot.event
 async def on_command_error(ctx, error):
     """Handle command errors."""
@@ -87,13 +105,19 @@ async def on_message(message):
     if message.author.bot:
         return
 
-    # Check if this is in a designated chat channel
-    chat_channel_config = db_manager.get_chat_channel(message.guild.id) if message.guild else None
-    if not chat_channel_config or message.channel.id != chat_channel_config['channel_id']:
+    if not message.guild:
+        return
+
+    note_recent_speaker(message.guild.id, message.author)
+
+    # Check if the bot is mentioned before touching the database; raw_mentions reads
+    # the IDs straight from the content instead of building Member objects
+    if bot.user.id not in message.raw_mentions:
         return
 
-    # Check if the bot is mentioned
-    if bot.user not in message.mentions:
+    # Check if this is in a designated chat channel
+    chat_channel_config = db_manager.get_chat_channel(message.guild.id)
+    if not chat_channel_config or message.channel.id != chat_channel_config['channel_id']:
         return
 
     # Process the natural language task creation request
@@ -103,8 +127,9 @@ async def on_message(message):
 class AsanaManager:
     """Manages Asana API interactions."""
 
-    def __init__(self, client, workspace_id, default_project_id=None):
+    def __init__(self, client, http, workspace_id, default_project_id=None):
         self.client = client
+        self.http = http
         self.workspace_id = workspace_id
         self.default_project_id = default_project_id
 
@@ -118,8 +143,7 @@ class AsanaManager:
             if project_id is None:
                 # First try guild-specific default project
                 if guild_id:
-                    guild_config = bot_config.get_guild_config(guild_id)
-                    project_id = guild_config.get('default_project_id')
+                    project_id = await get_guild_default_project(guild_id)
 
                 # Fall back to environment variable default
                 if not project_id:
@@ -143,7 +167,7 @@ class AsanaManager:
                 task_data['notes'] = notes
 
             # Create the task
-            result = self.client.tasks.create_task(task_data)
+            result = await self.http.create_task(task_data)
             logger.info(f"Created task: {result['gid']} - {result['name']}")
 
             # Log history entry
@@ -182,7 +206,7 @@ class AsanaManager:
             current_task = None
             if guild_id:
                 try:
-                    current_task = self.client.tasks.get_task(task_id)
+                    current_task = await self.http.get_task(task_id)
                 except:
                     pass
 
@@ -204,7 +228,7 @@ class AsanaManager:
                 raise ValueError("No fields to update")
 
             # Update the task
-            result = self.client.tasks.update_task(task_id, update_data)
+            result = await self.http.update_task(task_id, update_data)
             logger.info(f"Updated task: {task_id}")
 
             # Log history entries for each field change
@@ -256,12 +280,12 @@ class AsanaManager:
             current_task = None
             if guild_id:
                 try:
-                    current_task = self.client.tasks.get_task(task_id)
+                    current_task = await self.http.get_task(task_id)
                 except:
                     pass
 
             # Mark task as completed
-            result = self.client.tasks.update_task(task_id, {'completed': True})
+            result = await self.http.complete_task(task_id)
             logger.info(f"Completed task: {task_id}")
 
             # Log history entry
@@ -287,24 +311,35 @@ class AsanaManager:
             logger.error(f"Error completing task {task_id}: {e}")
             raise
 
-    async def list_tasks(self, project_id: Optional[str] = None, assignee: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List tasks from a project or assigned to a user."""
+    async def list_tasks(self, project_id: Optional[str] = None, assignee: Optional[str] = None,
+                        incomplete_only: bool = False, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List tasks from a project or assigned to a user.
+
+        incomplete_only and limit are applied by the Asana API rather than after fetching.
+        """
         try:
             tasks = []
 
+            # Let Asana filter and page the results
+            query_params = {}
+            if incomplete_only:
+                query_params['completed_since'] = 'now'
+            if limit:
+                query_params['limit'] = limit
+
             if project_id:
                 # List tasks in a specific project
-                result = self.client.tasks.get_tasks_for_project(project_id, opt_fields='name,due_on,assignee.name,completed,notes')
-                tasks = [task for task in result if task is not None]
+                result = self.client.tasks.get_tasks_for_project(project_id, opt_fields='name,due_on,assignee.name,completed,notes', **query_params)
+                tasks = [task for task in islice(result, limit) if task is not None]
             elif assignee:
                 # List tasks assigned to a user
-                result = self.client.tasks.get_tasks_for_user(assignee, workspace=self.workspace_id, opt_fields='name,due_on,assignee.name,completed,notes,projects.name')
-                tasks = [task for task in result if task is not None]
+                result = self.client.tasks.get_tasks_for_user(assignee, workspace=self.workspace_id, opt_fields='name,due_on,assignee.name,completed,notes,projects.name', **query_params)
+                tasks = [task for task in islice(result, limit) if task is not None]
             else:
                 # List all tasks in workspace (limited)
                 if self.default_project_id:
-                    result = self.client.tasks.get_tasks_for_project(self.default_project_id, opt_fields='name,due_on,assignee.name,completed,notes')
-                    tasks = [task for task in result if task is not None]
+                    result = self.client.tasks.get_tasks_for_project(self.default_project_id, opt_fields='name,due_on,assignee.name,completed,notes', **query_params)
+                    tasks = [task for task in islice(result, limit) if task is not None]
                 else:
                     raise ValueError("No project or assignee specified, and no default project set")
 
@@ -437,7 +472,7 @@ class AsanaManager:
             raise
 
 # Initialize Asana manager
-asana_manager = AsanaManager(asana_client, ASANA_WORKSPACE_ID, ASANA_DEFAULT_PROJECT_ID)
+asana_manager = AsanaManager(asana_client, asana_http, ASANA_WORKSPACE_ID, ASANA_DEFAULT_PROJECT_ID)
 
 # Discord UI Components
 class AsanaUserSelect(discord.ui.Select):
@@ -545,13 +580,14 @@ class AsanaUserSelectView(discord.ui.View):
 
     def __init__(self, discord_user: discord.Member, asana_users: List[Dict[str, Any]]):
         super().__init__(timeout=300)  # 5 minute timeout
+        self.message = None  # Set by the sender once the menu is shown
         self.add_item(AsanaUserSelect(discord_user, asana_users))
 
     async def on_timeout(self):
         """Handle when the view times out."""
-        # Disable all components
-        for item in self.children:
-            item.disabled = True
+        # No message to edit if sending it failed; ephemeral ones go away on their own
+        if self.message is None or self.message.flags.ephemeral:
+            return
 
         embed = discord.Embed(
             title="⏰ Selection Timed Out",
@@ -560,9 +596,10 @@ class AsanaUserSelectView(discord.ui.View):
         )
 
         try:
-            await self.message.edit(embed=embed, view=self)
-        except:
-            pass  # Message might have been deleted
+            # The menu can't be used anymore, so drop it instead of sending it back disabled
+            await self.message.edit(embed=embed, view=None)
+        except discord.HTTPException:
+            pass  # Message deleted, or the interaction token expired
 
 # Initialize Flask app for webhooks
 flask_app = Flask(__name__)
@@ -570,6 +607,94 @@ flask_app = Flask(__name__)
 # Scheduler for periodic tasks
 scheduler = AsyncIOScheduler()
 
+# Saved search usage increments waiting to be written ({search_id: count})
+pending_search_usage: Dict[int, int] = {}
+
+def record_saved_search_usage(search_id: int):
+    """Queue a usage count increment for a saved search (flushed in batches)."""
+    pending_search_usage[search_id] = pending_search_usage.get(search_id, 0) + 1
+
+async def flush_saved_search_usage():
+    """Write all queued saved search usage increments in a single batch."""
+    global pending_search_usage
+
+    if not pending_search_usage:
+        return
+
+    usage_counts, pending_search_usage = pending_search_usage, {}
+    success = await run_db(db_manager.increment_saved_search_usage, usage_counts)
+
+    if not success:
+        # Keep the increments so the next flush can retry them
+        for search_id, count in usage_counts.items():
+            pending_search_usage[search_id] = pending_search_usage.get(search_id, 0) + count
+
+# Fire-and-forget tasks started by commands; held here so they aren't garbage collected mid-run
+background_tasks = set()
+
+def spawn_background_task(coro) -> asyncio.Task:
+    """Run a coroutine after the current command returns, keeping a reference until it finishes."""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+async def run_db(func, *args, **kwargs):
+    """Run a synchronous db_manager call in a worker thread so it doesn't block the event loop."""
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+# Guild ID -> default project ID set with /set-default-project (None when unset);
+# /set-default-project drops its guild's entry
+guild_default_project_cache = TTLCache(maxsize=1_000, ttl=300)
+
+async def get_guild_default_project(guild_id: int) -> Optional[str]:
+    """Return the guild's default project ID, loading the guild config at most every five minutes."""
+    if guild_id in guild_default_project_cache:
+        return guild_default_project_cache.get(guild_id)
+
+    guild_config = await run_db(bot_config.get_guild_config, guild_id)
+    project_id = guild_config.get('default_project_id')
+    guild_default_project_cache.set(guild_id, project_id)
+    return project_id
+
+# Task fields rendered by the search result embeds (/search-tasks, /load-search)
+SEARCH_RESULT_OPT_FIELDS = 'name,assignee.name,due_on,completed'
+
+# A single http(s) URL with no whitespace, used to validate /clock-out time proof links
+URL_RE = re.compile(r'^https?://[^\s<>"]+$')
+
+# A Discord user mention, <@123> or the legacy nickname form <@!123>
+MENTION_RE = re.compile(r'<@!?(\d+)>')
+
+# The shape of a YYYY-MM-DD date, checked before the (slower) strptime calendar check
+ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Mentions of the bot itself; compiled by get_bot_mention_re() once bot.user is known
+BOT_MENTION_RE = None
+
+def get_bot_mention_re():
+    """Return the bot-mention pattern, compiling it on first use.
+
+    Messages can arrive before on_ready fires, so this can't wait for on_ready.
+    """
+    global BOT_MENTION_RE
+    if BOT_MENTION_RE is None:
+        BOT_MENTION_RE = re.compile(rf'<@!?{bot.user.id}>')
+    return BOT_MENTION_RE
+
+# An Authorization bearer token, as it may appear in an HTTP error message
+BEARER_TOKEN_RE = re.compile(r'Bearer\s+\S+')
+
+def short_exc(error: Exception, limit: int = 500) -> str:
+    """Describe an exception for an embed: bearer tokens masked and capped at limit characters.
+
+    Asana and HTTP errors can carry whole response bodies, which would overflow the embed.
+    """
+    text = BEARER_TOKEN_RE.sub('Bearer ***', str(error))
+    if len(text) > limit:
+        text = text[:limit] + "... [truncated]"
+    return text
+
 # Audit channel configuration
 AUDIT_CHANNELS = {
     'taskmaster': '📋 All task creations and deletions',
@@ -731,7 +856,9 @@ class AuditManager:
                             tasks_by_assignee[assignee_id] = []
                         tasks_by_assignee[assignee_id].append(task)
 
-            # Send personalized reminders for each assignee
+            # Send personalized reminders for each assignee, resolving every
+            # assignee's mapping and preferences in one batch
+            reminders = []
             for asana_assignee_id, assignee_tasks in tasks_by_assignee.items():
                 for reminder_type, time_delta in reminder_intervals.items():
                     reminder_threshold = now + time_delta
@@ -743,9 +870,12 @@ class AuditManager:
                         if due_date <= reminder_threshold:
                             matching_tasks.append(task)
 
-                    # Send reminders for tasks in this interval
+                    # Queue reminders for tasks in this interval
                     for task in matching_tasks:
-                        await send_due_date_reminder(task, asana_assignee_id, reminder_type)
+                        reminders.append((task, asana_assignee_id, reminder_type))
+
+            if reminders:
+                await send_due_date_reminders_bulk(reminders)
 
             # Also send the general audit channel notification (legacy behavior)
             tomorrow = now + timedelta(days=1)
@@ -785,6 +915,64 @@ audit_manager = AuditManager()
 # Initialize error logger (will be set in main)
 error_logger = None
 
+# System events waiting to be written by system_event_consumer, so logging stays off the reply path
+system_event_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+
+def queue_system_event(event_type: str, message: str, details: Optional[Dict[str, Any]] = None,
+                       severity: str = "INFO", timestamp: Optional[datetime] = None):
+    """Queue a system event for the background consumer instead of awaiting the write."""
+    try:
+        system_event_queue.put_nowait((event_type, message, details, severity, timestamp))
+    except asyncio.QueueFull:
+        logger.warning(f"System event queue full, dropping {event_type} event")
+
+# Events written per batch, and how long to wait for more after the first arrives
+SYSTEM_EVENT_BATCH_SIZE = 32
+SYSTEM_EVENT_BATCH_WINDOW = 0.1
+
+async def write_system_events(batch: list):
+    """Write a batch of events taken off system_event_queue and mark them done."""
+    if not batch:
+        return
+    try:
+        await error_logger.log_system_event_batch(batch)
+    except Exception as e:
+        logger.error(f"Error writing system events: {e}")
+    finally:
+        for _ in batch:
+            system_event_queue.task_done()
+
+async def system_event_consumer():
+    """Write queued system events through the error logger in small batches.
+
+    On cancellation, events already taken off the queue are still written before it stops.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = []
+        try:
+            batch.append(await system_event_queue.get())
+            deadline = loop.time() + SYSTEM_EVENT_BATCH_WINDOW
+            while len(batch) < SYSTEM_EVENT_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(system_event_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            await write_system_events(batch)
+            raise
+
+        write = asyncio.ensure_future(write_system_events(batch))
+        try:
+            await asyncio.shield(write)
+        except asyncio.CancelledError:
+            # Let the in-flight write finish rather than dropping the batch
+            await write
+            raise
+
 # Flask webhook endpoints
 @flask_app.route('/webhook', methods=['POST'])
 def handle_webhook():
@@ -986,14 +1174,14 @@ def handle_asana_error(error: Exception) -> str:
         elif hasattr(error, 'status') and error.status >= 500:
             return "❌ Asana service is temporarily unavailable. Please try again later."
         else:
-            return f"❌ Asana API error: {str(error)}"
+            return f"❌ Asana API error: {short_exc(error)}"
     elif isinstance(error, ValueError):
-        return f"❌ Invalid input: {str(error)}"
+        return f"❌ Invalid input: {short_exc(error)}"
     elif isinstance(error, ConnectionError):
         return "❌ Network error. Please check your connection and try again."
     else:
         logger.error(f"Unexpected error: {error}")
-        return f"❌ An unexpected error occurred: {str(error)}"
+        return f"❌ An unexpected error occurred: {short_exc(error)}"
 
 # Slash commands
 
@@ -1859,11 +2047,7 @@ async def audit_setup_command(interaction: discord.Interaction):
 async def audit_setup_error(interaction: discord.Interaction, error):
     """Handle audit setup command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to set up the audit system.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("set up the audit system")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -1891,6 +2075,7 @@ async def set_audit_log_command(interaction: discord.Interaction, channel: disco
 
         # Set the audit log channel
         bot_config.set_audit_log_channel(interaction.guild.id, channel.id)
+        status_channel_cache.pop(('audit', interaction.guild.id))
 
         embed = discord.Embed(
             title="✅ Audit Log Channel Set",
@@ -1932,7 +2117,7 @@ async def set_audit_log_command(interaction: discord.Interaction, channel: disco
 
         embed = discord.Embed(
             title="❌ Configuration Failed",
-            description=f"Failed to set audit log channel: {str(e)}",
+            description=f"Failed to set audit log channel: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -1941,11 +2126,7 @@ async def set_audit_log_command(interaction: discord.Interaction, channel: disco
 async def set_audit_log_error(interaction: discord.Interaction, error):
     """Handle set audit log command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to configure the audit log channel.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("configure the audit log channel")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -1964,19 +2145,20 @@ async def set_default_project_command(interaction: discord.Interaction, project_
     try:
         # Validate the project ID by attempting to get project info
         try:
-            project = asana_client.projects.get_project(project_id)
+            project = asana_client.projects.get_project(project_id, opt_fields='name')
         except Exception as e:
             embed = discord.Embed(
                 title="❌ Invalid Project ID",
                 description=f"Could not find project with ID `{project_id}`. Please check the ID and try again.",
                 color=discord.Color.red()
             )
-            embed.add_field(name="🔍 Error", value=str(e), inline=False)
+            embed.add_field(name="🔍 Error", value=short_exc(e), inline=False)
             await interaction.followup.send(embed=embed)
             return
 
         # Set the default project for this guild
         bot_config.set_guild_config(interaction.guild.id, 'default_project_id', project_id)
+        guild_default_project_cache.pop(interaction.guild.id)
 
         embed = discord.Embed(
             title="✅ Default Project Set",
@@ -2011,7 +2193,7 @@ async def set_default_project_command(interaction: discord.Interaction, project_
 
         embed = discord.Embed(
             title="❌ Configuration Failed",
-            description=f"Failed to set default project: {str(e)}",
+            description=f"Failed to set default project: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -2020,11 +2202,7 @@ async def set_default_project_command(interaction: discord.Interaction, project_
 async def set_default_project_error(interaction: discord.Interaction, error):
     """Handle set default project command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to set the default project.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("set the default project")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -2096,7 +2274,7 @@ async def view_error_logs_command(interaction: discord.Interaction, limit: Optio
 
         embed = discord.Embed(
             title="❌ Failed to Load Error Logs",
-            description=f"Could not retrieve error logs: {str(e)}",
+            description=f"Could not retrieve error logs: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -2105,11 +2283,7 @@ async def view_error_logs_command(interaction: discord.Interaction, limit: Optio
 async def view_error_logs_error(interaction: discord.Interaction, error):
     """Handle view error logs command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to view error logs.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("view error logs")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -2195,7 +2369,7 @@ async def test_audit_command(interaction: discord.Interaction):
 
         embed = discord.Embed(
             title="❌ Audit Test Failed",
-            description=f"Failed to test audit system: {str(e)}",
+            description=f"Failed to test audit system: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -2204,11 +2378,7 @@ async def test_audit_command(interaction: discord.Interaction):
 async def test_audit_error(interaction: discord.Interaction, error):
     """Handle test audit command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to test the audit system.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("test the audit system")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -2271,7 +2441,7 @@ async def repair_audit_command(interaction: discord.Interaction):
 
         embed = discord.Embed(
             title="❌ Repair Failed",
-            description=f"Failed to repair audit system: {str(e)}",
+            description=f"Failed to repair audit system: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -2280,11 +2450,7 @@ async def repair_audit_command(interaction: discord.Interaction):
 async def repair_audit_error(interaction: discord.Interaction, error):
     """Handle repair audit command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to repair the audit system.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("repair the audit system")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -2357,7 +2523,7 @@ async def map_user_command(interaction: discord.Interaction, discord_user: disco
 
         embed = discord.Embed(
             title="❌ Failed to Load Users",
-            description=f"An error occurred while fetching Asana users: {str(e)}\n\nPlease check your Asana credentials and try again.",
+            description=f"An error occurred while fetching Asana users: {short_exc(e)}\n\nPlease check your Asana credentials and try again.",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -2366,11 +2532,7 @@ async def map_user_command(interaction: discord.Interaction, discord_user: disco
 async def map_user_error(interaction: discord.Interaction, error):
     """Handle map user command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to map users.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("map users")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -2415,7 +2577,7 @@ async def unmap_user_command(interaction: discord.Interaction, discord_user: dis
 
         embed = discord.Embed(
             title="❌ Unmapping Failed",
-            description=f"An error occurred while removing the user mapping: {str(e)}",
+            description=f"An error occurred while removing the user mapping: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -2424,11 +2586,7 @@ async def unmap_user_command(interaction: discord.Interaction, discord_user: dis
 async def unmap_user_error(interaction: discord.Interaction, error):
     """Handle unmap user command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to unmap users.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("unmap users")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -2489,7 +2647,7 @@ async def list_mappings_command(interaction: discord.Interaction):
 
         embed = discord.Embed(
             title="❌ Failed to List Mappings",
-            description=f"An error occurred while listing user mappings: {str(e)}",
+            description=f"An error occurred while listing user mappings: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -2498,11 +2656,7 @@ async def list_mappings_command(interaction: discord.Interaction):
 async def list_mappings_error(interaction: discord.Interaction, error):
     """Handle list mappings command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to list user mappings.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("list user mappings")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -2541,6 +2695,7 @@ async def set_chat_channel_command(
             channel_name=channel.name,
             created_by=interaction.user.id
         )
+        status_channel_cache.pop(('chat', interaction.guild.id))
 
         if success:
             embed = discord.Embed(
@@ -2610,7 +2765,7 @@ async def set_chat_channel_command(
 
         embed = discord.Embed(
             title="❌ Configuration Failed",
-            description=f"Failed to set chat channel: {str(e)}",
+            description=f"Failed to set chat channel: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -2619,11 +2774,7 @@ async def set_chat_channel_command(
 async def set_chat_channel_error(interaction: discord.Interaction, error):
     """Handle set chat channel command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to set the chat channel.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("set the chat channel")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -2639,6 +2790,7 @@ async def remove_chat_channel_command(interaction: discord.Interaction):
 
     try:
         success = db_manager.remove_chat_channel(interaction.guild.id)
+        status_channel_cache.pop(('chat', interaction.guild.id))
 
         if success:
             embed = discord.Embed(
@@ -2660,7 +2812,7 @@ async def remove_chat_channel_command(interaction: discord.Interaction):
 
         embed = discord.Embed(
             title="❌ Removal Failed",
-            description=f"Failed to remove chat channel: {str(e)}",
+            description=f"Failed to remove chat channel: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -2669,11 +2821,7 @@ async def remove_chat_channel_command(interaction: discord.Interaction):
 async def remove_chat_channel_error(interaction: discord.Interaction, error):
     """Handle remove chat channel command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to remove the chat channel.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("remove the chat channel")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -2759,7 +2907,7 @@ async def set_timeclock_channel_command(interaction: discord.Interaction, channe
 
         embed = discord.Embed(
             title="❌ Channel Setup Failed",
-            description=f"An error occurred while setting the channel: {str(e)}",
+            description=f"An error occurred while setting the channel: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -2829,7 +2977,7 @@ async def remove_timeclock_channel_command(interaction: discord.Interaction):
 
         embed = discord.Embed(
             title="❌ Channel Removal Failed",
-            description=f"An error occurred while removing the channel: {str(e)}",
+            description=f"An error occurred while removing the channel: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -2838,11 +2986,7 @@ async def remove_timeclock_channel_command(interaction: discord.Interaction):
 async def remove_timeclock_channel_error(interaction: discord.Interaction, error):
     """Handle remove timeclock channel command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to remove the timeclock channel.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("remove the timeclock channel")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -2854,11 +2998,7 @@ async def remove_timeclock_channel_error(interaction: discord.Interaction, error
 async def set_timeclock_channel_error(interaction: discord.Interaction, error):
     """Handle set timeclock channel command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to set the timeclock channel.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("set the timeclock channel")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -2958,8 +3098,8 @@ async def search_tasks_command(
             search_params['completed'] = status == 'completed'
 
         # Add due date filters
+        today = datetime.now().date()
         if due_date:
-            today = datetime.now().date()
             if due_date == 'overdue':
                 search_params['due_on.before'] = str(today)
                 search_params['completed'] = False
@@ -2984,6 +3124,9 @@ async def search_tasks_command(
         # Limit results
         search_params['limit'] = limit
 
+        # Only request the fields rendered in the results embed
+        search_params['opt_fields'] = SEARCH_RESULT_OPT_FIELDS
+
         # Perform the search
         try:
             tasks = asana_client.tasks.search_tasks(search_params)
@@ -2992,7 +3135,7 @@ async def search_tasks_command(
             await error_logger.log_command_error(interaction, e, "search-tasks")
             embed = discord.Embed(
                 title="❌ Search Failed",
-                description=f"Failed to search Asana tasks: {str(e)}",
+                description=f"Failed to search Asana tasks: {short_exc(e)}",
                 color=discord.Color.red()
             )
             await interaction.followup.send(embed=embed)
@@ -3031,30 +3174,25 @@ async def search_tasks_command(
         # Add results
         if tasks_list:
             for i, task in enumerate(tasks_list[:10], 1):  # Limit to 10 in embed
-                task_info = f"**{task['name']}**\n"
-                task_info += f"ID: `{task['gid']}`\n"
+                lines = [f"**{task['name']}**", f"ID: `{task['gid']}`"]
 
                 if task.get('assignee'):
-                    task_info += f"👤 {task['assignee']['name']}\n"
+                    lines.append(f"👤 {task['assignee']['name']}")
 
                 if task.get('due_on'):
-                    due_date_obj = datetime.fromisoformat(task['due_on']).date()
-                    today = datetime.now().date()
+                    due_date_obj = date.fromisoformat(task['due_on'])
                     if due_date_obj < today:
-                        task_info += f"📅 ⚠️ {task['due_on']} (Overdue)\n"
+                        lines.append(f"📅 ⚠️ {task['due_on']} (Overdue)")
                     elif due_date_obj == today:
-                        task_info += f"📅 📍 Today ({task['due_on']})\n"
+                        lines.append(f"📅 📍 Today ({task['due_on']})")
                     else:
-                        task_info += f"📅 {task['due_on']}\n"
+                        lines.append(f"📅 {task['due_on']}")
 
-                if task.get('completed'):
-                    task_info += "✅ Completed"
-                else:
-                    task_info += "⏳ Incomplete"
+                lines.append("✅ Completed" if task.get('completed') else "⏳ Incomplete")
 
                 embed.add_field(
                     name=f"{i}. {task['name'][:50]}{'...' if len(task['name']) > 50 else ''}",
-                    value=task_info,
+                    value="\n".join(lines),
                     inline=False
                 )
 
@@ -3081,7 +3219,7 @@ async def search_tasks_command(
 
         embed = discord.Embed(
             title="❌ Search Failed",
-            description=f"An error occurred while searching: {str(e)}",
+            description=f"An error occurred while searching: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -3148,7 +3286,8 @@ async def save_search_command(
 
         # Check if search name already exists
         existing_searches = db_manager.get_saved_searches(interaction.guild.id)
-        if any(s['name'].lower() == name.lower() for s in existing_searches):
+        existing_names = {s['name'].lower() for s in existing_searches}
+        if name.lower() in existing_names:
             embed = discord.Embed(
                 title="❌ Search Name Already Exists",
                 description=f"A saved search with the name '{name}' already exists. Please choose a different name.",
@@ -3189,6 +3328,7 @@ async def save_search_command(
             guild_id=interaction.guild.id,
             name=name,
             created_by=interaction.user.id,
+            assignee_name=assignee.display_name if assignee else None,
             **search_params
         )
 
@@ -3263,7 +3403,7 @@ async def save_search_command(
 
         embed = discord.Embed(
             title="❌ Save Failed",
-            description=f"An error occurred while saving the search: {str(e)}",
+            description=f"An error occurred while saving the search: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -3312,8 +3452,8 @@ async def load_search_command(interaction: discord.Interaction, search: str):
             await interaction.followup.send(embed=embed)
             return
 
-        # Update usage count
-        db_manager.update_saved_search_usage(saved_search['id'])
+        # Queue usage count update (written in the background by flush_saved_search_usage)
+        record_saved_search_usage(saved_search['id'])
 
         # Build search parameters for Asana API
         search_params = {}
@@ -3335,8 +3475,8 @@ async def load_search_command(interaction: discord.Interaction, search: str):
             search_params['completed'] = saved_search['status_filter'] == 'completed'
 
         # Add due date filters
+        today = datetime.now().date()
         if saved_search['due_date_filter']:
-            today = datetime.now().date()
             if saved_search['due_date_filter'] == 'overdue':
                 search_params['due_on.before'] = str(today)
                 search_params['completed'] = False
@@ -3361,6 +3501,9 @@ async def load_search_command(interaction: discord.Interaction, search: str):
         # Limit results
         search_params['limit'] = saved_search['max_results']
 
+        # Only request the fields rendered in the results embed
+        search_params['opt_fields'] = SEARCH_RESULT_OPT_FIELDS
+
         # Perform the search
         try:
             tasks = asana_client.tasks.search_tasks(search_params)
@@ -3369,7 +3512,7 @@ async def load_search_command(interaction: discord.Interaction, search: str):
             await error_logger.log_command_error(interaction, e, "load-search")
             embed = discord.Embed(
                 title="❌ Search Failed",
-                description=f"Failed to run saved search: {str(e)}",
+                description=f"Failed to run saved search: {short_exc(e)}",
                 color=discord.Color.red()
             )
             await interaction.followup.send(embed=embed)
@@ -3390,62 +3533,42 @@ async def load_search_command(interaction: discord.Interaction, search: str):
                 inline=False
             )
 
-        # Add search criteria
-        criteria = []
-        if saved_search['search_query']:
-            criteria.append(f"Query: `{saved_search['search_query']}`")
-        if saved_search['assignee_user_id']:
-            user = interaction.guild.get_member(saved_search['assignee_user_id'])
-            if user:
-                criteria.append(f"Assignee: {user.mention}")
-        if saved_search['project_id']:
-            criteria.append(f"Project: `{saved_search['project_id']}`")
-        if saved_search['status_filter']:
-            criteria.append(f"Status: {saved_search['status_filter']}")
-        if saved_search['due_date_filter']:
-            criteria.append(f"Due: {saved_search['due_date_filter']}")
-        criteria.append(f"Sort: {saved_search['sort_by']} ({saved_search['sort_order']})")
-        criteria.append(f"Max Results: {saved_search['max_results']}")
-
-        if criteria:
-            embed.add_field(
-                name="📋 Search Criteria",
-                value="\n".join(criteria),
-                inline=False
-            )
+        # Add search criteria (pre-rendered when the search was saved)
+        criteria_summary, _ = get_saved_search_summaries(saved_search, interaction.guild)
+        embed.add_field(
+            name="📋 Search Criteria",
+            value=criteria_summary,
+            inline=False
+        )
 
         # Add results
         if tasks_list:
             for i, task in enumerate(tasks_list[:10], 1):  # Limit to 10 in embed
-                task_info = f"**{task['name']}**\n"
-                task_info += f"ID: `{task['gid']}`\n"
+                lines = [f"**{task['name']}**", f"ID: `{task['gid']}`"]
 
                 if task.get('assignee'):
-                    task_info += f"👤 {task['assignee']['name']}\n"
+                    lines.append(f"👤 {task['assignee']['name']}")
 
                 if task.get('due_on'):
-                    due_date_obj = datetime.fromisoformat(task['due_on']).date()
-                    today = datetime.now().date()
+                    due_date_obj = date.fromisoformat(task['due_on'])
                     if due_date_obj < today:
-                        task_info += f"📅 ⚠️ {task['due_on']} (Overdue)\n"
+                        lines.append(f"📅 ⚠️ {task['due_on']} (Overdue)")
                     elif due_date_obj == today:
-                        task_info += f"📅 📍 Today ({task['due_on']})\n"
+                        lines.append(f"📅 📍 Today ({task['due_on']})")
                     else:
-                        task_info += f"📅 {task['due_on']}\n"
+                        lines.append(f"📅 {task['due_on']}")
 
-                if task.get('completed'):
-                    task_info += "✅ Completed"
-                else:
-                    task_info += "⏳ Incomplete"
+                lines.append("✅ Completed" if task.get('completed') else "⏳ Incomplete")
 
                 embed.add_field(
                     name=f"{i}. {task['name'][:50]}{'...' if len(task['name']) > 50 else ''}",
-                    value=task_info,
+                    value="\n".join(lines),
                     inline=False
                 )
 
             if len(tasks_list) > 10:
-                embed.set_footer(text=f"Showing first 10 of {len(tasks_list)} results • Used {saved_search['usage_count'] + 1} times")
+                usage_count = saved_search['usage_count'] + pending_search_usage.get(saved_search['id'], 0)
+                embed.set_footer(text=f"Showing first 10 of {len(tasks_list)} results • Used {usage_count} times")
 
         else:
             embed.add_field(
@@ -3461,7 +3584,7 @@ async def load_search_command(interaction: discord.Interaction, search: str):
 
         embed = discord.Embed(
             title="❌ Search Failed",
-            description=f"An error occurred while running the search: {str(e)}",
+            description=f"An error occurred while running the search: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -3496,34 +3619,27 @@ async def list_searches_command(interaction: discord.Interaction):
             color=discord.Color.blue()
         )
 
+        # Resolve every referenced assignee once, up front, for rows that still need their summaries rendered
+        assignee_ids = {
+            s['assignee_user_id'] for s in saved_searches[:10]
+            if s['assignee_user_id'] and s['criteria_summary_short'] is None
+        }
+        assignee_names = resolve_member_names(interaction.guild, assignee_ids)
+
         for i, search in enumerate(saved_searches[:10], 1):  # Limit to 10 searches in embed
-            search_info = f"**{search['name']}**"
+            lines = [f"**{search['name']}**"]
             if search['description']:
-                search_info += f"\n{search['description'][:100]}{'...' if len(search['description']) > 100 else ''}"
+                lines.append(f"{search['description'][:100]}{'...' if len(search['description']) > 100 else ''}")
 
-            criteria = []
-            if search['search_query']:
-                criteria.append(f"Query: `{search['search_query'][:30]}{'...' if len(search['search_query']) > 30 else ''}`")
-            if search['assignee_user_id']:
-                user = interaction.guild.get_member(search['assignee_user_id'])
-                if user:
-                    criteria.append(f"Assignee: {user.display_name}")
-            if search['project_id']:
-                criteria.append(f"Project: `{search['project_id']}`")
-            if search['status_filter']:
-                criteria.append(f"Status: {search['status_filter']}")
-            if search['due_date_filter']:
-                criteria.append(f"Due: {search['due_date_filter']}")
-            if criteria:
-                search_info += f"\n{' • '.join(criteria[:2])}"
-            if len(criteria) > 2:
-                search_info += f" • +{len(criteria) - 2} more"
+            _, criteria_summary_short = get_saved_search_summaries(search, interaction.guild, assignee_names)
+            if criteria_summary_short:
+                lines.append(criteria_summary_short)
 
-            search_info += f"\n📊 Used {search['usage_count']} time{'s' if search['usage_count'] != 1 else ''}"
+            lines.append(f"📊 Used {search['usage_count']} time{'s' if search['usage_count'] != 1 else ''}")
 
             embed.add_field(
                 name=f"{i}. {search['name']}",
-                value=search_info,
+                value="\n".join(lines),
                 inline=False
             )
 
@@ -3543,7 +3659,7 @@ async def list_searches_command(interaction: discord.Interaction):
 
         embed = discord.Embed(
             title="❌ Failed to Load Searches",
-            description=f"Could not load saved searches: {str(e)}",
+            description=f"Could not load saved searches: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -3610,15 +3726,15 @@ async def delete_search_command(interaction: discord.Interaction, search: str):
             inline=False
         )
 
-        view = SearchDeletionView(search_id, target_search['name'], interaction)
-        await interaction.followup.send(embed=embed, view=view)
+        view = SearchDeletionView(search_id, target_search['name'])
+        view.message = await interaction.followup.send(embed=embed, view=view)
 
     except Exception as e:
         await error_logger.log_command_error(interaction, e, "delete-search")
 
         embed = discord.Embed(
             title="❌ Deletion Failed",
-            description=f"Failed to delete search: {str(e)}",
+            description=f"Failed to delete search: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -3656,7 +3772,7 @@ async def create_dashboard_command(
         valid_projects = []
         for project_id in project_list:
             try:
-                project_info = asana_client.projects.get_project(project_id)
+                project_info = asana_client.projects.get_project(project_id, opt_fields='name')
                 valid_projects.append({
                     'id': project_id,
                     'name': project_info['name']
@@ -3767,7 +3883,7 @@ async def create_dashboard_command(
 
         embed = discord.Embed(
             title="❌ Creation Failed",
-            description=f"An error occurred while creating the dashboard: {str(e)}",
+            description=f"An error occurred while creating the dashboard: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -3882,7 +3998,7 @@ async def view_dashboard_command(interaction: discord.Interaction, dashboard: st
                 )
 
             if 'assignee_breakdown' in target_dashboard['metrics'] and project_data['assignee_breakdown']:
-                assignee_list = "\n".join(f"• {name}: {count}" for name, count in list(project_data['assignee_breakdown'].items())[:5])
+                assignee_list = "\n".join(f"• {name}: {count}" for name, count in islice(project_data['assignee_breakdown'].items(), 5))
                 if len(project_data['assignee_breakdown']) > 5:
                     assignee_list += f"\n• ... and {len(project_data['assignee_breakdown']) - 5} more"
                 project_embed.add_field(
@@ -3933,7 +4049,7 @@ async def view_dashboard_command(interaction: discord.Interaction, dashboard: st
 
         embed = discord.Embed(
             title="❌ Dashboard Error",
-            description=f"An error occurred while loading the dashboard: {str(e)}",
+            description=f"An error occurred while loading the dashboard: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -3999,7 +4115,7 @@ async def list_dashboards_command(interaction: discord.Interaction):
 
         embed = discord.Embed(
             title="❌ Failed to Load Dashboards",
-            description=f"Could not load dashboards: {str(e)}",
+            description=f"Could not load dashboards: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -4066,15 +4182,15 @@ async def delete_dashboard_command(interaction: discord.Interaction, dashboard:
             inline=False
         )
 
-        view = DashboardDeletionView(dashboard_id, target_dashboard['name'], interaction)
-        await interaction.followup.send(embed=embed, view=view)
+        view = DashboardDeletionView(dashboard_id, target_dashboard['name'])
+        view.message = await interaction.followup.send(embed=embed, view=view)
 
     except Exception as e:
         await error_logger.log_command_error(interaction, e, "delete-dashboard")
 
         embed = discord.Embed(
             title="❌ Deletion Failed",
-            description=f"Failed to delete dashboard: {str(e)}",
+            description=f"Failed to delete dashboard: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -4221,7 +4337,7 @@ async def task_history_command(interaction: discord.Interaction, task: str, limi
 
         embed = discord.Embed(
             title="❌ History Error",
-            description=f"Could not load task history: {str(e)}",
+            description=f"Could not load task history: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -4297,7 +4413,7 @@ async def recent_changes_command(interaction: discord.Interaction, limit: Option
 
         embed = discord.Embed(
             title="❌ Error Loading Changes",
-            description=f"Could not load recent changes: {str(e)}",
+            description=f"Could not load recent changes: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -4353,7 +4469,7 @@ async def create_template_command(
         # Validate project ID if provided
         if project:
             try:
-                project_info = asana_client.projects.get_project(project)
+                project_info = asana_client.projects.get_project(project, opt_fields='name')
                 project_name = project_info['name']
             except Exception:
                 embed = discord.Embed(
@@ -4449,7 +4565,7 @@ async def create_template_command(
 
         embed = discord.Embed(
             title="❌ Template Creation Failed",
-            description=f"An error occurred while creating the template: {str(e)}",
+            description=f"An error occurred while creating the template: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -4485,24 +4601,17 @@ async def list_templates_command(interaction: discord.Interaction):
         )
 
         for i, template in enumerate(templates[:10], 1):  # Limit to 10 templates in embed
-            template_info = f"**{template['name']}**"
+            lines = [f"**{template['name']}**"]
             if template['description']:
-                template_info += f"\n{template['description'][:100]}{'...' if len(template['description']) > 100 else ''}"
-
-            template_info += f"\n📝 `{template['task_name_template']}`"
+                lines.append(f"{template['description'][:100]}{'...' if len(template['description']) > 100 else ''}")
 
-            if template['default_assignee']:
-                template_info += f"\n👤 Has default assignee"
-            if template['default_project']:
-                template_info += f"\n📁 Has default project"
-            if template['due_date_offset']:
-                template_info += f"\n📅 Due in {template['due_date_offset']} day{'s' if template['due_date_offset'] != 1 else ''}"
+            lines.append(get_task_template_summary(template))
             if template['usage_count'] > 0:
-                template_info += f"\n📊 Used {template['usage_count']} time{'s' if template['usage_count'] != 1 else ''}"
+                lines.append(f"📊 Used {template['usage_count']} time{'s' if template['usage_count'] != 1 else ''}")
 
             embed.add_field(
                 name=f"{i}. {template['name']}",
-                value=template_info,
+                value="\n".join(lines),
                 inline=False
             )
 
@@ -4522,7 +4631,7 @@ async def list_templates_command(interaction: discord.Interaction):
 
         embed = discord.Embed(
             title="❌ Failed to Load Templates",
-            description=f"Could not load task templates: {str(e)}",
+            description=f"Could not load task templates: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -4549,15 +4658,8 @@ async def use_template_command(
     await interaction.response.defer()
 
     try:
-        # Find the template by name
-        templates = db_manager.get_task_templates(interaction.guild.id)
-        template_data = None
-
-        # Try exact match first, then case-insensitive match
-        for t in templates:
-            if t['name'].lower() == template.lower():
-                template_data = t
-                break
+        # Find the template by name (case-insensitive)
+        template_data = db_manager.get_task_template_by_name(interaction.guild.id, template)
 
         if not template_data:
             embed = discord.Embed(
@@ -4567,7 +4669,9 @@ async def use_template_command(
             )
 
             # Suggest similar templates
-            similar = [t['name'] for t in templates if template.lower() in t['name'].lower()]
+            templates_by_name = db_manager.get_task_templates_by_name(interaction.guild.id)
+            template_lower = template.lower()
+            similar = [t['name'] for key, t in templates_by_name.items() if template_lower in key]
             if similar:
                 embed.add_field(
                     name="💡 Did you mean?",
@@ -4631,12 +4735,11 @@ async def use_template_command(
         if task_assignee:
             # Try to find the Discord user for display
             assignee_info = "Template default assignee"
-            for mapping in db_manager.list_user_mappings(interaction.guild.id):
-                if mapping['asana_user_id'] == task_assignee:
-                    discord_user = interaction.guild.get_member(mapping['discord_user_id'])
-                    if discord_user:
-                        assignee_info = f"{discord_user.mention}"
-                    break
+            mapping = db_manager.get_user_mapping_by_asana_id(task_assignee, interaction.guild.id)
+            if mapping:
+                discord_user = interaction.guild.get_member(mapping['discord_user_id'])
+                if discord_user:
+                    assignee_info = f"{discord_user.mention}"
             embed.add_field(name="👤 Assignee", value=assignee_info, inline=True)
 
         if task_project:
@@ -4646,7 +4749,9 @@ async def use_template_command(
             embed.add_field(name="📅 Due Date", value=task_due_date, inline=True)
 
         if task_notes:
-            embed.add_field(name="📋 Notes", value=task_notes[:500] + "..." if len(task_notes) > 500 else task_notes, inline=False)
+            notes_length = len(task_notes)
+            display_notes = (task_notes[:500] + "...") if notes_length > 500 else task_notes
+            embed.add_field(name="📋 Notes", value=display_notes, inline=False)
 
         embed.add_field(
             name="✅ Confirm Creation?",
@@ -4655,15 +4760,15 @@ async def use_template_command(
         )
 
         # Create confirmation view
-        view = TemplateTaskConfirmationView(template_data, task_name, task_assignee, task_project, task_due_date, task_notes, interaction)
-        await interaction.followup.send(embed=embed, view=view)
+        view = TemplateTaskConfirmationView(template_data, task_name, task_assignee, task_project, task_due_date, task_notes)
+        view.message = await interaction.followup.send(embed=embed, view=view)
 
     except Exception as e:
         await error_logger.log_command_error(interaction, e, "use-template")
 
         embed = discord.Embed(
             title="❌ Template Usage Failed",
-            description=f"Failed to create task from template: {str(e)}",
+            description=f"Failed to create task from template: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -4678,16 +4783,9 @@ async def delete_template_command(interaction: discord.Interaction, template: st
     await interaction.response.defer()
 
     try:
-        # Find the template by name
-        templates = db_manager.get_task_templates(interaction.guild.id, active_only=False)
-        template_data = None
-        template_id = None
-
-        for t in templates:
-            if t['name'].lower() == template.lower():
-                template_data = t
-                template_id = t['id']
-                break
+        # Find the template by name (case-insensitive)
+        template_data = db_manager.get_task_template_by_name(interaction.guild.id, template, active_only=False)
+        template_id = template_data['id'] if template_data else None
 
         if not template_data:
             embed = discord.Embed(
@@ -4718,15 +4816,15 @@ async def delete_template_command(interaction: discord.Interaction, template: st
             inline=False
         )
 
-        view = TemplateDeletionView(template_id, template_data['name'], interaction)
-        await interaction.followup.send(embed=embed, view=view)
+        view = TemplateDeletionView(template_id, template_data['name'])
+        view.message = await interaction.followup.send(embed=embed, view=view)
 
     except Exception as e:
         await error_logger.log_command_error(interaction, e, "delete-template")
 
         embed = discord.Embed(
             title="❌ Deletion Failed",
-            description=f"Failed to delete template: {str(e)}",
+            description=f"Failed to delete template: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=embed)
@@ -4735,11 +4833,7 @@ async def delete_template_command(interaction: discord.Interaction, template: st
 async def delete_template_error(interaction: discord.Interaction, error):
     """Handle delete template command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to delete task templates.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("delete task templates")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -4747,86 +4841,57 @@ async def delete_template_error(interaction: discord.Interaction, error):
     else:
         logger.error(f"Delete template error: {error}")
 
+def timeclock_channel_only(func):
+    """Reject timeclock commands outside the designated channel, then defer the response."""
+    @functools.wraps(func)
+    async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+        if not await check_timeclock_channel(interaction):
+            return
+        await interaction.response.defer()
+        return await func(interaction, *args, **kwargs)
+    return wrapper
+
 @bot.tree.command(name="clock-in", description="Clock in to start tracking work time")
+@timeclock_channel_only
 async def clock_in_command(interaction: discord.Interaction):
     """Clock in to start tracking work time."""
-    # Check if command is being used in the designated timeclock channel
-    if not check_timeclock_channel(interaction):
-        return
-
-    await interaction.response.defer()
+    now_utc = datetime.now(timezone.utc)
+    now_ts = int(now_utc.timestamp())
 
     try:
         # Check if user is already clocked in
-        active_entry = db_manager.get_active_time_entry(interaction.guild.id, interaction.user.id)
+        active_entry = await run_db(db_manager.get_active_time_entry, interaction.guild.id, interaction.user.id)
 
         if active_entry:
             # User is already clocked in
-            clock_in_time = active_entry['clock_in_time']
-            duration = datetime.utcnow() - clock_in_time.replace(tzinfo=None)
+            clock_in_ts = entry_clock_in_ts(active_entry)
 
-            embed = discord.Embed(
-                title="⚠️ Already Clocked In",
-                description="You are already clocked in for work.",
-                color=discord.Color.yellow()
-            )
-
-            embed.add_field(
-                name="🕐 Clock In Time",
-                value=f"<t:{int(clock_in_time.timestamp())}:F>",
-                inline=True
-            )
-
-            embed.add_field(
-                name="⏱️ Current Session",
-                value=format_duration(int(duration.total_seconds())),
-                inline=True
-            )
-
-            embed.add_field(
-                name="💡 To Clock Out",
-                value="Use `/clock-out` with your time proof link",
-                inline=False
-            )
+            embed = already_clocked_in_embed(clock_in_ts, format_duration(now_ts - clock_in_ts))
 
             await interaction.followup.send(embed=embed)
             return
 
         # Clock in the user
-        entry_id = db_manager.create_time_entry(
+        entry_id = await run_db(
+            db_manager.create_time_entry,
             guild_id=interaction.guild.id,
             discord_user_id=interaction.user.id,
             discord_username=str(interaction.user)
         )
 
         if entry_id:
-            embed = discord.Embed(
-                title="🕐 Successfully Clocked In!",
-                description="Your work session has started.",
-                color=discord.Color.green(),
-                timestamp=datetime.now()
-            )
-
-            embed.add_field(
-                name="👤 Employee",
-                value=interaction.user.mention,
-                inline=True
-            )
-
-            embed.add_field(
-                name="🕐 Start Time",
-                value=f"<t:{int(datetime.utcnow().timestamp())}:F>",
-                inline=True
-            )
-
-            embed.add_field(
-                name="📍 Location",
-                value=f"#{interaction.channel.name}" if hasattr(interaction.channel, 'name') else "Direct Message",
-                inline=True
+            embed = success_embed(
+                "🕐 Successfully Clocked In!",
+                "Your work session has started.",
+                (
+                    ("👤 Employee", interaction.user.mention, True),
+                    ("🕐 Start Time", f"<t:{now_ts}:F>", True),
+                    ("📍 Location", f"#{interaction.channel.name}" if hasattr(interaction.channel, 'name') else "Direct Message", True),
+                ),
+                timestamp=now_utc,
+                footer="Use /clock-out when finished to log your time"
             )
 
-            embed.set_footer(text="Use /clock-out when finished to log your time")
-
             await interaction.followup.send(embed=embed)
 
             # Log the clock in event
@@ -4837,25 +4902,17 @@ async def clock_in_command(interaction: discord.Interaction):
                 "INFO"
             )
 
-            # Create Asana task for time tracking
-            await create_timeclock_asana_task(interaction, entry_id, "clock_in")
+            # Create Asana task for time tracking without holding up the command
+            spawn_background_task(create_timeclock_asana_task(interaction, entry_id, "clock_in"))
 
         else:
-            embed = discord.Embed(
-                title="❌ Clock In Failed",
-                description="Failed to clock you in. Please try again.",
-                color=discord.Color.red()
-            )
+            embed = error_embed("❌ Clock In Failed", "Failed to clock you in. Please try again.")
             await interaction.followup.send(embed=embed)
 
     except Exception as e:
         await error_logger.log_command_error(interaction, e, "clock-in")
 
-        embed = discord.Embed(
-            title="❌ Clock In Failed",
-            description=f"An error occurred while clocking in: {str(e)}",
-            color=discord.Color.red()
-        )
+        embed = error_embed("❌ Clock In Failed", f"An error occurred while clocking in: {short_exc(e)}")
         await interaction.followup.send(embed=embed)
 
 @bot.tree.command(name="clock-out", description="Clock out and provide time proof link")
@@ -4863,48 +4920,40 @@ async def clock_in_command(interaction: discord.Interaction):
     time_proof_link="Link to your work proof (Google Sheets, screenshots, etc.)",
     notes="Optional notes about your work session"
 )
+@timeclock_channel_only
 async def clock_out_command(
     interaction: discord.Interaction,
     time_proof_link: str,
     notes: Optional[str] = None
 ):
     """Clock out with time proof link."""
-    # Check if command is being used in the designated timeclock channel
-    if not check_timeclock_channel(interaction):
-        return
-
-    await interaction.response.defer()
+    now_utc = datetime.now(timezone.utc)
 
     try:
         # Check if user is clocked in
-        active_entry = db_manager.get_active_time_entry(interaction.guild.id, interaction.user.id)
+        active_entry = await run_db(db_manager.get_active_time_entry, interaction.guild.id, interaction.user.id)
 
         if not active_entry:
-            embed = discord.Embed(
-                title="❌ Not Clocked In",
-                description="You are not currently clocked in. Use `/clock-in` to start your work session.",
-                color=discord.Color.red()
+            embed = error_embed(
+                "❌ Not Clocked In",
+                "You are not currently clocked in. Use `/clock-in` to start your work session."
             )
             await interaction.followup.send(embed=embed)
             return
 
         # Validate time proof link
-        if not time_proof_link.startswith(('http://', 'https://')):
-            embed = discord.Embed(
-                title="❌ Invalid Time Proof Link",
-                description="Please provide a valid URL for your time proof (must start with http:// or https://).",
-                color=discord.Color.red()
-            )
-            embed.add_field(
-                name="💡 Examples",
-                value="• Google Sheets: `https://docs.google.com/spreadsheets/...`\n• Screenshots: `https://imgur.com/...`\n• Documents: `https://drive.google.com/...`",
-                inline=False
+        if not URL_RE.match(time_proof_link):
+            embed = error_embed(
+                "❌ Invalid Time Proof Link",
+                "Please provide a valid URL for your time proof (must start with http:// or https://).",
+                (("💡 Examples", "• Google Sheets: `https://docs.google.com/spreadsheets/...`\n• Screenshots: `https://imgur.com/...`\n• Documents: `https://drive.google.com/...`", False),)
             )
             await interaction.followup.send(embed=embed)
             return
 
         # Clock out the user
-        success = db_manager.clock_out_time_entry(
+        success = await run_db(
+            db_manager.clock_out_time_entry,
             entry_id=active_entry['id'],
             time_proof_link=time_proof_link,
             notes=notes
@@ -4912,56 +4961,31 @@ async def clock_out_command(
 
         if success:
             # Get the completed entry to show duration
-            completed_entries = db_manager.get_user_time_entries(interaction.guild.id, interaction.user.id, limit=1)
+            completed_entries = await run_db(db_manager.get_user_time_entries, interaction.guild.id, interaction.user.id, limit=1)
             if completed_entries:
                 entry = completed_entries[0]
                 duration = format_duration(entry['duration_seconds'])
 
-                embed = discord.Embed(
-                    title="🕐 Successfully Clocked Out!",
-                    description="Your work session has ended.",
-                    color=discord.Color.blue(),
-                    timestamp=datetime.now()
-                )
-
-                embed.add_field(
-                    name="👤 Employee",
-                    value=interaction.user.mention,
-                    inline=True
-                )
-
-                embed.add_field(
-                    name="⏱️ Session Duration",
-                    value=duration,
-                    inline=True
-                )
-
-                embed.add_field(
-                    name="🕐 Clock In",
-                    value=f"<t:{int(entry['clock_in_time'].timestamp())}:t>",
-                    inline=True
-                )
-
-                embed.add_field(
-                    name="🕐 Clock Out",
-                    value=f"<t:{int(entry['clock_out_time'].timestamp())}:t>",
-                    inline=True
-                )
-
-                embed.add_field(
-                    name="🔗 Time Proof",
-                    value=f"[View Proof]({time_proof_link})",
-                    inline=False
-                )
-
+                fields = [
+                    ("👤 Employee", interaction.user.mention, True),
+                    ("⏱️ Session Duration", duration, True),
+                    ("🕐 Clock In", f"<t:{entry_clock_in_ts(entry)}:t>", True),
+                    ("🕐 Clock Out", f"<t:{int(as_utc(entry['clock_out_time']).timestamp())}:t>", True),
+                    ("🔗 Time Proof", f"[View Proof]({time_proof_link})", False)
+                ]
                 if notes:
-                    embed.add_field(
-                        name="📝 Notes",
-                        value=notes,
-                        inline=False
-                    )
-
-                embed.set_footer(text=f"Entry ID: {entry['id']} • Have a great day!")
+                    # Embed field values are capped at 1024 characters
+                    display_notes = (notes[:1021] + "...") if len(notes) > 1024 else notes
+                    fields.append(("📝 Notes", display_notes, False))
+
+                embed = success_embed(
+                    "🕐 Successfully Clocked Out!",
+                    "Your work session has ended.",
+                    fields,
+                    color=INFO_COLOR,
+                    timestamp=now_utc,
+                    footer=f"Entry ID: {entry['id']} • Have a great day!"
+                )
 
                 await interaction.followup.send(embed=embed)
 
@@ -4973,58 +4997,46 @@ async def clock_out_command(
                     "INFO"
                 )
 
-                # Update Asana task with clock out info
-                await create_timeclock_asana_task(interaction, active_entry['id'], "clock_out", time_proof_link, notes)
+                # Update Asana task with clock out info without holding up the command
+                spawn_background_task(create_timeclock_asana_task(interaction, active_entry['id'], "clock_out", time_proof_link, notes))
 
             else:
                 # Fallback success message
-                embed = discord.Embed(
-                    title="🕐 Successfully Clocked Out!",
-                    description="Your work session has ended and time proof has been logged.",
-                    color=discord.Color.green()
-                )
-                embed.add_field(
-                    name="🔗 Time Proof",
-                    value=f"[View Proof]({time_proof_link})",
-                    inline=False
+                embed = success_embed(
+                    "🕐 Successfully Clocked Out!",
+                    "Your work session has ended and time proof has been logged.",
+                    (("🔗 Time Proof", f"[View Proof]({time_proof_link})", False),)
                 )
                 await interaction.followup.send(embed=embed)
 
         else:
-            embed = discord.Embed(
-                title="❌ Clock Out Failed",
-                description="Failed to clock you out. Please try again.",
-                color=discord.Color.red()
-            )
+            embed = error_embed("❌ Clock Out Failed", "Failed to clock you out. Please try again.")
             await interaction.followup.send(embed=embed)
 
     except Exception as e:
         await error_logger.log_command_error(interaction, e, "clock-out")
 
-        embed = discord.Embed(
-            title="❌ Clock Out Failed",
-            description=f"An error occurred while clocking out: {str(e)}",
-            color=discord.Color.red()
-        )
+        embed = error_embed("❌ Clock Out Failed", f"An error occurred while clocking out: {short_exc(e)}")
         await interaction.followup.send(embed=embed)
 
 @bot.tree.command(name="time-status", description="Check your current time tracking status")
+@timeclock_channel_only
 async def time_status_command(interaction: discord.Interaction):
     """Check current time tracking status."""
-    # Check if command is being used in the designated timeclock channel
-    if not check_timeclock_channel(interaction):
-        return
-
-    await interaction.response.defer()
+    now_ts = int(datetime.now(timezone.utc).timestamp())
 
     try:
-        # Check if user is currently clocked in
-        active_entry = db_manager.get_active_time_entry(interaction.guild.id, interaction.user.id)
+        # Check if user is currently clocked in, loading today's total and recent sessions alongside
+        guild_id, user_id = interaction.guild.id, interaction.user.id
+        active_entry, today_total, recent_entries = await asyncio.gather(
+            run_db(db_manager.get_active_time_entry, guild_id, user_id),
+            get_today_total_time(guild_id, user_id),
+            run_db(db_manager.get_user_time_entries, guild_id, user_id, 3)
+        )
 
         if active_entry:
             # User is clocked in
-            clock_in_time = active_entry['clock_in_time']
-            current_duration = datetime.utcnow() - clock_in_time.replace(tzinfo=None)
+            clock_in_ts = entry_clock_in_ts(active_entry)
 
             embed = discord.Embed(
                 title="🕐 Currently Clocked In",
@@ -5034,19 +5046,19 @@ async def time_status_command(interaction: discord.Interaction):
 
             embed.add_field(
                 name="🕐 Clock In Time",
-                value=f"<t:{int(clock_in_time.timestamp())}:F>",
+                value=f"<t:{clock_in_ts}:F>",
                 inline=True
             )
 
             embed.add_field(
                 name="⏱️ Current Session",
-                value=format_duration(int(current_duration.total_seconds())),
+                value=format_duration(now_ts - clock_in_ts),
                 inline=True
             )
 
             embed.add_field(
                 name="📊 Today's Total",
-                value=await get_today_total_time(interaction.guild.id, interaction.user.id),
+                value=today_total,
                 inline=True
             )
 
@@ -5058,8 +5070,6 @@ async def time_status_command(interaction: discord.Interaction):
 
         else:
             # User is not clocked in - show recent sessions
-            recent_entries = db_manager.get_user_time_entries(interaction.guild.id, interaction.user.id, limit=3)
-
             embed = discord.Embed(
                 title="🕐 Not Currently Clocked In",
                 description="Use `/clock-in` to start tracking time.",
@@ -5068,7 +5078,7 @@ async def time_status_command(interaction: discord.Interaction):
 
             embed.add_field(
                 name="📊 Today's Total",
-                value=await get_today_total_time(interaction.guild.id, interaction.user.id),
+                value=today_total,
                 inline=True
             )
 
@@ -5087,24 +5097,16 @@ async def time_status_command(interaction: discord.Interaction):
     except Exception as e:
         await error_logger.log_command_error(interaction, e, "time-status")
 
-        embed = discord.Embed(
-            title="❌ Status Check Failed",
-            description=f"Could not check your time status: {str(e)}",
-            color=discord.Color.red()
-        )
+        embed = error_embed("❌ Status Check Failed", f"Could not check your time status: {short_exc(e)}")
         await interaction.followup.send(embed=embed)
 
 @bot.tree.command(name="time-history", description="View your recent time tracking history")
 @app_commands.describe(
     limit="Number of recent entries to show (default: 5, max: 10)"
 )
+@timeclock_channel_only
 async def time_history_command(interaction: discord.Interaction, limit: Optional[int] = 5):
     """View recent time tracking history."""
-    # Check if command is being used in the designated timeclock channel
-    if not check_timeclock_channel(interaction):
-        return
-
-    await interaction.response.defer()
 
     try:
         if limit > 10:
@@ -5112,7 +5114,9 @@ async def time_history_command(interaction: discord.Interaction, limit: Optional
         elif limit < 1:
             limit = 1
 
-        entries = db_manager.get_user_time_entries(interaction.guild.id, interaction.user.id, limit=limit)
+        entries, total_time, completed_count = await run_db(
+            db_manager.get_history_with_summary, interaction.guild.id, interaction.user.id, limit=limit
+        )
 
         if not entries:
             embed = discord.Embed(
@@ -5123,34 +5127,34 @@ async def time_history_command(interaction: discord.Interaction, limit: Optional
             await interaction.followup.send(embed=embed)
             return
 
+        entry_count = len(entries)
         embed = discord.Embed(
             title="📊 Time Tracking History",
-            description=f"Your last {len(entries)} time entr{'y' if len(entries) == 1 else 'ies'}",
+            description=f"Your last {entry_count} time entr{'y' if entry_count == 1 else 'ies'}",
             color=discord.Color.blue()
         )
 
-        total_time = 0
         for entry in entries:
             if entry['status'] == 'completed' and entry['duration_seconds']:
-                total_time += entry['duration_seconds']
-
-                entry_info = f"🕐 <t:{int(entry['clock_in_time'].timestamp())}:D>\n"
-                entry_info += f"⏱️ {format_duration(entry['duration_seconds'])}\n"
+                lines = [
+                    f"🕐 <t:{entry_clock_in_ts(entry)}:D>",
+                    f"⏱️ {format_duration(entry['duration_seconds'])}"
+                ]
                 if entry['time_proof_link']:
-                    entry_info += f"🔗 [Proof]({entry['time_proof_link']})"
+                    lines.append(f"🔗 [Proof]({entry['time_proof_link']})")
 
                 embed.add_field(
                     name=f"Session #{entry['id']}",
-                    value=entry_info,
+                    value="\n".join(lines),
                     inline=True
                 )
 
         # Add summary
         embed.add_field(
             name="📈 Summary",
-            value=f"**Total Sessions:** {len([e for e in entries if e['status'] == 'completed'])}\n"
+            value=f"**Total Sessions:** {completed_count}\n"
                   f"**Total Time:** {format_duration(total_time)}\n"
-                  f"**Average Session:** {format_duration(total_time // max(1, len([e for e in entries if e['status'] == 'completed'])))}",
+                  f"**Average Session:** {format_duration(total_time // max(1, completed_count))}",
             inline=False
         )
 
@@ -5161,11 +5165,7 @@ async def time_history_command(interaction: discord.Interaction, limit: Optional
     except Exception as e:
         await error_logger.log_command_error(interaction, e, "time-history")
 
-        embed = discord.Embed(
-            title="❌ History Check Failed",
-            description=f"Could not load your time history: {str(e)}",
-            color=discord.Color.red()
-        )
+        embed = error_embed("❌ History Check Failed", f"Could not load your time history: {short_exc(e)}")
         await interaction.followup.send(embed=embed)
 
 @bot.tree.command(name="timeclock-status", description="View all currently active time clock sessions (Admin only)")
@@ -5173,28 +5173,48 @@ async def time_history_command(interaction: discord.Interaction, limit: Optional
 async def timeclock_status_command(interaction: discord.Interaction):
     """View all currently active time clock sessions."""
     await interaction.response.defer()
+    now_utc = datetime.now(timezone.utc)
+    now_ts = int(now_utc.timestamp())
 
     try:
-        active_entries = db_manager.get_all_active_entries(interaction.guild.id)
+        active_entries = await run_db(db_manager.get_all_active_entries, interaction.guild.id)
 
         embed = discord.Embed(
             title="🕐 Active Time Clock Sessions",
             description=f"Currently {len(active_entries)} user{' is' if len(active_entries) == 1 else 's are'} clocked in",
             color=discord.Color.blue(),
-            timestamp=datetime.now()
+            timestamp=now_utc
         )
 
         if active_entries:
-            for entry in active_entries[:10]:  # Limit to 10 for embed size
-                user = interaction.guild.get_member(entry['discord_user_id'])
+            shown_entries = active_entries[:10]  # Limit to 10 for embed size
+
+            # Resolve members missing from the cache with one gateway request
+            members = {}
+            missing_ids = []
+            for entry in shown_entries:
+                member = interaction.guild.get_member(entry['discord_user_id'])
+                if member:
+                    members[member.id] = member
+                else:
+                    missing_ids.append(entry['discord_user_id'])
+            if missing_ids:
+                try:
+                    fetched = await interaction.guild.query_members(user_ids=missing_ids, limit=len(missing_ids))
+                    members.update((member.id, member) for member in fetched)
+                except (asyncio.TimeoutError, discord.HTTPException) as e:
+                    logger.warning(f"Could not fetch members for timeclock status: {e}")
+
+            for entry in shown_entries:
+                user = members.get(entry['discord_user_id'])
                 username = user.display_name if user else entry['discord_username'] or f"User {entry['discord_user_id']}"
 
-                clock_in_duration = datetime.utcnow() - entry['clock_in_time'].replace(tzinfo=None)
+                clock_in_ts = entry_clock_in_ts(entry)
 
                 embed.add_field(
                     name=username,
-                    value=f"🕐 Clocked in: <t:{int(entry['clock_in_time'].timestamp())}:R>\n"
-                          f"⏱️ Duration: {format_duration(int(clock_in_duration.total_seconds()))}",
+                    value=f"🕐 Clocked in: <t:{clock_in_ts}:R>\n"
+                          f"⏱️ Duration: {format_duration(now_ts - clock_in_ts)}",
                     inline=True
                 )
 
@@ -5212,22 +5232,14 @@ async def timeclock_status_command(interaction: discord.Interaction):
     except Exception as e:
         await error_logger.log_command_error(interaction, e, "timeclock-status")
 
-        embed = discord.Embed(
-            title="❌ Status Check Failed",
-            description=f"Could not load active sessions: {str(e)}",
-            color=discord.Color.red()
-        )
+        embed = error_embed("❌ Status Check Failed", f"Could not load active sessions: {short_exc(e)}")
         await interaction.followup.send(embed=embed)
 
 @timeclock_status_command.error
 async def timeclock_status_error(interaction: discord.Interaction, error):
     """Handle timeclock status command errors."""
     if isinstance(error, discord.app_commands.errors.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Administrator Required",
-            description="You need Administrator permissions to view all active time clock sessions.",
-            color=discord.Color.red()
-        )
+        embed = admin_required_embed("view all active time clock sessions")
         if not interaction.response.is_done():
             await interaction.response.send_message(embed=embed)
         else:
@@ -5256,20 +5268,16 @@ async def bulk_select_command(
         tasks = []
         search_description = ""
 
+        user_mapping = db_manager.get_user_mapping(interaction.guild.id, interaction.user.id)
+        assignee_id = user_mapping['asana_user_id'] if user_mapping else None
+
         if search:
             # Search by name or assignee
-            user_mapping = db_manager.get_user_mapping(interaction.guild.id, interaction.user.id)
-            assignee_id = user_mapping['asana_user_id'] if user_mapping else None
-
             tasks = await asana_manager.search_tasks(search, assignee=assignee_id, limit=limit)
             search_description = f"matching '{search}'"
         else:
-            # Show recent tasks from default project or user's tasks
-            user_mapping = db_manager.get_user_mapping(interaction.guild.id, interaction.user.id)
-            assignee_id = user_mapping['asana_user_id'] if user_mapping else None
-
-            tasks = await asana_manager.list_tasks(assignee=assignee_id)
-            tasks = [task for task in tasks if not task.get('completed', False)][:limit]  # Only incomplete tasks
+            # Show recent incomplete tasks from default project or user's tasks
+            tasks = await asana_manager.list_tasks(assignee=assignee_id, incomplete_only=True, limit=limit)
             search_description = "recent incomplete tasks"
 
         if not tasks:
@@ -5299,7 +5307,7 @@ async def bulk_select_command(
 
         error_embed = discord.Embed(
             title="❌ Bulk Selection Failed",
-            description=f"Failed to search for tasks: {str(e)}",
+            description=f"Failed to search for tasks: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=error_embed)
@@ -5362,7 +5370,7 @@ async def notification_settings_command(interaction: discord.Interaction):
         )
 
         # Create settings view
-        view = NotificationSettingsView(user_prefs or {}, interaction)
+        view = NotificationSettingsView(user_prefs or {})
         await interaction.followup.send(embed=embed, view=view)
 
     except Exception as e:
@@ -5370,110 +5378,71 @@ async def notification_settings_command(interaction: discord.Interaction):
 
         error_embed = discord.Embed(
             title="❌ Failed to Load Settings",
-            description=f"Could not load your notification settings: {str(e)}",
+            description=f"Could not load your notification settings: {short_exc(e)}",
             color=discord.Color.red()
         )
         await interaction.followup.send(embed=error_embed)
 
+STATUS_PROBE_TIMEOUT = 3.0
+
+async def run_status_probe(coro) -> str:
+    """Await one /status probe, reporting a timeout if it takes longer than STATUS_PROBE_TIMEOUT."""
+    try:
+        return await asyncio.wait_for(coro, timeout=STATUS_PROBE_TIMEOUT)
+    except asyncio.TimeoutError:
+        return f"⏱️ Timed out after {STATUS_PROBE_TIMEOUT:.0f}s"
+
 @bot.tree.command(name="status", description="Check Botsana's comprehensive system status")
-async def status_command(interaction: discord.Interaction):
+@app_commands.describe(compact="Show the report as one compact block instead of separate fields")
+async def status_command(interaction: discord.Interaction, compact: bool = False):
     """Display comprehensive bot status and health information."""
     await interaction.response.defer()
 
     try:
-        embed = discord.Embed(
-            title="🤖 Botsana System Status",
-            description="Comprehensive health check and system information",
-            color=discord.Color.blue(),
-            timestamp=datetime.now()
-        )
-
-        # Bot Information
-        embed.add_field(
-            name="🤖 Bot Status",
-            value="✅ Online and responding",
-            inline=True
-        )
-
-        embed.add_field(
-            name="🏠 Guild",
-            value=f"{interaction.guild.name} ({interaction.guild.id})",
-            inline=True
+        # Run the health probes concurrently; a failing probe shows its error instead of aborting,
+        # and a stalled one shows a timeout instead of holding up the whole report
+        probe_results = await asyncio.gather(
+            run_status_probe(test_asana_connection()),
+            run_status_probe(test_database_connection()),
+            run_status_probe(get_ai_system_status()),
+            run_status_probe(get_chat_channel_status(interaction.guild.id)),
+            run_status_probe(get_audit_system_status(interaction.guild.id)),
+            run_status_probe(get_error_statistics(interaction.guild.id)),
+            run_status_probe(get_bot_statistics()),
+            return_exceptions=True
+        )
+        asana_status, db_status, ai_status, chat_channel_status, audit_status, error_stats, bot_stats = (
+            f"❌ Error: {str(result)[:30]}..." if isinstance(result, Exception) else result
+            for result in probe_results
         )
 
         # Discord Connection
         latency = round(bot.latency * 1000, 2) if bot.latency else "Unknown"
-        embed.add_field(
-            name="🌐 Discord Connection",
-            value=f"✅ Connected\n📡 Latency: {latency}ms",
-            inline=True
-        )
-
-        # Asana Connection Test
-        asana_status = await test_asana_connection()
-        embed.add_field(
-            name="📋 Asana API",
-            value=asana_status,
-            inline=True
-        )
-
-        # Database Connection Test
-        db_status = await test_database_connection()
-        embed.add_field(
-            name="🗄️ Database",
-            value=db_status,
-            inline=True
-        )
-
-        # AI System Status
-        ai_status = await get_ai_system_status()
-        embed.add_field(
-            name="🧠 AI System",
-            value=ai_status,
-            inline=True
-        )
-
-        # Chat Channel Status
-        chat_channel_status = await get_chat_channel_status(interaction.guild.id)
-        embed.add_field(
-            name="🤖 Chat Channel",
-            value=chat_channel_status,
-            inline=True
-        )
-
-        # Audit System Status
-        audit_status = await get_audit_system_status(interaction.guild.id)
-        embed.add_field(
-            name="📊 Audit System",
-            value=audit_status,
-            inline=True
-        )
-
-        # Error Statistics
-        error_stats = await get_error_statistics(interaction.guild.id)
-        embed.add_field(
-            name="🚨 Recent Errors",
-            value=error_stats,
-            inline=False
-        )
-
-        # Bot Statistics
-        bot_stats = await get_bot_statistics()
-        embed.add_field(
-            name="📈 Bot Statistics",
-            value=bot_stats,
-            inline=False
-        )
-
-        # System Information
-        system_info = get_system_info()
-        embed.add_field(
-            name="⚙️ System Info",
-            value=system_info,
-            inline=False
-        )
 
-        embed.set_footer(text="Botsana Health Check | Use /help for command list")
+        # (name, value, inline) for every section of the report
+        sections = (
+            ("🤖 Bot Status", "✅ Online and responding", True),
+            ("🏠 Guild", f"{interaction.guild.name} ({interaction.guild.id})", True),
+            ("🌐 Discord Connection", f"✅ Connected\n📡 Latency: {latency}ms", True),
+            ("📋 Asana API", asana_status, True),
+            ("🗄️ Database", db_status, True),
+            ("🧠 AI System", ai_status, True),
+            ("🤖 Chat Channel", chat_channel_status, True),
+            ("📊 Audit System", audit_status, True),
+            ("🚨 Recent Errors", error_stats, False),
+            ("📈 Bot Statistics", bot_stats, False),
+            ("⚙️ System Info", get_system_info(), False),
+        )
+
+        if compact:
+            # One description block instead of eleven fields: a much smaller payload
+            lines = [f"**{name}:** {' · '.join(value.splitlines())}" for name, value, _ in sections]
+            embed = build_embed("🤖 Botsana System Status", "\n".join(lines), INFO_COLOR,
+                                timestamp=datetime.now(), footer="Botsana Health Check | Use /help for command list")
+        else:
+            embed = build_embed("🤖 Botsana System Status", "Comprehensive health check and system information",
+                                INFO_COLOR, sections, timestamp=datetime.now(),
+                                footer="Botsana Health Check | Use /help for command list")
 
         await interaction.followup.send(embed=embed)
 
@@ -5481,7 +5450,7 @@ async def status_command(interaction: discord.Interaction):
         # Fallback status if something goes wrong
         error_embed = discord.Embed(
             title="❌ Status Check Failed",
-            description=f"Unable to perform full status check: {str(e)}",
+            description=f"Unable to perform full status check: {short_exc(e)}",
             color=discord.Color.red()
         )
 
@@ -5494,25 +5463,31 @@ async def status_command(interaction: discord.Interaction):
 
         await interaction.followup.send(embed=error_embed)
 
+@async_ttl_cache(seconds=30)
 async def test_asana_connection() -> str:
     """Test connection to Asana API."""
     try:
-        # Try to get user info to test API connection
-        user_info = asana_client.users.get_user('me')
+        # Try to get user info to test API connection (the SDK is blocking, so use a worker thread)
+        user_info = await asyncio.to_thread(asana_client.users.get_user, 'me')
         return f"✅ Connected\n👤 {user_info['name']}"
     except Exception as e:
         return f"❌ Connection Failed\n💬 {str(e)[:50]}..."
 
+@async_ttl_cache(seconds=30)
 async def test_database_connection() -> str:
     """Test database connection."""
-    try:
+    def ping():
         with db_manager.get_session() as session:
             # Simple query to test connection
-            result = session.execute(text("SELECT 1")).scalar()
-            return "✅ Connected"
+            return session.execute(text("SELECT 1")).scalar()
+
+    try:
+        await run_db(ping)
+        return "✅ Connected"
     except Exception as e:
         return f"❌ Connection Failed\n💬 {str(e)[:50]}..."
 
+@async_ttl_cache(seconds=30)
 async def get_ai_system_status() -> str:
     """Get AI system status."""
     try:
@@ -5531,14 +5506,33 @@ async def get_ai_system_status() -> str:
     except Exception as e:
         return f"❌ Error: {str(e)[:30]}..."
 
+# Resolved (channel ID, channel) per ('chat' | 'audit', guild ID) for /status;
+# the set/remove channel commands drop their entry
+status_channel_cache = TTLCache(maxsize=1_000, ttl=60)
+
+async def resolve_status_channel(kind: str, guild_id: int, load_channel_id) -> tuple:
+    """Return (channel ID, channel or None) for a configured channel, loading it at most once a minute."""
+    key = (kind, guild_id)
+    if key in status_channel_cache:
+        return status_channel_cache.get(key)
+
+    channel_id = await run_db(load_channel_id, guild_id)
+    resolved = (channel_id, bot.get_channel(channel_id) if channel_id else None)
+    status_channel_cache.set(key, resolved)
+    return resolved
+
+def load_chat_channel_id(guild_id: int) -> Optional[int]:
+    """Return the guild's chat channel ID, or None if none is configured."""
+    chat_channel_config = db_manager.get_chat_channel(guild_id)
+    return chat_channel_config['channel_id'] if chat_channel_config else None
+
 async def get_chat_channel_status(guild_id: int) -> str:
     """Get chat channel status for the guild."""
     try:
-        chat_channel_config = db_manager.get_chat_channel(guild_id)
-        if chat_channel_config:
-            chat_channel = bot.get_channel(chat_channel_config['channel_id'])
+        channel_id, chat_channel = await resolve_status_channel('chat', guild_id, load_chat_channel_id)
+        if channel_id:
             if chat_channel:
-                return f"✅ Active\n📺 {chat_channel.mention}"
+                return f"✅ Active\n📺 <#{channel_id}>"
             else:
                 return "⚠️ Channel not found"
         else:
@@ -5549,11 +5543,10 @@ async def get_chat_channel_status(guild_id: int) -> str:
 async def get_audit_system_status(guild_id: int) -> str:
     """Get audit system status for the guild."""
     try:
-        audit_channel_id = bot_config.get_audit_log_channel(guild_id)
+        audit_channel_id, audit_channel = await resolve_status_channel('audit', guild_id, bot_config.get_audit_log_channel)
         if audit_channel_id:
-            audit_channel = bot.get_channel(audit_channel_id)
             if audit_channel:
-                return f"✅ Configured\n📺 {audit_channel.mention}"
+                return f"✅ Configured\n📺 <#{audit_channel_id}>"
             else:
                 return "⚠️ Channel not found"
         else:
@@ -5563,21 +5556,25 @@ async def get_audit_system_status(guild_id: int) -> str:
 
 async def get_error_statistics(guild_id: int) -> str:
     """Get recent error statistics for the guild."""
-    try:
+    def count_recent_errors() -> int:
         with db_manager.get_session() as session:
             # Get error count from last 24 hours
             yesterday = datetime.now() - timedelta(days=1)
-            error_count = session.query(ErrorLog).filter(
+            # Plain COUNT(id) over the (guild_id, created_at) index, no subquery
+            return session.query(func.count(ErrorLog.id)).filter(
                 ErrorLog.guild_id == guild_id,
                 ErrorLog.created_at >= yesterday
-            ).count()
+            ).scalar()
 
-            if error_count == 0:
-                return "✅ No errors in last 24h"
-            elif error_count == 1:
-                return "⚠️ 1 error in last 24h"
-            else:
-                return f"⚠️ {error_count} errors in last 24h"
+    try:
+        error_count = await run_db(count_recent_errors)
+
+        if error_count == 0:
+            return "✅ No errors in last 24h"
+        elif error_count == 1:
+            return "⚠️ 1 error in last 24h"
+        else:
+            return f"⚠️ {error_count} errors in last 24h"
     except Exception as e:
         return f"❌ Unable to check: {str(e)[:30]}..."
 
@@ -5585,23 +5582,108 @@ async def get_bot_statistics() -> str:
     """Get general bot statistics."""
     try:
         guild_count = len(bot.guilds)
-        user_count = sum(len(guild.members) for guild in bot.guilds)
+        user_count = sum(guild.member_count or 0 for guild in bot.guilds)
 
         return f"🏠 {guild_count} servers\n👥 {user_count} users"
     except Exception as e:
         return f"❌ Unable to get stats: {str(e)[:30]}..."
 
+# Neither version changes while the bot runs
+SYSTEM_INFO_STR = f"🐍 Python {platform.python_version()}\n⚡ discord.py {discord.__version__}"
+
 def get_system_info() -> str:
     """Get system information."""
-    try:
-        import platform
-        python_version = platform.python_version()
-
-        return f"🐍 Python {python_version}\n⚡ discord.py {discord.__version__}"
-    except Exception:
-        return "ℹ️ System info unavailable"
+    return SYSTEM_INFO_STR
 
 # xAI/Grok API Integration
+GROK_MODEL = "grok-4-fast-reasoning"
+
+# Parsed Grok output for recently seen requests, keyed by a hash of everything in the prompt
+grok_parse_cache = TTLCache(maxsize=512, ttl=300)
+
+# Members who spoke recently, per guild (user ID -> (last seen, name)); these are
+# the likely assignees, so only they go into the Grok prompt
+RECENT_SPEAKER_LIMIT = 50
+RECENT_SPEAKER_WINDOW = 24 * 60 * 60
+recent_speakers: Dict[int, OrderedDict] = {}
+
+def note_recent_speaker(guild_id: int, member: discord.abc.User):
+    """Record that a member just sent a message in a guild."""
+    speakers = recent_speakers.setdefault(guild_id, OrderedDict())
+    speakers.pop(member.id, None)
+    speakers[member.id] = (time.monotonic(), member.display_name)
+    if len(speakers) > RECENT_SPEAKER_LIMIT:
+        speakers.popitem(last=False)
+
+def get_recent_speakers(guild_id: int) -> List[tuple]:
+    """Return (user ID, name) for members who spoke in the last 24 hours, newest first."""
+    speakers = recent_speakers.get(guild_id)
+    if not speakers:
+        return []
+    cutoff = time.monotonic() - RECENT_SPEAKER_WINDOW
+    return [(user_id, name) for user_id, (seen, name) in reversed(speakers.items()) if seen >= cutoff]
+
+class TokenBucket:
+    """Paces API calls against both a requests-per-minute and a tokens-per-minute limit."""
+
+    def __init__(self, rpm: int, tpm: int):
+        # A zero or negative limit would divide by zero or spin in acquire()
+        if rpm < 1 or tpm < 1:
+            logger.warning(f"Invalid rate limits (rpm={rpm}, tpm={tpm}); using at least 1 per minute")
+        self.rpm = max(1, rpm)
+        self.tpm = max(1, tpm)
+        self._requests = float(self.rpm)
+        self._tokens = float(self.tpm)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    async def acquire(self, estimated_tokens: int):
+        """Wait until one request and estimated_tokens tokens are available, then take them."""
+        estimated_tokens = min(estimated_tokens, self.tpm)
+        # The lock keeps waiters in arrival order
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self._blocked_until - time.monotonic()
+                if wait <= 0:
+                    if self._requests >= 1 and self._tokens >= estimated_tokens:
+                        self._requests -= 1
+                        self._tokens -= estimated_tokens
+                        return
+                    wait = max((1 - self._requests) * 60 / self.rpm,
+                               (estimated_tokens - self._tokens) * 60 / self.tpm)
+                await asyncio.sleep(wait)
+
+    def back_off(self, seconds: float):
+        """Empty the request bucket and hold every caller for the given number of seconds."""
+        self._requests = 0.0
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+GROK_MAX_TOKENS = 500
+grok_bucket = TokenBucket(
+    rpm=int(os.getenv('GROK_REQUESTS_PER_MINUTE', '60')),
+    tpm=int(os.getenv('GROK_TOKENS_PER_MINUTE', '100000'))
+)
+
+# One keep-alive client for every Grok call, so requests reuse the TCP/TLS connection to api.x.ai
+grok_client = httpx.AsyncClient(
+    base_url="https://api.x.ai",
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60),
+    headers={
+        "Authorization": f"Bearer {XAI_API_KEY}",
+        "Content-Type": "application/json"
+    }
+)
+
 async def call_grok_api(prompt: str, user_context: str = "") -> Optional[str]:
     """Call Grok API for natural language processing."""
     if not XAI_API_KEY:
@@ -5609,105 +5691,133 @@ async def call_grok_api(prompt: str, user_context: str = "") -> Optional[str]:
         return None
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://api.x.ai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {XAI_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "grok-4-fast-reasoning",
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are an expert at parsing natural language requests to create Asana tasks. Extract task information and return it in a specific JSON format. Be precise and only extract what's clearly stated."
-                        },
-                        {
-                            "role": "user",
-                            "content": f"{user_context}\n\nParse this task request: {prompt}"
-                        }
-                    ],
-                    "temperature": 0.1,  # Low temperature for consistent parsing
-                    "max_tokens": 500
-                }
-            )
+        # Rough estimate: ~4 characters per prompt token, plus the completion budget
+        await grok_bucket.acquire(GROK_MAX_TOKENS + (len(prompt) + len(user_context)) // 4)
+
+        response = await grok_client.post(
+            "/v1/chat/completions",
+            json={
+                "model": GROK_MODEL,
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": "Parse Discord requests into Asana task JSON. Reply with the JSON object only; extract only what is clearly stated."
+                    },
+                    {
+                        "role": "user",
+                        "content": f"{user_context}\n{prompt}" if user_context else prompt
+                    }
+                ],
+                "temperature": 0.1,  # Low temperature for consistent parsing
+                "max_tokens": GROK_MAX_TOKENS,
+                # Have Grok return a bare JSON object so it can be loaded as-is
+                "response_format": {"type": "json_object"}
+            }
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                content = data['choices'][0]['message']['content']
-                logger.info(f"Grok API response: {content}")
-                return content
-            else:
-                logger.error(f"Grok API error: {response.status_code} - {response.text}")
-                return None
+        if response.status_code == 200:
+            data = response.json()
+            content = data['choices'][0]['message']['content']
+            logger.info(f"Grok API response: {content}")
+            return content
+        elif response.status_code == 429:
+            # Rate limited: hold later calls back instead of retrying into the limit
+            try:
+                retry_after = float(response.headers.get('retry-after', 5))
+            except ValueError:
+                retry_after = 5.0
+            grok_bucket.back_off(retry_after)
+            logger.warning(f"Grok API rate limited, backing off for {retry_after:.0f}s")
+            return None
+        else:
+            logger.error(f"Grok API error: {response.status_code} - {response.text}")
+            return None
 
     except Exception as e:
         logger.error(f"Error calling Grok API: {e}")
         return None
 
+async def assign_parsed_task(parsed_task: Dict[str, Any], interaction: discord.Interaction,
+                             discord_user_id: Optional[int]):
+    """Fill in a parsed task's assignee: the named Discord user, or the requester when nobody was named."""
+    # Kept so a cached parse can be re-assigned for a different requester
+    parsed_task['assignee_discord_id'] = discord_user_id
+
+    # One query covers both the named user and the requester
+    candidate_ids = [interaction.user.id] if discord_user_id is None else [discord_user_id, interaction.user.id]
+    mappings = await run_db(db_manager.get_user_mappings_bulk, interaction.guild.id, candidate_ids)
+
+    if discord_user_id is not None:
+        discord_user = interaction.guild.get_member(discord_user_id)
+
+        if discord_user:
+            user_mapping = mappings.get(discord_user_id)
+            if user_mapping:
+                parsed_task['assignee'] = user_mapping['asana_user_id']
+                parsed_task['assignee_info'] = f"{discord_user.mention} → Asana user `{user_mapping['asana_user_name'] or user_mapping['asana_user_id']}`"
+            else:
+                parsed_task['assignee_info'] = f"⚠️ {discord_user.mention} (not mapped to Asana user)"
+    else:
+        # Auto-assign to current user if they have a mapping
+        user_mapping = mappings.get(interaction.user.id)
+        if user_mapping:
+            parsed_task['assignee'] = user_mapping['asana_user_id']
+            parsed_task['assignee_info'] = f"Auto-assigned to {interaction.user.mention} → Asana user `{user_mapping['asana_user_name'] or user_mapping['asana_user_id']}`"
+
 async def parse_task_with_grok(message: str, interaction: discord.Interaction) -> Optional[Dict[str, Any]]:
     """Parse task using Grok AI instead of regex."""
     try:
-        # Create context about available Discord users for assignment
-        user_context = "Available Discord users for assignment:"
+        # Candidate assignees as one "users: id=name,..." line: recent speakers,
+        # or the first cached members when nobody has spoken lately
+        user_context = ""
+        users = []
         if interaction.guild:
-            members = interaction.guild.members[:50]  # Limit to avoid token limits
-            for member in members:
-                user_context += f"\n- {member.display_name} (@{member.name}) - ID: {member.id}"
-
-        # Create detailed prompt for Grok
-        prompt = f"""
-Parse this natural language task request into structured Asana task data.
-
-Return ONLY a valid JSON object with this exact format:
-{{
-    "task_name": "string - the main task description/title",
-    "due_date": "YYYY-MM-DD format or null if no date mentioned",
-    "assignee_discord_id": "number - Discord user ID for assignment, or null",
-    "assignee_name": "string - Discord username if assigned, or null",
-    "project_name": "string - project name if mentioned, or null",
-    "notes": "string - additional notes/description, or null",
-    "confidence": "high|medium|low - how confident you are in this parsing"
-}}
-
-Rules:
-- task_name should be concise but descriptive
-- due_date should be in YYYY-MM-DD format, use today's date if "today", tomorrow for "tomorrow", etc.
-- assignee_discord_id should be the Discord user ID number from the available users list
-- If no assignee mentioned, set assignee fields to null
-- If no project mentioned, set project_name to null
-- If no notes/details beyond task name, set notes to null
-- Be conservative - only extract what's clearly stated
-
-Task request: "{message}"
-"""
-
-        ai_response = await call_grok_api(prompt, user_context)
+            users = get_recent_speakers(interaction.guild.id)
+            if not users:
+                # Guild.members copies the whole member cache into a list; read the
+                # first 50 straight from the underlying dict instead
+                users = [(member.id, member.display_name)
+                         for member in islice(interaction.guild._members.values(), 50)]
+            if users:
+                user_context = "users: " + ",".join(f"{user_id}={name.replace(',', ' ')}" for user_id, name in users)
+
+        today = date.today().isoformat()
+        member_ids = ",".join(str(user_id) for user_id in sorted(user_id for user_id, _ in users))
+        cache_key = hashlib.sha256(f"{GROK_MODEL}|{today}|{message}|{member_ids}".encode()).hexdigest()
+        parsed_data = grok_parse_cache.get(cache_key)
+        cache_hit = parsed_data is not None
+
+        if not cache_hit:
+            # Terse schema; the date lets Grok resolve "tomorrow", "friday", etc.
+            prompt = (
+                f"today: {today}\n"
+                "schema: {task_name:str, due_date:YYYY-MM-DD|null, assignee_discord_id:int from users|null, "
+                "assignee_name:str|null, project_name:str|null, notes:str|null, confidence:high|medium|low}\n"
+                f"request: {message}"
+            )
+
+            ai_response = await call_grok_api(prompt, user_context)
+
+            if not ai_response:
+                return None
 
-        if not ai_response:
-            return None
+            # JSON mode guarantees a bare object, so no need to hunt for the braces
+            try:
+                parsed_data = json.loads(ai_response)
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse Grok JSON response: {ai_response} - Error: {e}")
+                return None
 
-        # Try to parse the JSON response
-        try:
-            # Clean up the response - sometimes AI adds extra text
-            json_start = ai_response.find('{')
-            json_end = ai_response.rfind('}') + 1
-            if json_start != -1 and json_end > json_start:
-                json_str = ai_response[json_start:json_end]
-                parsed_data = json.loads(json_str)
-            else:
+            if not isinstance(parsed_data, dict):
                 logger.error(f"Could not find JSON in Grok response: {ai_response}")
                 return None
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Grok JSON response: {ai_response} - Error: {e}")
-            return None
+            # Validate the parsed data
+            if not parsed_data.get('task_name'):
+                logger.warning("Grok did not extract a task name")
+                return None
 
-        # Validate the parsed data
-        if not parsed_data.get('task_name'):
-            logger.warning("Grok did not extract a task name")
-            return None
+            grok_parse_cache.set(cache_key, parsed_data)
 
         # Convert to our internal format
         parsed_task = {
@@ -5719,29 +5829,23 @@ Task request: "{message}"
             'project_id': None,
             'project_info': parsed_data.get('project_name', 'Default project') if parsed_data.get('project_name') else 'Default project',
             'interpreted_as': message,
-            'confidence': parsed_data.get('confidence', 'medium')
+            'confidence': parsed_data.get('confidence', 'medium'),
+            'cache_hit': cache_hit
         }
 
-        # Handle assignee
-        if parsed_data.get('assignee_discord_id'):
-            discord_user_id = parsed_data['assignee_discord_id']
-            discord_user = interaction.guild.get_member(discord_user_id) if interaction.guild else None
-
-            if discord_user:
-                user_mapping = db_manager.get_user_mapping(interaction.guild.id, discord_user_id)
-                if user_mapping:
-                    parsed_task['assignee'] = user_mapping['asana_user_id']
-                    parsed_task['assignee_info'] = f"{discord_user.mention} → Asana user `{user_mapping['asana_user_name'] or user_mapping['asana_user_id']}`"
-                else:
-                    parsed_task['assignee_info'] = f"⚠️ {discord_user.mention} (not mapped to Asana user)"
+        # Handle assignee; an explicit mention in the message beats whatever Grok inferred
+        mention_match = MENTION_RE.search(message)
+        discord_user_id = None
+        if mention_match:
+            discord_user_id = int(mention_match.group(1))
         else:
-            # Auto-assign to current user if they have a mapping
-            user_mapping = db_manager.get_user_mapping(interaction.guild.id, interaction.user.id)
-            if user_mapping:
-                parsed_task['assignee'] = user_mapping['asana_user_id']
-                parsed_task['assignee_info'] = f"Auto-assigned to {interaction.user.mention} → Asana user `{user_mapping['asana_user_name'] or user_mapping['asana_user_id']}`"
+            # Grok sometimes returns a name here; anything that isn't an ID means no assignee
+            grok_assignee = str(parsed_data.get('assignee_discord_id') or '').strip()
+            if grok_assignee.isdigit():
+                discord_user_id = int(grok_assignee)
+        await assign_parsed_task(parsed_task, interaction, discord_user_id)
 
-        logger.info(f"Successfully parsed task with Grok: {parsed_task['name']} (confidence: {parsed_task.get('confidence', 'unknown')})")
+        logger.info(f"Successfully parsed task with Grok: {parsed_task['name']} (confidence: {parsed_task.get('confidence', 'unknown')}, cache hit: {cache_hit})")
         return parsed_task
 
     except Exception as e:
@@ -5749,22 +5853,99 @@ Task request: "{message}"
         return None
 
 # Natural Language Processing Functions (Fallback to regex if AI fails)
+
+# Regex fallback patterns, compiled once at import
+# Task-name patterns fused into one alternation. Each alternative (except the last)
+# carries a lazy prefix so the first pattern that matches anywhere wins, exactly as
+# trying them one by one with re.search would; match.lastgroup names the winner.
+TASK_NAME_RE = re.compile(
+    r'\A(?:'
+    # "Create a task to [task description]"
+    r'(?s:.*?)create\s+a\s+task\s+to\s+(?P<create>.+?)(?:\s+(?:for|by|due|assigned|assign)|\s*$)'
+    # "Add a task [task description]"
+    r'|(?s:.*?)add\s+(?:a\s+)?task\s+(?P<add>.+?)(?:\s+(?:for|by|due|assigned|assign)|\s*$)'
+    # "I need to [task description]"
+    r'|(?s:.*?)i\s+need\s+to\s+(?P<need>.+?)(?:\s+(?:by|due|tomorrow|today|next|\d+|\@)|\s*$)'
+    # "Schedule [task description]"
+    r'|(?s:.*?)schedule\s+(?P<schedule>.+?)(?:\s+(?:for|by|due|at)|\s*$)'
+    # "Remind me to [task description]"
+    r'|(?s:.*?)remind\s+me\s+to\s+(?P<remind>.+?)(?:\s+(?:by|due|tomorrow|today|next|\d+|\@)|\s*$)'
+    # Simple task name in quotes
+    r'|(?s:.*?)"(?P<quoted>[^"]+)"'
+    # Simple task name
+    r'|(?P<plain>.+?)(?:\s+(?:due|by|tomorrow|today|next|\d+|assigned|assign|@)|\s*$)'
+    r')'
+)
+
+PROJECT_PATTERNS = [re.compile(pattern) for pattern in (
+    r'in\s+(?:the\s+)?(.+?)\s+project',
+    r'for\s+(?:the\s+)?(.+?)\s+project',
+    r'project\s+(.+?)(?:\s|$|due|by|assigned)'
+)]
+
+NOTES_PATTERNS = [re.compile(pattern) for pattern in (
+    r'(?:with\s+notes?|description|notes?)\s*[:\-]?\s*(.+)$',
+    r'(?:notes?|description)\s*[:\-]?\s*(.+)$'
+)]
+
+# Specific date patterns (MM/DD, DD/MM, YYYY-MM-DD)
+DATE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?',  # MM/DD/YYYY or DD/MM/YYYY
+    r'(\d{4})-(\d{1,2})-(\d{1,2})',          # YYYY-MM-DD
+)]
+
+DAY_NAMES = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+# Relative date keywords (tomorrow, next week, on friday, ...)
+RELATIVE_DATE_RE = re.compile(
+    r'tomorrow|today|next week|next month|(?:(next|on) )?(' + '|'.join(DAY_NAMES) + r')'
+)
+
+# Relative days (in 3 days, 2 weeks, etc.)
+RELATIVE_DAYS_RE = re.compile(r'in\s+(\d+)\s+days?')
+RELATIVE_WEEKS_RE = re.compile(r'in\s+(\d+)\s+weeks?')
+RELATIVE_MONTHS_RE = re.compile(r'in\s+(\d+)\s+months?')
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Grok parses of recently seen requests per guild and day, keyed by the normalized
+# message. The assignee is resolved again on every hit since it depends on the requester.
+nl_parse_cache = TTLCache(maxsize=2048, ttl=3600)
+
 async def parse_natural_language_task(message: str, interaction: discord.Interaction) -> Optional[Dict[str, Any]]:
     """Parse natural language task creation requests using AI first, then regex fallback."""
+    cache_key = (
+        interaction.guild.id if interaction.guild else None,
+        date.today().isoformat(),
+        WHITESPACE_RE.sub(' ', message.strip().lower())
+    )
+    cached = nl_parse_cache.get(cache_key)
+    if cached is not None:
+        parsed_task = dict(cached, interpreted_as=message, assignee=None,
+                           assignee_info='Auto-assigned to you', cache_hit=True)
+        await assign_parsed_task(parsed_task, interaction, cached['assignee_discord_id'])
+        return parsed_task
+
     # Try AI parsing first
     ai_parsed = await parse_task_with_grok(message, interaction)
     if ai_parsed:
+        nl_parse_cache.set(cache_key, dict(ai_parsed))
         return ai_parsed
 
     # Fall back to regex parsing if AI fails or isn't configured
     logger.info("AI parsing failed or not configured, falling back to regex parsing")
-    return await parse_natural_language_task_regex(message, interaction)
+    return await parse_natural_language_task_regex(message, message.lower().strip(), interaction)
 
-async def parse_natural_language_task_regex(message: str, interaction: discord.Interaction) -> Optional[Dict[str, Any]]:
-    """Parse natural language task creation requests using regex (fallback)."""
-    try:
-        message_lower = message.lower().strip()
+async def parse_natural_language_task_regex(message: str, message_lower: str,
+                                            interaction: discord.Interaction) -> Optional[Dict[str, Any]]:
+    """Parse natural language task creation requests using regex (fallback).
 
+    message_lower is the message lowercased and stripped, computed once by the caller.
+    """
+    try:
         # Initialize parsed task structure
         parsed_task = {
             'name': None,
@@ -5778,31 +5959,12 @@ async def parse_natural_language_task_regex(message: str, interaction: discord.I
         }
 
         # Extract task name - look for common patterns
-        task_name_patterns = [
-            # "Create a task to [task description]"
-            r'create\s+a\s+task\s+to\s+(.+?)(?:\s+(?:for|by|due|assigned|assign)|\s*$)',
-            # "Add a task [task description]"
-            r'add\s+(?:a\s+)?task\s+(.+?)(?:\s+(?:for|by|due|assigned|assign)|\s*$)',
-            # "I need to [task description]"
-            r'i\s+need\s+to\s+(.+?)(?:\s+(?:by|due|tomorrow|today|next|\d+|\@)|\s*$)',
-            # "Schedule [task description]"
-            r'schedule\s+(.+?)(?:\s+(?:for|by|due|at)|\s*$)',
-            # "Remind me to [task description]"
-            r'remind\s+me\s+to\s+(.+?)(?:\s+(?:by|due|tomorrow|today|next|\d+|\@)|\s*$)',
-            # Simple task name in quotes
-            r'"([^"]+)"',
-            # Simple task name
-            r'^(.+?)(?:\s+(?:due|by|tomorrow|today|next|\d+|assigned|assign|@)|\s*$)'
-        ]
-
         task_name = None
-        for pattern in task_name_patterns:
-            match = re.search(pattern, message_lower)
-            if match:
-                task_name = match.group(1).strip()
-                # Clean up the task name
-                task_name = re.sub(r'\s+', ' ', task_name)
-                break
+        match = TASK_NAME_RE.match(message_lower)
+        if match:
+            task_name = match.group(match.lastgroup).strip()
+            # Clean up the task name
+            task_name = WHITESPACE_RE.sub(' ', task_name)
 
         if not task_name:
             return None
@@ -5810,52 +5972,25 @@ async def parse_natural_language_task_regex(message: str, interaction: discord.I
         parsed_task['name'] = task_name
 
         # Extract due date
-        due_date = parse_due_date(message)
+        due_date = parse_due_date(message, message_lower)
         if due_date:
             parsed_task['due_date'] = due_date.strftime('%Y-%m-%d')
 
         # Extract assignee from Discord mentions
-        assignee_match = re.search(r'<@!?(\d+)>', message)
-        if assignee_match:
-            discord_user_id = int(assignee_match.group(1))
-            discord_user = interaction.guild.get_member(discord_user_id)
-
-            if discord_user:
-                user_mapping = db_manager.get_user_mapping(interaction.guild.id, discord_user_id)
-                if user_mapping:
-                    parsed_task['assignee'] = user_mapping['asana_user_id']
-                    parsed_task['assignee_info'] = f"{discord_user.mention} → Asana user `{user_mapping['asana_user_name'] or user_mapping['asana_user_id']}`"
-                else:
-                    parsed_task['assignee_info'] = f"⚠️ {discord_user.mention} (not mapped to Asana user)"
-        else:
-            # Auto-assign to current user if they have a mapping
-            user_mapping = db_manager.get_user_mapping(interaction.guild.id, interaction.user.id)
-            if user_mapping:
-                parsed_task['assignee'] = user_mapping['asana_user_id']
-                parsed_task['assignee_info'] = f"Auto-assigned to {interaction.user.mention} → Asana user `{user_mapping['asana_user_name'] or user_mapping['asana_user_id']}`"
+        assignee_match = MENTION_RE.search(message)
+        await assign_parsed_task(parsed_task, interaction, int(assignee_match.group(1)) if assignee_match else None)
 
         # Extract project if mentioned (basic implementation)
-        project_patterns = [
-            r'in\s+(?:the\s+)?(.+?)\s+project',
-            r'for\s+(?:the\s+)?(.+?)\s+project',
-            r'project\s+(.+?)(?:\s|$|due|by|assigned)'
-        ]
-
-        for pattern in project_patterns:
-            match = re.search(pattern, message_lower)
+        for pattern in PROJECT_PATTERNS:
+            match = pattern.search(message_lower)
             if match:
                 project_name = match.group(1).strip()
                 parsed_task['project_info'] = f"Project: {project_name}"
                 break
 
         # Extract notes/description (anything after "with notes" or "description")
-        notes_patterns = [
-            r'(?:with\s+notes?|description|notes?)\s*[:\-]?\s*(.+)$',
-            r'(?:notes?|description)\s*[:\-]?\s*(.+)$'
-        ]
-
-        for pattern in notes_patterns:
-            match = re.search(pattern, message_lower)
+        for pattern in NOTES_PATTERNS:
+            match = pattern.search(message_lower)
             if match:
                 parsed_task['notes'] = match.group(1).strip()
                 break
@@ -5866,45 +6001,51 @@ async def parse_natural_language_task_regex(message: str, interaction: discord.I
         logger.error(f"Error parsing natural language task: {e}")
         return None
 
-def parse_due_date(message: str) -> Optional[datetime]:
-    """Parse due date from natural language."""
+def parse_due_date(message: str, message_lower: str) -> Optional[datetime]:
+    """Parse due date from natural language (message_lower is the lowercased message)."""
     try:
-        message_lower = message.lower()
         today = datetime.now().date()
 
+        # Every relative keyword in one pass; a prefixed day ("next friday") is
+        # recorded both with and without its prefix
+        keywords = set()
+        for match in RELATIVE_DATE_RE.finditer(message_lower):
+            day_name = match.group(2)
+            if day_name is None:
+                keywords.add(match.group(0))
+            else:
+                keywords.add(day_name)
+                if match.group(1):
+                    keywords.add(match.group(0))
+
         # Tomorrow
-        if 'tomorrow' in message_lower:
+        if 'tomorrow' in keywords:
             return datetime.combine(today + timedelta(days=1), datetime.min.time())
 
         # Today
-        if 'today' in message_lower:
+        if 'today' in keywords:
             return datetime.combine(today, datetime.min.time())
 
         # Next week
-        if 'next week' in message_lower:
+        if 'next week' in keywords:
             return datetime.combine(today + timedelta(days=7), datetime.min.time())
 
         # Next month
-        if 'next month' in message_lower:
+        if 'next month' in keywords:
             next_month = today.replace(day=1) + timedelta(days=32)
             next_month = next_month.replace(day=1)
             return datetime.combine(next_month, datetime.min.time())
 
         # Day names
-        day_names = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6
-        }
-
-        for day_name, day_num in day_names.items():
-            if f'next {day_name}' in message_lower or f'on {day_name}' in message_lower:
+        for day_name, day_num in DAY_NAMES.items():
+            if f'next {day_name}' in keywords or f'on {day_name}' in keywords:
                 days_ahead = (day_num - today.weekday()) % 7
                 if days_ahead == 0:  # If it's today, get next week
                     days_ahead = 7
                 target_date = today + timedelta(days=days_ahead)
                 return datetime.combine(target_date, datetime.min.time())
 
-            if day_name in message_lower and f'next {day_name}' not in message_lower:
+            if day_name in keywords:
                 days_ahead = (day_num - today.weekday()) % 7
                 if days_ahead == 0 and 'this' not in message_lower:  # If it's today and not explicitly "this", get next week
                     days_ahead = 7
@@ -5912,13 +6053,8 @@ def parse_due_date(message: str) -> Optional[datetime]:
                 return datetime.combine(target_date, datetime.min.time())
 
         # Specific date patterns (MM/DD, DD/MM, YYYY-MM-DD)
-        date_patterns = [
-            r'(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?',  # MM/DD/YYYY or DD/MM/YYYY
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',          # YYYY-MM-DD
-        ]
-
-        for pattern in date_patterns:
-            match = re.search(pattern, message)
+        for pattern in DATE_PATTERNS:
+            match = pattern.search(message)
             if match:
                 try:
                     if len(match.groups()) == 3 and match.group(3):  # YYYY-MM-DD
@@ -5941,13 +6077,13 @@ def parse_due_date(message: str) -> Optional[datetime]:
 
         # Relative days (in 3 days, 2 weeks, etc.)
         relative_patterns = [
-            (r'in\s+(\d+)\s+days?', lambda m: today + timedelta(days=int(m.group(1)))),
-            (r'in\s+(\d+)\s+weeks?', lambda m: today + timedelta(weeks=int(m.group(1)))),
-            (r'in\s+(\d+)\s+months?', lambda m: today.replace(day=1) + timedelta(days=32 * int(m.group(1))).replace(day=1)),
+            (RELATIVE_DAYS_RE, lambda m: today + timedelta(days=int(m.group(1)))),
+            (RELATIVE_WEEKS_RE, lambda m: today + timedelta(weeks=int(m.group(1)))),
+            (RELATIVE_MONTHS_RE, lambda m: today.replace(day=1) + timedelta(days=32 * int(m.group(1))).replace(day=1)),
         ]
 
         for pattern, date_func in relative_patterns:
-            match = re.search(pattern, message_lower)
+            match = pattern.search(message_lower)
             if match:
                 target_date = date_func(match)
                 return datetime.combine(target_date, datetime.min.time())
@@ -6024,7 +6160,7 @@ guild_id=interaction.guild.id,
             await interaction.followup.send(embed=success_embed)
 
             # Log successful AI task creation
-            await error_logger.log_system_event(
+            queue_system_event(
                 "ai_task_created",
                 f"Natural language task creation successful: '{self.parsed_task['interpreted_as']}' -> Task {task['gid']}",
                 {"user_id": interaction.user.id, "guild_id": interaction.guild.id, "task_id": task['gid'], "parsed_task": self.parsed_task},
@@ -6036,7 +6172,7 @@ guild_id=interaction.guild.id,
 
             error_embed = discord.Embed(
                 title="❌ Task Creation Failed",
-                description=f"Failed to create the task: {str(e)}",
+                description=f"Failed to create the task: {short_exc(e)}",
                 color=discord.Color.red()
             )
             await interaction.followup.send(embed=error_embed)
@@ -6079,36 +6215,16 @@ class BulkTaskSelectionView(discord.ui.View):
 
     def __init__(self, tasks: List[Dict[str, Any]], interaction: discord.Interaction):
         super().__init__(timeout=600)  # 10 minute timeout
-        self.tasks = tasks
+        self._rows = build_task_rows(tasks)
         self.interaction = interaction
         self.selected_tasks = set()
+        self._name_by_id = build_task_name_index(self._rows)
 
-        # Create select menu with tasks
-        options = []
-        for i, task in enumerate(tasks[:25], 1):  # Discord limit of 25 options
-            task_name = task.get('name', 'Unnamed Task')
-            task_id = task.get('gid', task.get('id', 'Unknown'))
-
-            # Truncate name if too long
-            if len(task_name) > 50:
-                task_name = task_name[:47] + "..."
-
-            assignee = task.get('assignee', {}).get('name', 'Unassigned')
-            due_date = task.get('due_on', 'No due date')
-
-            label = f"{i}. {task_name}"
-            description = f"👤 {assignee} | 📅 {due_date}"
-
-            if len(description) > 50:
-                description = description[:47] + "..."
-
-            options.append(discord.SelectOption(
-                label=label,
-                description=description,
-                value=task_id
-            ))
+        # View.__init__ has already swapped the decorated method for its Button item
+        self._proceed_button = self.proceed_with_selected
 
-        select_menu = BulkTaskSelect(self.tasks, self.selected_tasks)
+        # Create select menu with tasks
+        select_menu = BulkTaskSelect(self._rows, self.selected_tasks)
         self.add_item(select_menu)
 
     @discord.ui.button(label="✅ Proceed with Selected", style=discord.ButtonStyle.green, disabled=True)
@@ -6118,8 +6234,11 @@ class BulkTaskSelectionView(discord.ui.View):
             await interaction.response.send_message("❌ Please select at least one task first.", ephemeral=True)
             return
 
+        # Acknowledge the click first so building the next view can't outlive Discord's 3s window
+        await interaction.response.defer()
+
         # Create bulk operations view
-        operations_view = BulkOperationsView(list(self.selected_tasks), self.tasks, interaction)
+        operations_view = BulkOperationsView(list(self.selected_tasks), self._rows, interaction)
 
         selected_count = len(self.selected_tasks)
         embed = discord.Embed(
@@ -6130,20 +6249,22 @@ class BulkTaskSelectionView(discord.ui.View):
 
         embed.add_field(
             name="📋 Selected Tasks",
-            value="\n".join([f"• {next((t['name'] for t in self.tasks if t.get('gid') == tid or t.get('id') == tid), 'Unknown Task')}" for tid in list(self.selected_tasks)[:5]]),
+            value="\n".join(f"• {self._name_by_id.get(tid, 'Unknown Task')}" for tid in islice(self.selected_tasks, 5)),
             inline=False
         )
 
         if len(self.selected_tasks) > 5:
             embed.set_footer(text=f"And {len(self.selected_tasks) - 5} more tasks...")
 
-        await interaction.response.edit_message(embed=embed, view=operations_view)
+        await interaction.edit_original_response(embed=embed, view=operations_view)
 
     @discord.ui.button(label="🔄 Clear Selection", style=discord.ButtonStyle.secondary)
     async def clear_selection(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Clear all selected tasks."""
+        await interaction.response.defer()
+
         self.selected_tasks.clear()
-        self.children[0].max_values = min(25, len(self.tasks))  # Reset select menu
+        self.children[0].max_values = min(25, len(self._rows))  # Reset select menu
         self.children[1].disabled = True  # Disable proceed button
 
         embed = discord.Embed(
@@ -6152,49 +6273,73 @@ class BulkTaskSelectionView(discord.ui.View):
             color=discord.Color.blue()
         )
 
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.edit_original_response(embed=embed, view=self)
+
+@dataclass(slots=True)
+class TaskRow:
+    """One task as the bulk-operation views display it, with labels truncated up front."""
+    id: str
+    name: str
+    assignee: str
+    due: str
+    label: str
+    desc: str
+
+def build_task_rows(tasks: List[Dict[str, Any]]) -> List[TaskRow]:
+    """Convert fetched Asana task dicts into TaskRows, once per bulk selection."""
+    rows = []
+    for i, task in enumerate(tasks, 1):
+        name = task.get('name', 'Unnamed Task')
+        # Asana sends "assignee": null for unassigned tasks
+        assignee = (task.get('assignee') or {}).get('name', 'Unassigned')
+        due = task.get('due_on', 'No due date')
+
+        # Truncate name if too long
+        short_name = name[:47] + "..." if len(name) > 50 else name
+
+        desc = f"👤 {assignee} | 📅 {due}"
+        if len(desc) > 50:
+            desc = desc[:47] + "..."
+
+        rows.append(TaskRow(
+            id=task.get('gid') or task.get('id') or 'Unknown',
+            name=name,
+            assignee=assignee,
+            due=due,
+            label=f"{i}. {short_name}",
+            desc=desc
+        ))
+    return rows
+
+def build_task_name_index(task_rows: List[TaskRow]) -> Dict[str, str]:
+    """Map each task's ID to its name, for O(1) lookups by selected task ID."""
+    return {row.id: row.name for row in task_rows}
 
 class BulkTaskSelect(discord.ui.Select):
     """Select menu for choosing multiple tasks."""
 
-    def __init__(self, tasks: List[Dict[str, Any]], selected_tasks: set):
-        self.all_tasks = tasks
+    def __init__(self, task_rows: List[TaskRow], selected_tasks: set):
+        total_tasks = len(task_rows)
+        self.total_tasks = total_tasks
         self.selected_tasks = selected_tasks
 
-        # Create options for the select menu
-        options = []
-        for i, task in enumerate(tasks[:25], 1):  # Discord limits to 25 options
-            task_name = task.get('name', 'Unnamed Task')
-            task_id = task.get('gid', task.get('id', 'Unknown'))
-
-            # Truncate name if too long
-            if len(task_name) > 50:
-                task_name = task_name[:47] + "..."
-
-            assignee = task.get('assignee', {}).get('name', 'Unassigned')
-            due_date = task.get('due_on', 'No due date')
-
-            label = f"{i}. {task_name}"
-            description = f"👤 {assignee} | 📅 {due_date}"
-
-            if len(description) > 50:
-                description = description[:47] + "..."
-
-            options.append(discord.SelectOption(
-                label=label,
-                description=description,
-                value=task_id
-            ))
+        # Create options for the select menu from the prepared rows
+        options = [
+            discord.SelectOption(label=row.label, description=row.desc, value=row.id)
+            for row in islice(task_rows, 25)  # Discord limits to 25 options
+        ]
 
         super().__init__(
-            placeholder=f"Select tasks to operate on (0/{len(tasks)} selected)",
+            placeholder=f"Select tasks to operate on (0/{total_tasks} selected)",
             min_values=0,
-            max_values=min(25, len(tasks)),
+            max_values=min(25, total_tasks),
             options=options
         )
 
     async def callback(self, interaction: discord.Interaction):
         """Handle task selection."""
+        await interaction.response.defer()
+
         # Update selected tasks
         self.selected_tasks.clear()
         self.selected_tasks.update(self.values)
@@ -6203,23 +6348,40 @@ class BulkTaskSelect(discord.ui.Select):
         parent_view = self.view
         selected_count = len(self.selected_tasks)
 
-        self.placeholder = f"Select tasks to operate on ({selected_count}/{len(self.all_tasks)} selected)"
+        self.placeholder = f"Select tasks to operate on ({selected_count}/{self.total_tasks} selected)"
 
         # Enable/disable proceed button
-        proceed_button = next((item for item in parent_view.children if hasattr(item, 'label') and "Proceed" in item.label), None)
-        if proceed_button:
-            proceed_button.disabled = selected_count == 0
+        parent_view._proceed_button.disabled = selected_count == 0
+
+        await interaction.edit_original_response(view=parent_view)
+
+# Caps Asana calls made by bulk operations across every concurrent invocation
+bulk_asana_semaphore = asyncio.Semaphore(5)
+
+async def run_bulk_task_operation(task_ids: List[str], operation) -> List[tuple]:
+    """Run operation(task_id) for every task concurrently, at most five at a time.
 
-        await interaction.response.edit_message(view=parent_view)
+    Returns (task_id, error) pairs in task order; error is None when the call succeeded.
+    """
+    async def run_one(task_id: str) -> tuple:
+        async with bulk_asana_semaphore:
+            try:
+                await operation(task_id)
+                return task_id, None
+            except Exception as e:
+                return task_id, e
+
+    return await asyncio.gather(*(run_one(task_id) for task_id in task_ids))
 
 class BulkOperationsView(discord.ui.View):
     """View for choosing bulk operations to perform."""
 
-    def __init__(self, selected_task_ids: List[str], all_tasks: List[Dict[str, Any]], interaction: discord.Interaction):
+    def __init__(self, selected_task_ids: List[str], task_rows: List[TaskRow], interaction: discord.Interaction):
         super().__init__(timeout=600)  # 10 minute timeout
         self.selected_task_ids = selected_task_ids
-        self.all_tasks = all_tasks
+        self.task_rows = task_rows
         self.interaction = interaction
+        self._name_by_id = build_task_name_index(task_rows)
 
     @discord.ui.button(label="✅ Complete All", style=discord.ButtonStyle.green, emoji="✅")
     async def complete_all(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -6227,16 +6389,17 @@ class BulkOperationsView(discord.ui.View):
         await interaction.response.defer()
 
         try:
-            completed_count = 0
-            failed_tasks = []
+            results = await run_bulk_task_operation(
+                self.selected_task_ids,
+                lambda task_id: asana_manager.complete_task(task_id, guild_id=self.interaction.guild.id, completed_by_user=self.interaction.user)
+            )
 
-            for task_id in self.selected_task_ids:
-                try:
-                    await asana_manager.complete_task(task_id, guild_id=self.interaction.guild.id, completed_by_user=self.interaction.user)
-                    completed_count += 1
-                except Exception as e:
-                    task_name = next((t['name'] for t in self.all_tasks if t.get('gid') == task_id or t.get('id') == task_id), 'Unknown Task')
-                    failed_tasks.append(f"{task_name}: {str(e)}")
+            failed_tasks = []
+            for task_id, error in results:
+                if error is not None:
+                    task_name = self._name_by_id.get(task_id, 'Unknown Task')
+                    failed_tasks.append(f"{task_name}: {str(error)}")
+            completed_count = len(results) - len(failed_tasks)
 
             # Create results embed
             embed = discord.Embed(
@@ -6258,7 +6421,7 @@ class BulkOperationsView(discord.ui.View):
             await interaction.followup.send(embed=embed)
 
             # Log bulk operation
-            await error_logger.log_system_event(
+            queue_system_event(
                 "bulk_operation",
                 f"Bulk completion: {completed_count}/{len(self.selected_task_ids)} tasks completed",
                 {"user_id": interaction.user.id, "guild_id": interaction.guild.id, "operation": "complete", "success_count": completed_count, "total_count": len(self.selected_task_ids)},
@@ -6270,7 +6433,7 @@ class BulkOperationsView(discord.ui.View):
 
             error_embed = discord.Embed(
                 title="❌ Bulk Completion Failed",
-                description=f"Failed to complete tasks: {str(e)}",
+                description=f"Failed to complete tasks: {short_exc(e)}",
                 color=discord.Color.red()
             )
             await interaction.followup.send(embed=error_embed)
@@ -6279,25 +6442,27 @@ class BulkOperationsView(discord.ui.View):
     async def reassign_all(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Reassign all selected tasks to a new user."""
         # Create reassignment modal
-        modal = BulkReassignmentModal(self.selected_task_ids, self.all_tasks)
+        modal = BulkReassignmentModal(self.selected_task_ids, self._name_by_id)
         await interaction.response.send_modal(modal)
 
     @discord.ui.button(label="📅 Update Due Dates", style=discord.ButtonStyle.primary, emoji="📅")
     async def update_due_dates(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Update due dates for all selected tasks."""
         # Create due date update modal
-        modal = BulkDueDateModal(self.selected_task_ids, self.all_tasks)
+        modal = BulkDueDateModal(self.selected_task_ids, self._name_by_id)
         await interaction.response.send_modal(modal)
 
     @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.red, emoji="❌")
     async def cancel_operation(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Cancel the bulk operation."""
+        await interaction.response.defer()
+
         cancel_embed = discord.Embed(
             title="❌ Bulk Operation Cancelled",
             description="The bulk operation has been cancelled.",
             color=discord.Color.grey()
         )
-        await interaction.response.edit_message(embed=cancel_embed, view=None)
+        await interaction.edit_original_response(embed=cancel_embed, view=None)
 
 class BulkReassignmentModal(discord.ui.Modal, title="Bulk Reassign Tasks"):
     """Modal for bulk reassignment of tasks."""
@@ -6309,10 +6474,10 @@ class BulkReassignmentModal(discord.ui.Modal, title="Bulk Reassign Tasks"):
         max_length=100
     )
 
-    def __init__(self, selected_task_ids: List[str], all_tasks: List[Dict[str, Any]]):
+    def __init__(self, selected_task_ids: List[str], name_by_id: Dict[str, str]):
         super().__init__()
         self.selected_task_ids = selected_task_ids
-        self.all_tasks = all_tasks
+        self._name_by_id = name_by_id
 
     async def on_submit(self, interaction: discord.Interaction):
         """Handle bulk reassignment submission."""
@@ -6324,13 +6489,13 @@ class BulkReassignmentModal(discord.ui.Modal, title="Bulk Reassign Tasks"):
             asana_assignee = None
 
             # Check if it's a Discord mention
-            mention_match = re.search(r'<@!?(\d+)>', assignee_input)
+            mention_match = MENTION_RE.search(assignee_input)
             if mention_match:
                 discord_user_id = int(mention_match.group(1))
                 discord_user = interaction.guild.get_member(discord_user_id)
 
                 if discord_user:
-                    user_mapping = db_manager.get_user_mapping(interaction.guild.id, discord_user_id)
+                    user_mapping = await run_db(db_manager.get_user_mapping, interaction.guild.id, discord_user_id)
                     if user_mapping:
                         asana_assignee = user_mapping['asana_user_id']
                         assignee_display = f"{discord_user.mention} → Asana user `{user_mapping['asana_user_name']}`"
@@ -6356,16 +6521,17 @@ class BulkReassignmentModal(discord.ui.Modal, title="Bulk Reassign Tasks"):
                 assignee_display = f"Asana user ID: `{asana_assignee}`"
 
             # Perform bulk reassignment
-            reassigned_count = 0
-            failed_tasks = []
+            results = await run_bulk_task_operation(
+                self.selected_task_ids,
+                lambda task_id: asana_manager.update_task(task_id=task_id, assignee=asana_assignee, guild_id=interaction.guild.id, updated_by_user=interaction.user)
+            )
 
-            for task_id in self.selected_task_ids:
-                try:
-                    await asana_manager.update_task(task_id=task_id, assignee=asana_assignee, guild_id=self.interaction.guild.id, updated_by_user=self.interaction.user)
-                    reassigned_count += 1
-                except Exception as e:
-                    task_name = next((t['name'] for t in self.all_tasks if t.get('gid') == task_id or t.get('id') == task_id), 'Unknown Task')
-                    failed_tasks.append(f"{task_name}: {str(e)}")
+            failed_tasks = []
+            for task_id, error in results:
+                if error is not None:
+                    task_name = self._name_by_id.get(task_id, 'Unknown Task')
+                    failed_tasks.append(f"{task_name}: {str(error)}")
+            reassigned_count = len(results) - len(failed_tasks)
 
             # Create results embed
             embed = discord.Embed(
@@ -6387,7 +6553,7 @@ class BulkReassignmentModal(discord.ui.Modal, title="Bulk Reassign Tasks"):
             await interaction.followup.send(embed=embed)
 
             # Log bulk operation
-            await error_logger.log_system_event(
+            queue_system_event(
                 "bulk_operation",
                 f"Bulk reassignment: {reassigned_count}/{len(self.selected_task_ids)} tasks reassigned",
                 {"user_id": interaction.user.id, "guild_id": interaction.guild.id, "operation": "reassign", "assignee": assignee_display, "success_count": reassigned_count},
@@ -6399,7 +6565,7 @@ class BulkReassignmentModal(discord.ui.Modal, title="Bulk Reassign Tasks"):
 
             error_embed = discord.Embed(
                 title="❌ Bulk Reassignment Failed",
-                description=f"Failed to reassign tasks: {str(e)}",
+                description=f"Failed to reassign tasks: {short_exc(e)}",
                 color=discord.Color.red()
             )
             await interaction.followup.send(embed=error_embed)
@@ -6414,10 +6580,10 @@ class BulkDueDateModal(discord.ui.Modal, title="Bulk Update Due Dates"):
         max_length=10
     )
 
-    def __init__(self, selected_task_ids: List[str], all_tasks: List[Dict[str, Any]]):
+    def __init__(self, selected_task_ids: List[str], name_by_id: Dict[str, str]):
         super().__init__()
         self.selected_task_ids = selected_task_ids
-        self.all_tasks = all_tasks
+        self._name_by_id = name_by_id
 
     async def on_submit(self, interaction: discord.Interaction):
         """Handle bulk due date update submission."""
@@ -6426,10 +6592,15 @@ class BulkDueDateModal(discord.ui.Modal, title="Bulk Update Due Dates"):
         try:
             due_date_str = str(self.due_date).strip()
 
-            # Validate date format
-            try:
-                datetime.strptime(due_date_str, '%Y-%m-%d')
-            except ValueError:
+            # Validate date format: shape first, then a real calendar date (rejects 2025-02-30)
+            valid_date = ISO_DATE_RE.match(due_date_str) is not None
+            if valid_date:
+                try:
+                    datetime.strptime(due_date_str, '%Y-%m-%d')
+                except ValueError:
+                    valid_date = False
+
+            if not valid_date:
                 error_embed = discord.Embed(
                     title="❌ Invalid Date Format",
                     description="Please use YYYY-MM-DD format (e.g., 2025-12-31).",
@@ -6439,16 +6610,17 @@ class BulkDueDateModal(discord.ui.Modal, title="Bulk Update Due Dates"):
                 return
 
             # Perform bulk due date update
-            updated_count = 0
-            failed_tasks = []
+            results = await run_bulk_task_operation(
+                self.selected_task_ids,
+                lambda task_id: asana_manager.update_task(task_id=task_id, due_date=due_date_str, guild_id=interaction.guild.id, updated_by_user=interaction.user)
+            )
 
-            for task_id in self.selected_task_ids:
-                try:
-                    await asana_manager.update_task(task_id=task_id, due_date=due_date_str, guild_id=self.interaction.guild.id, updated_by_user=self.interaction.user)
-                    updated_count += 1
-                except Exception as e:
-                    task_name = next((t['name'] for t in self.all_tasks if t.get('gid') == task_id or t.get('id') == task_id), 'Unknown Task')
-                    failed_tasks.append(f"{task_name}: {str(e)}")
+            failed_tasks = []
+            for task_id, error in results:
+                if error is not None:
+                    task_name = self._name_by_id.get(task_id, 'Unknown Task')
+                    failed_tasks.append(f"{task_name}: {str(error)}")
+            updated_count = len(results) - len(failed_tasks)
 
             # Create results embed
             embed = discord.Embed(
@@ -6470,7 +6642,7 @@ class BulkDueDateModal(discord.ui.Modal, title="Bulk Update Due Dates"):
             await interaction.followup.send(embed=embed)
 
             # Log bulk operation
-            await error_logger.log_system_event(
+            queue_system_event(
                 "bulk_operation",
                 f"Bulk due date update: {updated_count}/{len(self.selected_task_ids)} tasks updated to {due_date_str}",
                 {"user_id": interaction.user.id, "guild_id": interaction.guild.id, "operation": "update_due_date", "due_date": due_date_str, "success_count": updated_count},
@@ -6482,12 +6654,32 @@ class BulkDueDateModal(discord.ui.Modal, title="Bulk Update Due Dates"):
 
             error_embed = discord.Embed(
                 title="❌ Bulk Due Date Update Failed",
-                description=f"Failed to update due dates: {str(e)}",
+                description=f"Failed to update due dates: {short_exc(e)}",
                 color=discord.Color.red()
             )
             await interaction.followup.send(embed=error_embed)
 
 # Enhanced Notification Functions
+# Discord allows roughly five DMs every five seconds per bot
+dm_semaphore = asyncio.Semaphore(5)
+
+async def send_dm(user: discord.abc.User, embed: discord.Embed) -> bool:
+    """DM an embed to a user, retrying once after a rate limit. Returns False if it wasn't delivered."""
+    async with dm_semaphore:
+        for attempt in range(2):
+            try:
+                await user.send(embed=embed)
+                return True
+            except discord.Forbidden:
+                return False  # DMs closed
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt:
+                    logger.warning(f"Failed to DM user {user.id}: {e}")
+                    return False
+                retry_after = float(e.response.headers.get('Retry-After', 1))
+                await asyncio.sleep(retry_after)
+    return False
+
 async def send_assignment_notification(task: Dict[str, Any], asana_assignee_id: str):
     """Send assignment notification to Discord user if they have notifications enabled."""
     try:
@@ -6531,77 +6723,104 @@ async def send_assignment_notification(task: Dict[str, Any], asana_assignee_id:
 
         embed.set_footer(text=f"Task ID: {task['gid']} • Use /notification-settings to change preferences")
 
-        # Try to send DM to user
-        try:
-            await discord_user.send(embed=embed)
-        except discord.Forbidden:
-            # If DM fails, we could send to a notification channel, but for now we'll just skip
-            pass
+        # Try to send DM to user; if DMs are closed we could send to a notification channel,
+        # but for now we'll just skip
+        await send_dm(discord_user, embed)
 
     except Exception as e:
         logger.error(f"Error sending assignment notification: {e}")
 
 async def send_due_date_reminder(task: Dict[str, Any], asana_assignee_id: str, reminder_type: str):
     """Send due date reminder based on user preferences."""
+    await send_due_date_reminders_bulk([(task, asana_assignee_id, reminder_type)])
+
+async def send_due_date_reminders_bulk(reminders: List[tuple]):
+    """Send due date reminders for (task, asana_assignee_id, reminder_type) triples.
+
+    Mappings and preferences for every assignee are fetched up front in two queries,
+    then each reminder is filtered against the user's preference in memory.
+    """
     try:
-        # Find Discord user mapping for this Asana user
-        user_mapping = db_manager.get_user_mapping_by_asana_id(asana_assignee_id)
-        if not user_mapping:
+        # Find Discord user mappings for these Asana users
+        user_mappings = await run_db(db_manager.get_user_mappings_by_asana_ids,
+                                     [asana_assignee_id for _, asana_assignee_id, _ in reminders])
+        mapped_keys = [(mapping['discord_user_id'], mapping['guild_id'])
+                       for mapping in user_mappings.values() if mapping]
+        if not mapped_keys:
             return
 
         # Check notification preferences
-        prefs = db_manager.get_notification_preferences(user_mapping['discord_user_id'], user_mapping['guild_id'])
-        if not prefs or prefs.get('due_date_reminder') == 'disabled':
-            return
+        preferences = await run_db(db_manager.get_notification_preferences_bulk, mapped_keys)
+    except Exception as e:
+        logger.error(f"Error sending due date reminders: {e}")
+        return
 
-        # Check if this reminder type matches user preference
-        if prefs.get('due_date_reminder') != reminder_type:
-            return
+    dms = []
+    for task, asana_assignee_id, reminder_type in reminders:
+        try:
+            user_mapping = user_mappings.get(asana_assignee_id)
+            if not user_mapping:
+                continue
 
-        # Get Discord user and guild
-        guild = bot.get_guild(user_mapping['guild_id'])
-        if not guild:
-            return
+            prefs = preferences.get((user_mapping['discord_user_id'], user_mapping['guild_id']))
+            if not prefs or prefs.get('due_date_reminder') == 'disabled':
+                continue
 
-        discord_user = guild.get_member(user_mapping['discord_user_id'])
-        if not discord_user:
-            return
+            # Check if this reminder type matches user preference
+            if prefs.get('due_date_reminder') != reminder_type:
+                continue
 
-        # Create reminder embed
-        reminder_messages = {
-            '1_hour': ('⏱️ Task Due in 1 Hour', 'This task is due within the next hour!'),
-            '1_day': ('⏰ Task Due Tomorrow', 'This task is due within the next 24 hours.'),
-            '1_week': ('📅 Task Due in 1 Week', 'This task is due within the next 7 days.')
-        }
+            # Get Discord user and guild
+            guild = bot.get_guild(user_mapping['guild_id'])
+            if not guild:
+                continue
 
-        title, description = reminder_messages.get(reminder_type, ('📅 Task Due Soon', 'This task is approaching its due date.'))
+            discord_user = guild.get_member(user_mapping['discord_user_id'])
+            if not discord_user:
+                continue
 
-        embed = discord.Embed(
-            title=title,
-            description=f"{description}\n\n**{task['name']}**",
-            color=discord.Color.orange(),
-            timestamp=datetime.now()
-        )
+            # Create reminder embed
+            reminder_messages = {
+                '1_hour': ('⏱️ Task Due in 1 Hour', 'This task is due within the next hour!'),
+                '1_day': ('⏰ Task Due Tomorrow', 'This task is due within the next 24 hours.'),
+                '1_week': ('📅 Task Due in 1 Week', 'This task is due within the next 7 days.')
+            }
 
-        embed.add_field(name="📅 Due Date", value=task['due_on'], inline=True)
-        embed.add_field(name="⏰ Time Remaining", value=get_time_until_due(task['due_on']), inline=True)
-        embed.add_field(name="🔗 View Task", value=f"Use `/view-task task_id:{task['gid']}` to see details", inline=False)
+            title, description = reminder_messages.get(reminder_type, ('📅 Task Due Soon', 'This task is approaching its due date.'))
 
-        embed.set_footer(text=f"Task ID: {task['gid']} • Use /notification-settings to adjust reminders")
+            embed = discord.Embed(
+                title=title,
+                description=f"{description}\n\n**{task['name']}**",
+                color=discord.Color.orange(),
+                timestamp=datetime.now()
+            )
 
-        # Try to send DM to user
-        try:
-            await discord_user.send(embed=embed)
-        except discord.Forbidden:
-            pass
+            embed.add_field(name="📅 Due Date", value=task['due_on'], inline=True)
+            embed.add_field(name="⏰ Time Remaining", value=get_time_until_due(task['due_on']), inline=True)
+            embed.add_field(name="🔗 View Task", value=f"Use `/view-task task_id:{task['gid']}` to see details", inline=False)
 
-    except Exception as e:
-        logger.error(f"Error sending due date reminder: {e}")
+            embed.set_footer(text=f"Task ID: {task['gid']} • Use /notification-settings to adjust reminders")
+
+            dms.append(send_dm(discord_user, embed))
+
+        except Exception as e:
+            logger.error(f"Error sending due date reminder: {e}")
+
+    # Send the DMs concurrently; send_dm keeps them within Discord's DM rate limit
+    await asyncio.gather(*dms, return_exceptions=True)
+
+@functools.lru_cache(maxsize=4096)
+def parse_due(due_date_str: str) -> datetime:
+    """Parse an Asana due_on/due_at string; reminder sweeps see the same dates over and over."""
+    if len(due_date_str) == 10:
+        # Date-only due_on: naive midnight, no 'Z' or timezone handling needed
+        return datetime.combine(date.fromisoformat(due_date_str), datetime.min.time())
+    return datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
 
 def get_time_until_due(due_date_str: str) -> str:
     """Get human-readable time until due date."""
     try:
-        due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
+        due_date = parse_due(due_date_str)
         now = datetime.now(due_date.tzinfo) if due_date.tzinfo else datetime.now()
 
         if due_date <= now:
@@ -6625,25 +6844,30 @@ def get_time_until_due(due_date_str: str) -> str:
     except Exception:
         return "Unknown"
 
+def as_utc(value: datetime) -> datetime:
+    """Treat a naive datetime from the database as UTC."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+def entry_clock_in_ts(entry: Dict[str, Any]) -> int:
+    """Unix clock-in time of a time entry, converting clock_in_time for rows saved before clock_in_ts existed."""
+    return entry.get('clock_in_ts') or int(as_utc(entry['clock_in_time']).timestamp())
+
+@functools.lru_cache(maxsize=8192)
 def format_duration(seconds: int) -> str:
-    """Format seconds into human readable duration."""
+    """Format seconds into human readable duration (memoized; pure function of seconds)."""
+    # Sub-minute (and any negative) durations print as plain seconds
     if seconds < 60:
         return f"{seconds}s"
 
-    minutes = seconds // 60
-    if minutes < 60:
-        return f"{minutes}m {seconds % 60}s"
-
-    hours = minutes // 60
-    minutes = minutes % 60
+    days, rest = divmod(seconds, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, secs = divmod(rest, 60)
 
-    if hours < 24:
+    if days:
+        return f"{days}d {hours}h {minutes}m"
+    if hours:
         return f"{hours}h {minutes}m"
-
-    days = hours // 24
-    hours = hours % 24
-
-    return f"{days}d {hours}h {minutes}m"
+    return f"{minutes}m {secs}s"
 
 def create_progress_bar(percentage: float, length: int = 10) -> str:
     """Create a visual progress bar string."""
@@ -6720,44 +6944,62 @@ async def generate_dashboard_data(dashboard_config: dict) -> Optional[dict]:
         logger.error(f"Error generating dashboard data: {e}")
         return None
 
-def check_timeclock_channel(interaction: discord.Interaction) -> bool:
+async def check_timeclock_channel(interaction: discord.Interaction) -> bool:
     """Check if the command is being used in the designated timeclock channel."""
     timeclock_channel = db_manager.get_timeclock_channel(interaction.guild.id)
 
-    if timeclock_channel and interaction.channel.id != timeclock_channel['channel_id']:
-        # Get the channel object for mention
-        channel = interaction.guild.get_channel(timeclock_channel['channel_id'])
-        channel_mention = f"#{timeclock_channel['channel_name']}" if channel else f"#{timeclock_channel['channel_name']}"
-
-        embed = discord.Embed(
-            title="❌ Wrong Channel",
-            description="Time tracking commands can only be used in the designated timeclock channel.",
-            color=discord.Color.red()
-        )
-
-        embed.add_field(
-            name="📍 Designated Channel",
-            value=channel_mention,
-            inline=True
-        )
-
-        embed.add_field(
-            name="🕐 Available Commands",
-            value="• `/clock-in`\n• `/clock-out`\n• `/time-status`\n• `/time-history`",
-            inline=False
-        )
-
-        embed.set_footer(text="Use /set-timeclock-channel to change the designated channel (Admin only)")
-
-        # Send response without deferring since we're rejecting the command
-        if not interaction.response.is_done():
-            interaction.response.send_message(embed=embed)
-        else:
-            interaction.followup.send(embed=embed)
+    # Common case: no designated channel, or already in it
+    if not timeclock_channel or interaction.channel.id == timeclock_channel['channel_id']:
+        return True
+
+    embed = build_embed(
+        "❌ Wrong Channel",
+        "Time tracking commands can only be used in the designated timeclock channel.",
+        ERROR_COLOR,
+        (
+            ("📍 Designated Channel", f"#{timeclock_channel['channel_name']}", True),
+            ("🕐 Available Commands", "• `/clock-in`\n• `/clock-out`\n• `/time-status`\n• `/time-history`", False),
+        ),
+        footer="Use /set-timeclock-channel to change the designated channel (Admin only)"
+    )
 
-        return False
+    # Send response without deferring since we're rejecting the command
+    if not interaction.response.is_done():
+        await interaction.response.send_message(embed=embed)
+    else:
+        await interaction.followup.send(embed=embed)
 
-    return True
+    return False
+
+def resolve_member_names(guild: discord.Guild, user_ids) -> Dict[int, str]:
+    """Resolve a set of Discord user IDs to display names from the member cache."""
+    names = {}
+    for user_id in user_ids:
+        member = guild.get_member(user_id)
+        if member:
+            names[user_id] = member.display_name
+    return names
+
+def get_saved_search_summaries(search: Dict[str, Any], guild: discord.Guild,
+                               assignee_names: Optional[Dict[int, str]] = None) -> tuple:
+    """Return a saved search's (full, short) criteria summaries, rendering and storing them for older rows."""
+    if search.get('criteria_summary') is None or search.get('criteria_summary_short') is None:
+        assignee_id = search['assignee_user_id']
+        if assignee_names is None:
+            assignee_names = resolve_member_names(guild, [assignee_id] if assignee_id else [])
+        summaries = build_saved_search_summaries(search, assignee_names.get(assignee_id))
+        db_manager.update_saved_search_summaries(search['id'], *summaries)
+        search['criteria_summary'], search['criteria_summary_short'] = summaries
+
+    return search['criteria_summary'], search['criteria_summary_short']
+
+def get_task_template_summary(template: Dict[str, Any]) -> str:
+    """Return a task template's defaults summary, rendering and storing it for older rows."""
+    if template.get('criteria_summary') is None:
+        template['criteria_summary'] = build_task_template_summary(template)
+        db_manager.update_task_template_summary(template['id'], template['criteria_summary'])
+
+    return template['criteria_summary']
 
 async def get_today_total_time(guild_id: int, discord_user_id: int) -> str:
     """Get total time worked today for a user."""
@@ -6767,195 +7009,225 @@ async def get_today_total_time(guild_id: int, discord_user_id: int) -> str:
         today = date.today()
         today_start = datetime.combine(today, datetime.min.time())
 
-        # Get all entries for today
-        with db_manager.get_session() as session:
-            entries = session.query(TimeEntry).filter(
-                TimeEntry.guild_id == guild_id,
-                TimeEntry.discord_user_id == discord_user_id,
-                TimeEntry.clock_in_time >= today_start,
-                TimeEntry.status == 'completed'
-            ).all()
+        def sum_today_seconds() -> int:
+            # Sum today's completed entries in SQL rather than loading each row
+            with db_manager.get_session() as session:
+                return session.query(func.coalesce(func.sum(TimeEntry.duration_seconds), 0)).filter(
+                    TimeEntry.guild_id == guild_id,
+                    TimeEntry.discord_user_id == discord_user_id,
+                    TimeEntry.clock_in_time >= today_start,
+                    TimeEntry.status == 'completed'
+                ).scalar() or 0
 
-            total_seconds = sum(entry.duration_seconds or 0 for entry in entries)
-            return format_duration(total_seconds)
+        # Run the query off the event loop so callers can overlap it with other lookups
+        total_seconds = await run_db(sum_today_seconds)
+        return format_duration(total_seconds)
 
     except Exception as e:
         logger.error(f"Error calculating today's total time: {e}")
         return "Unknown"
 
+# Workspace ID -> gid of its "TimeClock" project, so clock events don't list every project
+timeclock_project_cache = TTLCache(maxsize=8, ttl=3600)
+
 async def create_timeclock_asana_task(interaction, entry_id: int, event_type: str, time_proof_link: str = None, notes: str = None):
     """Create or update Asana task for timeclock events."""
     try:
         # Try to find or create a "timeclock" project in Asana
         timeclock_project_name = "TimeClock"
 
-        # Check if project already exists
-        try:
-            projects = asana_client.projects.get_projects({'workspace': ASANA_WORKSPACE_ID})
-            timeclock_project = None
+        # Check if project already exists (the resolved gid is cached per workspace)
+        # The Asana SDK is synchronous, so its calls run in a worker thread
+        timeclock_project_gid = timeclock_project_cache.get(ASANA_WORKSPACE_ID)
+        if timeclock_project_gid is None:
+            try:
+                projects = await asyncio.to_thread(
+                    lambda: list(asana_client.projects.get_projects({'workspace': ASANA_WORKSPACE_ID}))
+                )
+                timeclock_project = None
 
-            for project in projects:
-                if project['name'].lower() == timeclock_project_name.lower():
-                    timeclock_project = project
-                    break
+                for project in projects:
+                    if project['name'].lower() == timeclock_project_name.lower():
+                        timeclock_project = project
+                        break
 
-            # Create project if it doesn't exist
-            if not timeclock_project:
-                timeclock_project = asana_client.projects.create_project({
-                    'name': timeclock_project_name,
-                    'workspace': ASANA_WORKSPACE_ID,
-                    'notes': 'Automated time tracking for Discord timeclock sessions'
-                })
-                logger.info(f"Created Asana project: {timeclock_project_name}")
+                # Create project if it doesn't exist
+                if not timeclock_project:
+                    timeclock_project = await asyncio.to_thread(asana_client.projects.create_project, {
+                        'name': timeclock_project_name,
+                        'workspace': ASANA_WORKSPACE_ID,
+                        'notes': 'Automated time tracking for Discord timeclock sessions'
+                    })
+                    logger.info(f"Created Asana project: {timeclock_project_name}")
 
-        except Exception as e:
-            logger.warning(f"Could not create/access Asana timeclock project: {e}")
-            return
+            except Exception as e:
+                logger.warning(f"Could not create/access Asana timeclock project: {e}")
+                return
+
+            timeclock_project_gid = timeclock_project['gid']
+            timeclock_project_cache.set(ASANA_WORKSPACE_ID, timeclock_project_gid)
 
         # Get time entry details
-        with db_manager.get_session() as session:
-            entry = session.query(TimeEntry).filter(TimeEntry.id == entry_id).first()
-            if not entry:
-                return
+        def load_entry() -> Optional[Dict[str, Any]]:
+            with db_manager.get_session() as session:
+                entry = session.query(TimeEntry).filter(TimeEntry.id == entry_id).first()
+                if not entry:
+                    return None
+                return {
+                    'id': entry.id,
+                    'discord_user_id': entry.discord_user_id,
+                    'discord_username': entry.discord_username,
+                    'clock_in_time': entry.clock_in_time,
+                    'clock_out_time': entry.clock_out_time,
+                    'duration_seconds': entry.duration_seconds
+                }
 
-            # Create task name based on event type
-            if event_type == "clock_in":
-                task_name = f"🕐 {entry.discord_username or 'Unknown User'} - Time Session Started"
-                task_notes = f"**Clock In Event**\n"
-                task_notes += f"**Employee:** {entry.discord_username or 'Unknown User'}\n"
-                task_notes += f"**Start Time:** {entry.clock_in_time.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-                task_notes += f"**Discord User ID:** {entry.discord_user_id}\n"
-                task_notes += f"**Entry ID:** {entry.id}\n\n"
-                task_notes += "This task will be updated when the user clocks out."
-
-            elif event_type == "clock_out":
-                task_name = f"🕐 {entry.discord_username or 'Unknown User'} - Time Session Completed"
-                duration = format_duration(entry.duration_seconds or 0)
-                task_notes = f"**Clock Out Event**\n"
-                task_notes += f"**Employee:** {entry.discord_username or 'Unknown User'}\n"
-                task_notes += f"**Start Time:** {entry.clock_in_time.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-                task_notes += f"**End Time:** {entry.clock_out_time.strftime('%Y-%m-%d %H:%M:%S UTC') if entry.clock_out_time else 'Unknown'}\n"
-                task_notes += f"**Duration:** {duration}\n"
-                task_notes += f"**Discord User ID:** {entry.discord_user_id}\n"
-                task_notes += f"**Entry ID:** {entry.id}\n"
-
-                if time_proof_link:
-                    task_notes += f"**Time Proof:** {time_proof_link}\n"
+        entry = await run_db(load_entry)
+        if not entry:
+            return
 
-                if notes:
-                    task_notes += f"**Notes:** {notes}\n"
+        username = entry['discord_username'] or 'Unknown User'
+
+        # Create task name based on event type
+        if event_type == "clock_in":
+            task_name = f"🕐 {username} - Time Session Started"
+            task_notes = f"**Clock In Event**\n"
+            task_notes += f"**Employee:** {username}\n"
+            task_notes += f"**Start Time:** {entry['clock_in_time'].strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+            task_notes += f"**Discord User ID:** {entry['discord_user_id']}\n"
+            task_notes += f"**Entry ID:** {entry['id']}\n\n"
+            task_notes += "This task will be updated when the user clocks out."
+
+        elif event_type == "clock_out":
+            task_name = f"🕐 {username} - Time Session Completed"
+            duration = format_duration(entry['duration_seconds'] or 0)
+            task_notes = f"**Clock Out Event**\n"
+            task_notes += f"**Employee:** {username}\n"
+            task_notes += f"**Start Time:** {entry['clock_in_time'].strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+            task_notes += f"**End Time:** {entry['clock_out_time'].strftime('%Y-%m-%d %H:%M:%S UTC') if entry['clock_out_time'] else 'Unknown'}\n"
+            task_notes += f"**Duration:** {duration}\n"
+            task_notes += f"**Discord User ID:** {entry['discord_user_id']}\n"
+            task_notes += f"**Entry ID:** {entry['id']}\n"
+
+            if time_proof_link:
+                task_notes += f"**Time Proof:** {time_proof_link}\n"
 
-                if entry.duration_seconds:
-                    # Mark task as completed if session was over 30 minutes
-                    if entry.duration_seconds > 1800:  # 30 minutes
-                        task_notes += f"\n**Status:** Completed session ({duration})"
+            if notes:
+                task_notes += f"**Notes:** {notes}\n"
 
-            else:
-                return
+            if entry['duration_seconds']:
+                # Mark task as completed if session was over 30 minutes
+                if entry['duration_seconds'] > 1800:  # 30 minutes
+                    task_notes += f"\n**Status:** Completed session ({duration})"
 
-            # Create Asana task
-            task_data = {
-                'name': task_name,
-                'notes': task_notes,
-                'projects': [timeclock_project['gid']],
-                'workspace': ASANA_WORKSPACE_ID
-            }
+        else:
+            return
 
-            # Try to assign to Asana user if mapped
-            user_mapping = db_manager.get_user_mapping(interaction.guild.id, entry.discord_user_id)
-            if user_mapping:
-                task_data['assignee'] = user_mapping['asana_user_id']
+        # Create Asana task
+        task_data = {
+            'name': task_name,
+            'notes': task_notes,
+            'projects': [timeclock_project_gid],
+            'workspace': ASANA_WORKSPACE_ID
+        }
 
-            # Create the task
-            asana_task = asana_client.tasks.create_task(task_data)
+        # Try to assign to Asana user if mapped
+        user_mapping = await run_db(db_manager.get_user_mapping, interaction.guild.id, entry['discord_user_id'])
+        if user_mapping:
+            task_data['assignee'] = user_mapping['asana_user_id']
 
-            # Update the time entry with the Asana task ID
-            entry.asana_task_gid = asana_task['gid']
-            session.commit()
+        # Create the task
+        asana_task = await asana_http.create_task(task_data)
 
-            logger.info(f"Created Asana task for time entry {entry_id}: {asana_task['gid']}")
+        # Update the time entry with the Asana task ID
+        def save_task_gid():
+            with db_manager.get_session() as session:
+                session.query(TimeEntry).filter(TimeEntry.id == entry_id).update(
+                    {TimeEntry.asana_task_gid: asana_task['gid']}, synchronize_session=False
+                )
+                session.commit()
+
+        await run_db(save_task_gid)
+
+        logger.info(f"Created Asana task for time entry {entry_id}: {asana_task['gid']}")
 
     except Exception as e:
         logger.error(f"Error creating Asana task for timeclock event: {e}")
 
 # Chat Channel Message Handling
+# Static replies for chat channel mentions, built once and copied per message
+CHAT_HELP_EMBED = embed_dict(
+    "🤖 How to Create Tasks",
+    "I can help you create Asana tasks using natural language!",
+    INFO_COLOR,
+    (
+        ("💬 Examples", "• `Create a task to fix the login bug due tomorrow`\n• `Add a new task called review code assigned to @developer`\n• `Schedule a meeting with the team for Friday`\n• `Remind me to update documentation next week`", False),
+        ("📝 What I Understand", "• Task names and descriptions\n• Due dates (tomorrow, next week, specific dates)\n• @mentions for assignment\n• Project references", False),
+    )
+)
+
+CHAT_UNPARSED_EMBED = embed_dict(
+    "❓ Couldn't Understand Request",
+    "I couldn't parse your task request. Try rephrasing it!",
+    NOTICE_COLOR,
+    (
+        ("💡 Examples of what I understand:", "• 'Create a task to fix the login bug due tomorrow'\n• 'Add a new task called review code assigned to @developer'\n• 'Schedule a meeting with the team for Friday'\n• 'Remind me to update documentation next week'", False),
+        ("🔧 Alternative", "You can also use `/create-task` with specific parameters if natural language doesn't work.", False),
+    )
+)
+
+class MockInteraction:
+    """Stands in for an Interaction so the slash-command parsers can handle chat messages."""
+
+    __slots__ = ('guild', 'user', 'message')
+
+    def __init__(self, message: discord.Message):
+        self.guild = message.guild
+        self.user = message.author
+        self.message = message
+
 async def handle_chat_channel_request(message):
     """Handle natural language task creation requests in designated chat channels."""
+    # One clock read shared by the confirmation embed and the log event
+    now = datetime.now(timezone.utc)
     try:
         # Extract the message content, removing the bot mention
         content = message.content
 
         # Remove the bot mention from the content
         # This handles both <@123456789> and <@!123456789> formats
-        content = re.sub(r'<@!?' + str(bot.user.id) + r'>', '', content).strip()
+        content = get_bot_mention_re().sub('', content).strip()
 
         # If the message is empty after removing the mention, provide help
         if not content:
-            embed = discord.Embed(
-                title="🤖 How to Create Tasks",
-                description="I can help you create Asana tasks using natural language!",
-                color=discord.Color.blue()
-            )
-            embed.add_field(
-                name="💬 Examples",
-                value="• `Create a task to fix the login bug due tomorrow`\n• `Add a new task called review code assigned to @developer`\n• `Schedule a meeting with the team for Friday`\n• `Remind me to update documentation next week`",
-                inline=False
-            )
-            embed.add_field(
-                name="📝 What I Understand",
-                value="• Task names and descriptions\n• Due dates (tomorrow, next week, specific dates)\n• @mentions for assignment\n• Project references",
-                inline=False
-            )
-            await message.reply(embed=embed)
+            await message.reply(embed=embed_from_template(CHAT_HELP_EMBED))
             return
 
         # Create a mock interaction object for compatibility with existing parsing functions
-        class MockInteraction:
-            def __init__(self, message):
-                self.guild = message.guild
-                self.user = message.author
-                self.message = message
-
         mock_interaction = MockInteraction(message)
 
         # Parse the natural language message
         parsed_task = await parse_natural_language_task(content, mock_interaction)
 
         if not parsed_task:
-            embed = discord.Embed(
-                title="❓ Couldn't Understand Request",
-                description="I couldn't parse your task request. Try rephrasing it!",
-                color=discord.Color.orange()
-            )
-            embed.add_field(
-                name="💡 Examples of what I understand:",
-                value="• 'Create a task to fix the login bug due tomorrow'\n• 'Add a new task called review code assigned to @developer'\n• 'Schedule a meeting with the team for Friday'\n• 'Remind me to update documentation next week'",
-                inline=False
-            )
-            embed.add_field(
-                name="🔧 Alternative",
-                value="You can also use `/create-task` with specific parameters if natural language doesn't work.",
-                inline=False
-            )
-            await message.reply(embed=embed)
+            await message.reply(embed=embed_from_template(CHAT_UNPARSED_EMBED))
             return
 
         # Show what was parsed with confirmation buttons
         confirmation_embed = discord.Embed(
             title="🤖 Task Parsed from Your Message",
             description=f"I interpreted your request as: **{parsed_task['interpreted_as']}**",
-            color=discord.Color.blue(),
-            timestamp=datetime.now()
+            color=INFO_COLOR,
+            timestamp=now
         )
 
-        confirmation_embed.add_field(
-            name="📋 Task Details",
-            value=f"**Name:** {parsed_task['name']}\n"
-                  f"**Assignee:** {parsed_task.get('assignee_info', 'Auto-assigned to you')}\n"
-                  f"**Due Date:** {parsed_task.get('due_date', 'No due date')}\n"
-                  f"**Project:** {parsed_task.get('project_info', 'Default project')}",
-            inline=False
+        task_details = (
+            f"**Name:** {parsed_task['name']}",
+            f"**Assignee:** {parsed_task.get('assignee_info') or 'Auto-assigned to you'}",
+            f"**Due Date:** {parsed_task.get('due_date') or 'No due date'}",
+            f"**Project:** {parsed_task.get('project_info') or 'Default project'}",
         )
+        confirmation_embed.add_field(name="📋 Task Details", value="\n".join(task_details), inline=False)
 
         confirmation_embed.add_field(
             name="✅ Confirm Creation?",
@@ -6964,15 +7236,16 @@ async def handle_chat_channel_request(message):
         )
 
         # Create confirmation view
-        view = ChatTaskConfirmationView(parsed_task, message)
-        await message.reply(embed=confirmation_embed, view=view)
+        view = ChatTaskConfirmationView(parsed_task)
+        view.message = await message.reply(embed=confirmation_embed, view=view)
 
         # Log the AI interpretation
-        await error_logger.log_system_event(
+        queue_system_event(
             "ai_interpretation",
             f"Chat channel task creation: '{content}' -> '{parsed_task['interpreted_as']}'",
             {"user_id": message.author.id, "guild_id": message.guild.id, "channel_id": message.channel.id, "parsed_task": parsed_task},
-            "INFO"
+            "INFO",
+            timestamp=now
         )
 
     except Exception as e:
@@ -6980,82 +7253,144 @@ async def handle_chat_channel_request(message):
 
         embed = discord.Embed(
             title="❌ Processing Failed",
-            description=f"I encountered an error while processing your request: {str(e)}",
-            color=discord.Color.red()
+            description=f"I encountered an error while processing your request: {short_exc(e)}",
+            color=ERROR_COLOR
         )
         await message.reply(embed=embed)
 
+def build_task_created_embed(task: Dict[str, Any], title: str, description: str, footer: str,
+                             timestamp: datetime, assignee_suffix: str = "",
+                             assignee_info: Optional[str] = None) -> discord.Embed:
+    """Build the success embed for a task created from a confirmation view, in one from_dict call.
+
+    assignee_info is shown instead of the assignee when Asana left the task unassigned.
+    """
+    projects = task.get('projects')
+    fields = [
+        ("📋 Task ID", f"`{task['gid']}`", True),
+        ("📁 Project", ", ".join(p['name'] for p in projects) if projects else "Default project", True),
+    ]
+
+    if task.get('assignee'):
+        fields.append(("👤 Assignee", task['assignee']['name'] + assignee_suffix, True))
+    elif assignee_info:
+        fields.append(("👤 Assignee Info", assignee_info, False))
+
+    if task.get('due_on'):
+        fields.append(("📅 Due Date", task['due_on'], False))
+
+    notes = task.get('notes')
+    if notes:
+        if len(notes) > 200:
+            notes = notes[:200] + "..."
+        fields.append(("📝 Notes", notes, False))
+
+    return success_embed(title, description, fields, timestamp=timestamp, footer=footer)
+
+class BaseConfirmationView(discord.ui.View):
+    """Confirm/cancel view that closes after the first click and drops its buttons on timeout.
+
+    Subclasses set TIMEOUT_EMBED; whoever sends the view sets .message so it can be edited on timeout.
+    """
+
+    TIMEOUT_EMBED = None
+
+    def __init__(self, timeout: float = 300):
+        super().__init__(timeout=timeout)
+        self.message = None
+        self._closed = False
+
+    async def _disable_and_edit(self, interaction: discord.Interaction,
+                                embed: Optional[discord.Embed] = None) -> bool:
+        """Disable every button (and swap in embed, if given) in one edit.
+
+        Returns False if another click already closed the view.
+        """
+        if self._closed:
+            await interaction.response.defer()
+            return False
+        self._closed = True
+        # Stop listening so on_timeout doesn't overwrite the result later
+        self.stop()
+        for item in self.children:
+            item.disabled = True
+        if embed is None:
+            await interaction.response.edit_message(view=self)
+        else:
+            await interaction.response.edit_message(embed=embed, view=self)
+        return True
+
+    async def on_timeout(self):
+        """Replace the prompt with the timeout embed; nothing can be clicked anymore, so drop the view."""
+        # Already answered, or ephemeral (those go away on their own)
+        if self._closed or self.message is None or self.message.flags.ephemeral:
+            return
+        try:
+            await self.message.edit(embed=embed_from_template(self.TIMEOUT_EMBED), view=None)
+        except (discord.NotFound, discord.Forbidden):
+            pass  # Message might have been deleted
+
 # Chat Channel Task Confirmation View
-class ChatTaskConfirmationView(discord.ui.View):
+class ChatTaskConfirmationView(BaseConfirmationView):
     """View for confirming task creation from chat channel messages."""
 
-    def __init__(self, parsed_task: Dict[str, Any], message: discord.Message):
+    CANCEL_EMBED = embed_dict(
+        "❌ Task Creation Cancelled",
+        "The task creation has been cancelled.",
+        NEUTRAL_COLOR
+    )
+    TIMEOUT_EMBED = embed_dict(
+        "⏰ Confirmation Timed Out",
+        "The task confirmation has expired. Mention me again to try creating a task.",
+        WARNING_COLOR
+    )
+
+    def __init__(self, parsed_task: Dict[str, Any]):
         super().__init__(timeout=300)  # 5 minute timeout
         self.parsed_task = parsed_task
-        self.message = message
 
     @discord.ui.button(label="✅ Create Task", style=discord.ButtonStyle.green, emoji="✅")
     async def confirm_task(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Confirm and create the task."""
         try:
-            # Disable buttons
-            for item in self.children:
-                item.disabled = True
-            await interaction.response.edit_message(view=self)
+            if not await self._disable_and_edit(interaction):
+                return
+
+            parsed_task = self.parsed_task
+            assignee_info = parsed_task.get('assignee_info')
 
             # Create the task
             task = await asana_manager.create_task(
-                name=self.parsed_task['name'],
-                project_id=self.parsed_task.get('project_id'),
-                assignee=self.parsed_task.get('assignee'),
-                due_date=self.parsed_task.get('due_date'),
-                notes=self.parsed_task.get('notes'),
-guild_id=interaction.guild.id,
-            created_by_user=interaction.user
-        )
+                name=parsed_task['name'],
+                project_id=parsed_task.get('project_id'),
+                assignee=parsed_task.get('assignee'),
+                due_date=parsed_task.get('due_date'),
+                notes=parsed_task.get('notes'),
+                guild_id=interaction.guild.id,
+                created_by_user=interaction.user
+            )
 
             # Success embed
-            success_embed = discord.Embed(
-                title="✅ Task Created Successfully!",
-                description=f"**{task['name']}** has been created using AI-powered natural language processing!",
-                color=discord.Color.green(),
-                timestamp=datetime.now()
+            now = datetime.now(timezone.utc)
+            created_embed = build_task_created_embed(
+                task,
+                "✅ Task Created Successfully!",
+                f"**{task['name']}** has been created using AI-powered natural language processing!",
+                "🤖 Created via Chat Channel • Use @Botsana for more natural language task creation!",
+                now,
+                assignee_suffix=" (Auto-assigned)" if assignee_info and "Auto-assigned" in assignee_info else "",
+                assignee_info=assignee_info
             )
 
-            success_embed.add_field(name="📋 Task ID", value=f"`{task['gid']}`", inline=True)
-
-            if task.get('projects') and len(task['projects']) > 0:
-                project_names = [p['name'] for p in task['projects']]
-                success_embed.add_field(name="📁 Project", value=", ".join(project_names), inline=True)
-            else:
-                success_embed.add_field(name="📁 Project", value="Default project", inline=True)
-
-            if task.get('assignee'):
-                asana_assignee_name = task['assignee']['name']
-                assignee_display = asana_assignee_name
-                if self.parsed_task.get('assignee_info') and "Auto-assigned" in self.parsed_task['assignee_info']:
-                    assignee_display += " (Auto-assigned)"
-                success_embed.add_field(name="👤 Assignee", value=assignee_display, inline=True)
-            elif self.parsed_task.get('assignee_info'):
-                success_embed.add_field(name="👤 Assignee Info", value=self.parsed_task['assignee_info'], inline=False)
-
-            if task.get('due_on'):
-                success_embed.add_field(name="📅 Due Date", value=task['due_on'], inline=False)
-
-            if task.get('notes'):
-                notes = task['notes'][:200] + "..." if len(task['notes']) > 200 else task['notes']
-                success_embed.add_field(name="📝 Notes", value=notes, inline=False)
-
-            success_embed.set_footer(text="🤖 Created via Chat Channel • Use @Botsana for more natural language task creation!")
-
-            await interaction.followup.send(embed=success_embed)
+            await interaction.followup.send(embed=created_embed)
 
             # Log successful AI task creation
-            await error_logger.log_system_event(
+            queue_system_event(
                 "ai_task_created",
-                f"Chat channel task creation successful: '{self.parsed_task['interpreted_as']}' -> Task {task['gid']}",
-                {"user_id": interaction.user.id, "guild_id": interaction.guild.id, "task_id": task['gid'], "parsed_task": self.parsed_task},
-                "INFO"
+                f"Chat channel task creation successful: '{parsed_task['interpreted_as']}' -> Task {task['gid']}",
+                {"user_id": interaction.user.id, "guild_id": interaction.guild.id, "task_id": task['gid'], "parsed_task": parsed_task},
+                "INFO",
+                timestamp=now
             )
 
         except Exception as e:
@@ -7063,48 +7398,32 @@ guild_id=interaction.guild.id,
 
             error_embed = discord.Embed(
                 title="❌ Task Creation Failed",
-                description=f"Failed to create the task: {str(e)}",
-                color=discord.Color.red()
+                description=f"Failed to create the task: {short_exc(e)}",
+                color=ERROR_COLOR
             )
             await interaction.followup.send(embed=error_embed)
 
     @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.red, emoji="❌")
     async def cancel_task(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Cancel task creation."""
-        # Disable buttons
-        for item in self.children:
-            item.disabled = True
-        await interaction.response.edit_message(view=self)
-
-        cancel_embed = discord.Embed(
-            title="❌ Task Creation Cancelled",
-            description="The task creation has been cancelled.",
-            color=discord.Color.grey()
-        )
-        await interaction.followup.send(embed=cancel_embed)
-
-    async def on_timeout(self):
-        """Handle when the view times out."""
-        # Disable all components
-        for item in self.children:
-            item.disabled = True
-
-        timeout_embed = discord.Embed(
-            title="⏰ Confirmation Timed Out",
-            description="The task confirmation has expired. Mention me again to try creating a task.",
-            color=discord.Color.yellow()
-        )
-
-        try:
-            await self.message.edit(embed=timeout_embed, view=self)
-        except:
-            pass  # Message might have been deleted
+        await self._disable_and_edit(interaction, embed_from_template(self.CANCEL_EMBED))
 
 # Template Task Confirmation View
-class TemplateTaskConfirmationView(discord.ui.View):
+class TemplateTaskConfirmationView(BaseConfirmationView):
     """View for confirming task creation from a template."""
 
-    def __init__(self, template_data, task_name, task_assignee, task_project, task_due_date, task_notes, interaction):
+    CANCEL_EMBED = embed_dict(
+        "❌ Task Creation Cancelled",
+        "The task creation has been cancelled.",
+        NEUTRAL_COLOR
+    )
+    TIMEOUT_EMBED = embed_dict(
+        "⏰ Confirmation Timed Out",
+        "The task confirmation has expired. Use `/use-template` again to try creating a task.",
+        WARNING_COLOR
+    )
+
+    def __init__(self, template_data, task_name, task_assignee, task_project, task_due_date, task_notes):
         super().__init__(timeout=300)  # 5 minute timeout
         self.template_data = template_data
         self.task_name = task_name
@@ -7112,16 +7431,15 @@ class TemplateTaskConfirmationView(discord.ui.View):
         self.task_project = task_project
         self.task_due_date = task_due_date
         self.task_notes = task_notes
-        self.interaction = interaction
 
     @discord.ui.button(label="✅ Create Task", style=discord.ButtonStyle.green, emoji="✅")
     async def confirm_task(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Confirm and create the task from template."""
         try:
-            # Disable buttons
-            for item in self.children:
-                item.disabled = True
-            await interaction.response.edit_message(view=self)
+            if not await self._disable_and_edit(interaction):
+                return
+
+            template_data = self.template_data
 
             # Create the task
             task = await asana_manager.create_task(
@@ -7130,53 +7448,35 @@ class TemplateTaskConfirmationView(discord.ui.View):
                 assignee=self.task_assignee,
                 due_date=self.task_due_date,
                 notes=self.task_notes,
-guild_id=interaction.guild.id,
-            created_by_user=interaction.user
-        )
+                guild_id=interaction.guild.id,
+                created_by_user=interaction.user
+            )
 
-            # Update template usage count
-            db_manager.update_task_template_usage(self.template_data['id'])
+            # Update template usage count in the background while the reply goes out;
+            # only after creation succeeds, so a failed create doesn't count as a use
+            spawn_background_task(run_db(db_manager.update_task_template_usage, template_data['id']))
 
             # Success embed
-            success_embed = discord.Embed(
-                title="✅ Task Created from Template!",
-                description=f"**{task['name']}** has been created using template **{self.template_data['name']}**!",
-                color=discord.Color.green(),
-                timestamp=datetime.now()
+            now = datetime.now(timezone.utc)
+            assignee = task.get('assignee')
+            created_embed = build_task_created_embed(
+                task,
+                "✅ Task Created from Template!",
+                f"**{task['name']}** has been created using template **{template_data['name']}**!",
+                f"🤖 Created from template • Template used {template_data['usage_count'] + 1} time(s)",
+                now,
+                assignee_suffix=" (From template)" if self.task_assignee and assignee and "Auto-assigned" not in assignee['name'] else ""
             )
 
-            success_embed.add_field(name="📋 Task ID", value=f"`{task['gid']}`", inline=True)
-
-            if task.get('projects') and len(task['projects']) > 0:
-                project_names = [p['name'] for p in task['projects']]
-                success_embed.add_field(name="📁 Project", value=", ".join(project_names), inline=True)
-            else:
-                success_embed.add_field(name="📁 Project", value="Default project", inline=True)
-
-            if task.get('assignee'):
-                asana_assignee_name = task['assignee']['name']
-                assignee_display = asana_assignee_name
-                if self.task_assignee and "Auto-assigned" not in assignee_display:
-                    assignee_display += " (From template)"
-                success_embed.add_field(name="👤 Assignee", value=assignee_display, inline=True)
-
-            if task.get('due_on'):
-                success_embed.add_field(name="📅 Due Date", value=task['due_on'], inline=False)
-
-            if task.get('notes'):
-                notes = task['notes'][:200] + "..." if len(task['notes']) > 200 else task['notes']
-                success_embed.add_field(name="📝 Notes", value=notes, inline=False)
-
-            success_embed.set_footer(text=f"🤖 Created from template • Template used {self.template_data['usage_count'] + 1} time(s)")
-
-            await interaction.followup.send(embed=success_embed)
+            await interaction.followup.send(embed=created_embed)
 
             # Log successful template usage
-            await error_logger.log_system_event(
+            queue_system_event(
                 "template_used",
-                f"Task template '{self.template_data['name']}' used to create task {task['gid']}",
-                {"user_id": interaction.user.id, "guild_id": interaction.guild.id, "template_id": self.template_data['id'], "task_id": task['gid']},
-                "INFO"
+                f"Task template '{template_data['name']}' used to create task {task['gid']}",
+                {"user_id": interaction.user.id, "guild_id": interaction.guild.id, "template_id": template_data['id'], "task_id": task['gid']},
+                "INFO",
+                timestamp=now
             )
 
         except Exception as e:
@@ -7184,70 +7484,51 @@ guild_id=interaction.guild.id,
 
             error_embed = discord.Embed(
                 title="❌ Task Creation Failed",
-                description=f"Failed to create task from template: {str(e)}",
-                color=discord.Color.red()
+                description=f"Failed to create task from template: {short_exc(e)}",
+                color=ERROR_COLOR
             )
             await interaction.followup.send(embed=error_embed)
 
     @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.red, emoji="❌")
     async def cancel_task(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Cancel task creation."""
-        # Disable buttons
-        for item in self.children:
-            item.disabled = True
-        await interaction.response.edit_message(view=self)
-
-        cancel_embed = discord.Embed(
-            title="❌ Task Creation Cancelled",
-            description="The task creation has been cancelled.",
-            color=discord.Color.grey()
-        )
-        await interaction.followup.send(embed=cancel_embed)
-
-    async def on_timeout(self):
-        """Handle when the view times out."""
-        # Disable all components
-        for item in self.children:
-            item.disabled = True
-
-        timeout_embed = discord.Embed(
-            title="⏰ Confirmation Timed Out",
-            description="The task confirmation has expired. Use `/use-template` again to try creating a task.",
-            color=discord.Color.yellow()
-        )
-
-        try:
-            await self.message.edit(embed=timeout_embed, view=self)
-        except:
-            pass  # Message might have been deleted
+        await self._disable_and_edit(interaction, embed_from_template(self.CANCEL_EMBED))
 
 # Template Deletion Confirmation View
-class TemplateDeletionView(discord.ui.View):
+class TemplateDeletionView(BaseConfirmationView):
     """View for confirming template deletion."""
 
-    def __init__(self, template_id, template_name, interaction):
+    CANCEL_EMBED = embed_dict(
+        "❌ Deletion Cancelled",
+        "The template deletion has been cancelled.",
+        NEUTRAL_COLOR
+    )
+    TIMEOUT_EMBED = embed_dict(
+        "⏰ Deletion Timed Out",
+        "The template deletion confirmation has expired. The template was not deleted.",
+        WARNING_COLOR
+    )
+
+    def __init__(self, template_id, template_name):
         super().__init__(timeout=300)  # 5 minute timeout
         self.template_id = template_id
         self.template_name = template_name
-        self.interaction = interaction
 
     @discord.ui.button(label="🗑️ Delete Template", style=discord.ButtonStyle.red, emoji="🗑️")
     async def confirm_delete(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Confirm template deletion."""
         try:
-            # Disable buttons
-            for item in self.children:
-                item.disabled = True
-            await interaction.response.edit_message(view=self)
+            if not await self._disable_and_edit(interaction):
+                return
 
             # Delete the template
-            success = db_manager.delete_task_template(self.template_id)
+            success = await run_db(db_manager.delete_task_template, self.template_id)
 
             if success:
                 embed = discord.Embed(
                     title="✅ Template Deleted",
                     description=f"Template **{self.template_name}** has been permanently deleted.",
-                    color=discord.Color.green()
+                    color=SUCCESS_COLOR
                 )
 
                 embed.set_footer(text="This action cannot be undone")
@@ -7265,7 +7546,7 @@ class TemplateDeletionView(discord.ui.View):
                 embed = discord.Embed(
                     title="❌ Deletion Failed",
                     description="Failed to delete the template. It may have already been deleted.",
-                    color=discord.Color.red()
+                    color=ERROR_COLOR
                 )
                 await interaction.followup.send(embed=embed)
 
@@ -7274,70 +7555,51 @@ class TemplateDeletionView(discord.ui.View):
 
             error_embed = discord.Embed(
                 title="❌ Deletion Failed",
-                description=f"An error occurred while deleting the template: {str(e)}",
-                color=discord.Color.red()
+                description=f"An error occurred while deleting the template: {short_exc(e)}",
+                color=ERROR_COLOR
             )
             await interaction.followup.send(embed=error_embed)
 
     @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.secondary, emoji="❌")
     async def cancel_delete(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Cancel template deletion."""
-        # Disable buttons
-        for item in self.children:
-            item.disabled = True
-        await interaction.response.edit_message(view=self)
-
-        cancel_embed = discord.Embed(
-            title="❌ Deletion Cancelled",
-            description="The template deletion has been cancelled.",
-            color=discord.Color.grey()
-        )
-        await interaction.followup.send(embed=cancel_embed)
-
-    async def on_timeout(self):
-        """Handle when the view times out."""
-        # Disable all components
-        for item in self.children:
-            item.disabled = True
-
-        timeout_embed = discord.Embed(
-            title="⏰ Deletion Timed Out",
-            description="The template deletion confirmation has expired. The template was not deleted.",
-            color=discord.Color.yellow()
-        )
-
-        try:
-            await self.message.edit(embed=timeout_embed, view=self)
-        except:
-            pass  # Message might have been deleted
+        await self._disable_and_edit(interaction, embed_from_template(self.CANCEL_EMBED))
 
 # Search Deletion Confirmation View
-class SearchDeletionView(discord.ui.View):
+class SearchDeletionView(BaseConfirmationView):
     """View for confirming search deletion."""
 
-    def __init__(self, search_id, search_name, interaction):
+    CANCEL_EMBED = embed_dict(
+        "❌ Deletion Cancelled",
+        "The search deletion has been cancelled.",
+        NEUTRAL_COLOR
+    )
+    TIMEOUT_EMBED = embed_dict(
+        "⏰ Deletion Timed Out",
+        "The search deletion confirmation has expired. The search was not deleted.",
+        WARNING_COLOR
+    )
+
+    def __init__(self, search_id, search_name):
         super().__init__(timeout=300)  # 5 minute timeout
         self.search_id = search_id
         self.search_name = search_name
-        self.interaction = interaction
 
     @discord.ui.button(label="🗑️ Delete Search", style=discord.ButtonStyle.red, emoji="🗑️")
     async def confirm_delete(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Confirm search deletion."""
         try:
-            # Disable buttons
-            for item in self.children:
-                item.disabled = True
-            await interaction.response.edit_message(view=self)
+            if not await self._disable_and_edit(interaction):
+                return
 
             # Delete the search
-            success = db_manager.delete_saved_search(self.search_id)
+            success = await run_db(db_manager.delete_saved_search, self.search_id)
 
             if success:
                 embed = discord.Embed(
                     title="✅ Search Deleted",
                     description=f"Saved search **{self.search_name}** has been permanently deleted.",
-                    color=discord.Color.green()
+                    color=SUCCESS_COLOR
                 )
 
                 embed.set_footer(text="This action cannot be undone")
@@ -7355,7 +7617,7 @@ class SearchDeletionView(discord.ui.View):
                 embed = discord.Embed(
                     title="❌ Deletion Failed",
                     description="Failed to delete the search. It may have already been deleted.",
-                    color=discord.Color.red()
+                    color=ERROR_COLOR
                 )
                 await interaction.followup.send(embed=embed)
 
@@ -7364,70 +7626,51 @@ class SearchDeletionView(discord.ui.View):
 
             error_embed = discord.Embed(
                 title="❌ Deletion Failed",
-                description=f"An error occurred while deleting the search: {str(e)}",
-                color=discord.Color.red()
+                description=f"An error occurred while deleting the search: {short_exc(e)}",
+                color=ERROR_COLOR
             )
             await interaction.followup.send(embed=embed)
 
     @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.secondary, emoji="❌")
     async def cancel_delete(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Cancel search deletion."""
-        # Disable buttons
-        for item in self.children:
-            item.disabled = True
-        await interaction.response.edit_message(view=self)
-
-        cancel_embed = discord.Embed(
-            title="❌ Deletion Cancelled",
-            description="The search deletion has been cancelled.",
-            color=discord.Color.grey()
-        )
-        await interaction.followup.send(embed=cancel_embed)
-
-    async def on_timeout(self):
-        """Handle when the view times out."""
-        # Disable all components
-        for item in self.children:
-            item.disabled = True
-
-        timeout_embed = discord.Embed(
-            title="⏰ Deletion Timed Out",
-            description="The search deletion confirmation has expired. The search was not deleted.",
-            color=discord.Color.yellow()
-        )
-
-        try:
-            await self.message.edit(embed=timeout_embed, view=self)
-        except:
-            pass  # Message might have been deleted
+        await self._disable_and_edit(interaction, embed_from_template(self.CANCEL_EMBED))
 
 # Dashboard Deletion Confirmation View
-class DashboardDeletionView(discord.ui.View):
+class DashboardDeletionView(BaseConfirmationView):
     """View for confirming dashboard deletion."""
 
-    def __init__(self, dashboard_id, dashboard_name, interaction):
+    CANCEL_EMBED = embed_dict(
+        "❌ Deletion Cancelled",
+        "The dashboard deletion has been cancelled.",
+        NEUTRAL_COLOR
+    )
+    TIMEOUT_EMBED = embed_dict(
+        "⏰ Deletion Timed Out",
+        "The dashboard deletion confirmation has expired. The dashboard was not deleted.",
+        WARNING_COLOR
+    )
+
+    def __init__(self, dashboard_id, dashboard_name):
         super().__init__(timeout=300)  # 5 minute timeout
         self.dashboard_id = dashboard_id
         self.dashboard_name = dashboard_name
-        self.interaction = interaction
 
     @discord.ui.button(label="🗑️ Delete Dashboard", style=discord.ButtonStyle.red, emoji="🗑️")
     async def confirm_delete(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Confirm dashboard deletion."""
         try:
-            # Disable buttons
-            for item in self.children:
-                item.disabled = True
-            await interaction.response.edit_message(view=self)
+            if not await self._disable_and_edit(interaction):
+                return
 
             # Delete the dashboard
-            success = db_manager.delete_project_dashboard(self.dashboard_id)
+            success = await run_db(db_manager.delete_project_dashboard, self.dashboard_id)
 
             if success:
                 embed = discord.Embed(
                     title="✅ Dashboard Deleted",
                     description=f"Project dashboard **{self.dashboard_name}** has been permanently deleted.",
-                    color=discord.Color.green()
+                    color=SUCCESS_COLOR
                 )
 
                 embed.set_footer(text="This action cannot be undone")
@@ -7445,7 +7688,7 @@ class DashboardDeletionView(discord.ui.View):
                 embed = discord.Embed(
                     title="❌ Deletion Failed",
                     description="Failed to delete the dashboard. It may have already been deleted.",
-                    color=discord.Color.red()
+                    color=ERROR_COLOR
                 )
                 await interaction.followup.send(embed=embed)
 
@@ -7454,78 +7697,57 @@ class DashboardDeletionView(discord.ui.View):
 
             error_embed = discord.Embed(
                 title="❌ Deletion Failed",
-                description=f"An error occurred while deleting the dashboard: {str(e)}",
-                color=discord.Color.red()
+                description=f"An error occurred while deleting the dashboard: {short_exc(e)}",
+                color=ERROR_COLOR
             )
             await interaction.followup.send(embed=error_embed)
 
     @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.secondary, emoji="❌")
     async def cancel_delete(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Cancel dashboard deletion."""
-        # Disable buttons
-        for item in self.children:
-            item.disabled = True
-        await interaction.response.edit_message(view=self)
-
-        cancel_embed = discord.Embed(
-            title="❌ Deletion Cancelled",
-            description="The dashboard deletion has been cancelled.",
-            color=discord.Color.grey()
-        )
-        await interaction.followup.send(embed=cancel_embed)
-
-    async def on_timeout(self):
-        """Handle when the view times out."""
-        # Disable all components
-        for item in self.children:
-            item.disabled = True
-
-        timeout_embed = discord.Embed(
-            title="⏰ Deletion Timed Out",
-            description="The dashboard deletion confirmation has expired. The dashboard was not deleted.",
-            color=discord.Color.yellow()
-        )
-
-        try:
-            await self.message.edit(embed=timeout_embed, view=self)
-        except:
-            pass  # Message might have been deleted
+        await self._disable_and_edit(interaction, embed_from_template(self.CANCEL_EMBED))
 
 # Notification Settings View
+# Select options shared by every NotificationSettingsView (discord.py hands the same
+# list to each instance's Select, so they are built once here)
+DUE_DATE_REMINDER_OPTIONS = [
+    discord.SelectOption(label="1 day before due date", value="1_day", emoji="⏰", description="Get reminded 24 hours before tasks are due"),
+    discord.SelectOption(label="1 hour before due date", value="1_hour", emoji="⏱️", description="Get reminded 1 hour before tasks are due"),
+    discord.SelectOption(label="1 week before due date", value="1_week", emoji="📅", description="Get reminded 7 days before tasks are due"),
+    discord.SelectOption(label="Disable due date reminders", value="disabled", emoji="🚫", description="Turn off due date reminders")
+]
+
+ASSIGNMENT_NOTIFICATION_OPTIONS = [
+    discord.SelectOption(label="Notify when assigned to tasks", value="enabled", emoji="✅", description="Get notified when tasks are assigned to you"),
+    discord.SelectOption(label="Disable assignment notifications", value="disabled", emoji="🚫", description="Turn off assignment notifications")
+]
+
 class NotificationSettingsView(discord.ui.View):
     """View for managing notification preferences."""
 
-    def __init__(self, current_prefs: Dict[str, Any], interaction: discord.Interaction):
+    def __init__(self, current_prefs: Dict[str, Any]):
         super().__init__(timeout=600)  # 10 minute timeout
         self.current_prefs = current_prefs
-        self.interaction = interaction
 
     @discord.ui.select(
         placeholder="Choose due date reminder timing...",
-        options=[
-            discord.SelectOption(label="1 day before due date", value="1_day", emoji="⏰", description="Get reminded 24 hours before tasks are due"),
-            discord.SelectOption(label="1 hour before due date", value="1_hour", emoji="⏱️", description="Get reminded 1 hour before tasks are due"),
-            discord.SelectOption(label="1 week before due date", value="1_week", emoji="📅", description="Get reminded 7 days before tasks are due"),
-            discord.SelectOption(label="Disable due date reminders", value="disabled", emoji="🚫", description="Turn off due date reminders")
-        ]
+        options=DUE_DATE_REMINDER_OPTIONS
     )
     async def due_date_reminder_select(self, interaction: discord.Interaction, select: discord.ui.Select):
         """Handle due date reminder preference selection."""
         selected_value = select.values[0]
 
         # Update preferences
-        success = db_manager.set_notification_preferences(
-            discord_user_id=interaction.user.id,
-            guild_id=interaction.guild.id,
-            due_date_reminder=selected_value,
-            assignment_notifications=self.current_prefs.get('assignment_notifications', 'enabled')
+        success = await run_db(
+            db_manager.set_notification_preference,
+            interaction.user.id, interaction.guild.id, 'due_date_reminder', selected_value
         )
 
         if success:
             embed = discord.Embed(
                 title="✅ Due Date Reminder Updated",
                 description=f"Your due date reminder preference has been set to: **{select.selected_options[0].label}**",
-                color=discord.Color.green()
+                color=SUCCESS_COLOR
             )
 
             # Update current prefs
@@ -7536,34 +7758,29 @@ class NotificationSettingsView(discord.ui.View):
             error_embed = discord.Embed(
                 title="❌ Update Failed",
                 description="Failed to update your due date reminder preference. Please try again.",
-                color=discord.Color.red()
+                color=ERROR_COLOR
             )
             await interaction.response.send_message(embed=error_embed, ephemeral=True)
 
     @discord.ui.select(
         placeholder="Choose assignment notification setting...",
-        options=[
-            discord.SelectOption(label="Notify when assigned to tasks", value="enabled", emoji="✅", description="Get notified when tasks are assigned to you"),
-            discord.SelectOption(label="Disable assignment notifications", value="disabled", emoji="🚫", description="Turn off assignment notifications")
-        ]
+        options=ASSIGNMENT_NOTIFICATION_OPTIONS
     )
     async def assignment_notification_select(self, interaction: discord.Interaction, select: discord.ui.Select):
         """Handle assignment notification preference selection."""
         selected_value = select.values[0]
 
         # Update preferences
-        success = db_manager.set_notification_preferences(
-            discord_user_id=interaction.user.id,
-            guild_id=interaction.guild.id,
-            due_date_reminder=self.current_prefs.get('due_date_reminder', '1_day'),
-            assignment_notifications=selected_value
+        success = await run_db(
+            db_manager.set_notification_preference,
+            interaction.user.id, interaction.guild.id, 'assignment_notifications', selected_value
         )
 
         if success:
             embed = discord.Embed(
                 title="✅ Assignment Notification Updated",
                 description=f"Your assignment notification preference has been set to: **{select.selected_options[0].label}**",
-                color=discord.Color.green()
+                color=SUCCESS_COLOR
             )
 
             # Update current prefs
@@ -7574,14 +7791,15 @@ class NotificationSettingsView(discord.ui.View):
             error_embed = discord.Embed(
                 title="❌ Update Failed",
                 description="Failed to update your assignment notification preference. Please try again.",
-                color=discord.Color.red()
+                color=ERROR_COLOR
             )
             await interaction.response.send_message(embed=error_embed, ephemeral=True)
 
     @discord.ui.button(label="🔄 Reset to Defaults", style=discord.ButtonStyle.secondary)
     async def reset_to_defaults(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Reset preferences to defaults."""
-        success = db_manager.set_notification_preferences(
+        success = await run_db(
+            db_manager.set_notification_preferences,
             discord_user_id=interaction.user.id,
             guild_id=interaction.guild.id,
             due_date_reminder='1_day',
@@ -7592,7 +7810,7 @@ class NotificationSettingsView(discord.ui.View):
             embed = discord.Embed(
                 title="🔄 Preferences Reset",
                 description="Your notification preferences have been reset to defaults:\n• Due date reminders: 1 day before\n• Assignment notifications: Enabled",
-                color=discord.Color.blue()
+                color=INFO_COLOR
             )
 
             # Reset current prefs
@@ -7603,7 +7821,7 @@ class NotificationSettingsView(discord.ui.View):
             error_embed = discord.Embed(
                 title="❌ Reset Failed",
                 description="Failed to reset your preferences. Please try again.",
-                color=discord.Color.red()
+                color=ERROR_COLOR
             )
             await interaction.response.send_message(embed=error_embed, ephemeral=True)
 
@@ -7613,7 +7831,7 @@ class NotificationSettingsView(discord.ui.View):
         embed = discord.Embed(
             title="✅ Settings Saved",
             description="Your notification preferences have been saved. You can change them anytime with `/notification-settings`.",
-            color=discord.Color.green()
+            color=SUCCESS_COLOR
         )
         await interaction.response.edit_message(embed=embed, view=None)
 
@@ -7628,9 +7846,28 @@ async def main():
     flask_thread = threading.Thread(target=run_flask_app, daemon=True)
     flask_thread.start()
 
+    event_consumer = spawn_background_task(system_event_consumer())
+
     # Start the bot
-    async with bot:
-        await bot.start(DISCORD_TOKEN)
+    try:
+        async with bot:
+            await bot.start(DISCORD_TOKEN)
+    finally:
+        try:
+            # Don't lose usage counts that were queued but not yet flushed
+            await flush_saved_search_usage()
+
+            # Stop the consumer (it finishes its current batch), then write what is still queued
+            event_consumer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await event_consumer
+            pending_events = [system_event_queue.get_nowait() for _ in range(system_event_queue.qsize())]
+            await write_system_events(pending_events)
+        finally:
+            try:
+                await grok_client.aclose()
+            finally:
+                await asana_http.aclose()
 
 if __name__ == '__main__':
     asyncio.run(main())
@@ -0,0 +1,107 @@
+"""
+Small in-process caches for Botsana.
+Keeps hot, rarely-changing lookups (user mappings, channel config) off the database.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+# get() default that tells a miss apart from a cached None in a single (locked) lookup
+CACHE_MISS = object()
+
+
+class TTLCache:
+    """A size-bounded mapping whose entries expire after a fixed number of seconds.
+
+    Safe to share between the event loop and run_db worker threads.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._lookup(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _lookup(self, key: Hashable) -> Optional[tuple]:
+        # Callers hold self._lock
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return None
+        return entry
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._lookup(key)
+        return entry[1] if entry is not None else default
+
+    def set(self, key: Hashable, value: Any):
+        """Store value under key, evicting the oldest entry when full."""
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def add(self, key: Hashable, value: Any) -> bool:
+        """Store value under key only if no live entry exists; returns whether it was stored."""
+        with self._lock:
+            if self._lookup(key) is not None:
+                return False
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value, or default if it was not cached."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else default
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._data.clear()
+
+
+def async_ttl_cache(seconds: float, maxsize: int = 128):
+    """Cache a coroutine function's result per argument tuple for a number of seconds.
+
+    Concurrent callers with the same arguments share one in-flight call, and calls
+    that raise are not cached. The wrapper exposes cache_clear() to force a refresh.
+    """
+    def decorator(func):
+        cache = TTLCache(maxsize=maxsize, ttl=seconds)
+
+        @functools.wraps(func)
+        async def wrapper(*args):
+            task = cache.get(args)
+            if task is None:
+                task = asyncio.ensure_future(func(*args))
+                cache.set(args, task)
+            try:
+                # shield() so one cancelled caller doesn't cancel the call others are awaiting
+                return await asyncio.shield(task)
+            except Exception:
+                if cache.get(args) is task:
+                    cache.pop(args)
+                raise
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
@@ -3,18 +3,35 @@ Configuration management for Botsana.
 Handles persistent storage of bot settings using database.
 """
 
-import json
 import logging
 from typing import Optional, Dict, Any
-from database import db_manager, GuildConfig, GlobalConfig
+from cache import TTLCache
+from database import db_manager, upsert_statement, GuildConfig, GlobalConfig
 
 logger = logging.getLogger(__name__)
 
+# Cached marker for a global config key that has no value
+MISSING = object()
+
 class BotConfig:
     """Manages bot configuration with database persistence."""
 
+    def __init__(self):
+        # Read-mostly settings, keyed ('audit' | 'guild', guild_id) or ('global', key);
+        # the setters drop the entries they change
+        self._cache = TTLCache(maxsize=10_000, ttl=60)
+
+    def _invalidate_guild(self, guild_id: int):
+        """Drop cached settings for a guild after one of them changes."""
+        self._cache.pop(('audit', guild_id))
+        self._cache.pop(('guild', guild_id))
+
     def get_audit_log_channel(self, guild_id: int) -> Optional[int]:
-        """Get the audit log channel ID for a guild."""
+        """Get the audit log channel ID for a guild (cached for a minute)."""
+        cache_key = ('audit', guild_id)
+        if cache_key in self._cache:
+            return self._cache.get(cache_key)
+
         try:
             with db_manager.get_session() as session:
                 config = session.query(GuildConfig).filter(
@@ -22,9 +39,9 @@ class BotConfig:
                     GuildConfig.key == 'audit_log_channel'
                 ).first()
 
-                if config and config.value:
-                    return int(config.value)
-                return None
+                channel_id = int(config.value) if config and config.value else None
+                self._cache.set(cache_key, channel_id)
+                return channel_id
         except Exception as e:
             logger.error(f"Failed to get audit log channel for guild {guild_id}: {e}")
             return None
@@ -34,25 +51,15 @@ class BotConfig:
         try:
             with db_manager.get_session() as session:
                 # Ensure guild exists
-                db_manager.ensure_guild_exists(guild_id)
-
-                # Check if config already exists
-                config = session.query(GuildConfig).filter(
-                    GuildConfig.guild_id == guild_id,
-                    GuildConfig.key == 'audit_log_channel'
-                ).first()
-
-                if config:
-                    config.value = str(channel_id)
-                else:
-                    config = GuildConfig(
-                        guild_id=guild_id,
-                        key='audit_log_channel',
-                        value=str(channel_id)
-                    )
-                    session.add(config)
+                db_manager.ensure_guild_exists(guild_id, session=session)
 
+                session.execute(upsert_statement(
+                    session, GuildConfig,
+                    {'guild_id': guild_id, 'key': 'audit_log_channel', 'value': channel_id},
+                    ('guild_id', 'key')
+                ))
                 session.commit()
+                self._invalidate_guild(guild_id)
                 logger.info(f"Set audit log channel for guild {guild_id} to {channel_id}")
 
         except Exception as e:
@@ -60,23 +67,23 @@ class BotConfig:
             raise
 
     def get_guild_config(self, guild_id: int) -> Dict[str, Any]:
-        """Get all configuration for a guild."""
+        """Get all configuration for a guild (cached for a minute)."""
+        cache_key = ('guild', guild_id)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            # Copy so callers can't change the cached settings
+            return dict(cached)
+
         try:
             with db_manager.get_session() as session:
                 configs = session.query(GuildConfig).filter(
                     GuildConfig.guild_id == guild_id
                 ).all()
 
-                config_dict = {}
-                for config in configs:
-                    try:
-                        # Try to parse as JSON first
-                        config_dict[config.key] = json.loads(config.value)
-                    except (json.JSONDecodeError, TypeError):
-                        # If not JSON, store as string
-                        config_dict[config.key] = config.value
+                config_dict = {config.key: config.value for config in configs}
 
-                return config_dict
+                self._cache.set(cache_key, config_dict)
+                return dict(config_dict)
 
         except Exception as e:
             logger.error(f"Failed to get guild config for guild {guild_id}: {e}")
@@ -87,31 +94,15 @@ class BotConfig:
         try:
             with db_manager.get_session() as session:
                 # Ensure guild exists
-                db_manager.ensure_guild_exists(guild_id)
-
-                # Convert value to string (JSON if complex)
-                if isinstance(value, (dict, list)):
-                    value_str = json.dumps(value)
-                else:
-                    value_str = str(value)
-
-                # Check if config already exists
-                config = session.query(GuildConfig).filter(
-                    GuildConfig.guild_id == guild_id,
-                    GuildConfig.key == key
-                ).first()
-
-                if config:
-                    config.value = value_str
-                else:
-                    config = GuildConfig(
-                        guild_id=guild_id,
-                        key=key,
-                        value=value_str
-                    )
-                    session.add(config)
+                db_manager.ensure_guild_exists(guild_id, session=session)
 
+                session.execute(upsert_statement(
+                    session, GuildConfig,
+                    {'guild_id': guild_id, 'key': key, 'value': value},
+                    ('guild_id', 'key')
+                ))
                 session.commit()
+                self._invalidate_guild(guild_id)
                 logger.info(f"Set guild config {key} for guild {guild_id}")
 
         except Exception as e:
@@ -119,19 +110,22 @@ class BotConfig:
             raise
 
     def get_global_config(self, key: str, default=None):
-        """Get a global configuration value."""
+        """Get a global configuration value (cached for a minute)."""
+        cache_key = ('global', key)
+        value = self._cache.get(cache_key)
+        if value is not None:
+            return default if value is MISSING else value
+
         try:
             with db_manager.get_session() as session:
                 config = session.query(GlobalConfig).filter(
                     GlobalConfig.key == key
                 ).first()
 
-                if config and config.value:
-                    try:
-                        return json.loads(config.value)
-                    except (json.JSONDecodeError, TypeError):
-                        return config.value
-                return default
+                value = config.value if config and config.value not in (None, '') else MISSING
+
+                self._cache.set(cache_key, value)
+                return default if value is MISSING else value
 
         except Exception as e:
             logger.error(f"Failed to get global config {key}: {e}")
@@ -141,27 +135,11 @@ class BotConfig:
         """Set a global configuration value."""
         try:
             with db_manager.get_session() as session:
-                # Convert value to string (JSON if complex)
-                if isinstance(value, (dict, list)):
-                    value_str = json.dumps(value)
-                else:
-                    value_str = str(value)
-
-                # Check if config already exists
-                config = session.query(GlobalConfig).filter(
-                    GlobalConfig.key == key
-                ).first()
-
-                if config:
-                    config.value = value_str
-                else:
-                    config = GlobalConfig(
-                        key=key,
-                        value=value_str
-                    )
-                    session.add(config)
-
+                session.execute(upsert_statement(
+                    session, GlobalConfig, {'key': key, 'value': value}, ('key',)
+                ))
                 session.commit()
+                self._cache.pop(('global', key))
                 logger.info(f"Set global config {key}")
 
         except Exception as e:
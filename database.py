@@ -3,16 +3,25 @@ Database models and connection management for Botsana.
 Provides persistent storage using SQLAlchemy with PostgreSQL.
 """
 
+import json
 import os
-from datetime import datetime
-from typing import Optional, Dict, Any
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, JSON, ForeignKey, BigInteger
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List
+from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, JSON, ForeignKey, BigInteger, Index, bindparam, case, func, inspect, text, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.pool import QueuePool
+from sqlalchemy.schema import CreateIndex
+from cache import CACHE_MISS, TTLCache
 
 Base = declarative_base()
 
+# Config values are stored as native JSON (JSONB on PostgreSQL, JSON text elsewhere)
+ConfigValue = JSON().with_variant(JSONB(), 'postgresql')
+
 class Guild(Base):
     """Represents a Discord guild/server."""
     __tablename__ = 'guilds'
@@ -42,14 +51,17 @@ class GuildConfig(Base):
     id = Column(Integer, primary_key=True)
     guild_id = Column(BigInteger, ForeignKey('guilds.id'), nullable=False)
     key = Column(String(255), nullable=False)
-    value = Column(Text)  # JSON string for complex values
+    value = Column(ConfigValue)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     guild = relationship("Guild", back_populates="configs")
 
-    __table_args__ = {'sqlite_autoincrement': True}
+    __table_args__ = (
+        Index('uq_guild_configs_guild_key', 'guild_id', 'key', unique=True),
+        {'sqlite_autoincrement': True}
+    )
 
 class ErrorLog(Base):
     """Comprehensive error logging."""
@@ -70,7 +82,10 @@ class ErrorLog(Base):
     # Relationships
     guild = relationship("Guild", back_populates="error_logs")
 
-    __table_args__ = {'sqlite_autoincrement': True}
+    __table_args__ = (
+        Index('ix_error_logs_guild_created', 'guild_id', 'created_at'),
+        {'sqlite_autoincrement': True}
+    )
 
 class GlobalConfig(Base):
     """Global bot configuration."""
@@ -78,7 +93,7 @@ class GlobalConfig(Base):
 
     id = Column(Integer, primary_key=True)
     key = Column(String(255), unique=True, nullable=False)
-    value = Column(Text)
+    value = Column(ConfigValue)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -99,7 +114,13 @@ class UserMapping(Base):
     # Relationships
     guild = relationship("Guild", back_populates="user_mappings")
 
-    __table_args__ = {'sqlite_autoincrement': True}
+    __table_args__ = (
+        Index('ix_user_mappings_guild_asana_user', 'guild_id', 'asana_user_id'),
+        {'sqlite_autoincrement': True}
+    )
+
+# Columns set_notification_preference() may update
+NOTIFICATION_PREFERENCE_FIELDS = frozenset({'due_date_reminder', 'assignment_notifications'})
 
 class UserNotificationPreferences(Base):
     """User notification preferences for task updates."""
@@ -168,6 +189,7 @@ class TaskTemplate(Base):
     priority = Column(String(50))  # Template priority/ordering
     is_active = Column(Boolean, default=True)  # Whether template is available for use
     usage_count = Column(Integer, default=0)  # How many times template has been used
+    criteria_summary = Column(Text)  # Pre-rendered defaults summary for /list-templates
     created_by = Column(BigInteger, nullable=False)  # Discord user who created it
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -175,7 +197,10 @@ class TaskTemplate(Base):
     # Relationships
     guild = relationship("Guild", back_populates="task_templates")
 
-    __table_args__ = {'sqlite_autoincrement': True}
+    __table_args__ = (
+        Index('ix_task_templates_guild_lower_name', guild_id, func.lower(name)),
+        {'sqlite_autoincrement': True}
+    )
 
 class TimeEntry(Base):
     """Time tracking entries for clock in/out functionality."""
@@ -188,6 +213,7 @@ class TimeEntry(Base):
 
     # Clock times
     clock_in_time = Column(DateTime, nullable=False)
+    clock_in_ts = Column(BigInteger, nullable=True)  # clock_in_time as Unix seconds, for Discord <t:...> tags
     clock_out_time = Column(DateTime, nullable=True)
 
     # Duration in seconds (calculated on clock out)
@@ -208,7 +234,11 @@ class TimeEntry(Base):
     # Relationships
     guild = relationship("Guild", back_populates="time_entries")
 
-    __table_args__ = {'sqlite_autoincrement': True}
+    __table_args__ = (
+        # Covers the per-user daily total (guild, user, clock_in_time range, status)
+        Index('ix_time_entries_user_day', 'guild_id', 'discord_user_id', 'clock_in_time', 'status'),
+        {'sqlite_autoincrement': True}
+    )
 
 class SavedSearch(Base):
     """Saved task search configurations."""
@@ -229,6 +259,8 @@ class SavedSearch(Base):
     max_results = Column(Integer, default=10)  # Maximum results to return
     is_active = Column(Boolean, default=True)  # Whether search is available
     usage_count = Column(Integer, default=0)  # How many times search has been used
+    criteria_summary = Column(Text)  # Pre-rendered criteria lines for /load-search and /save-search
+    criteria_summary_short = Column(Text)  # Pre-rendered one-line criteria for /list-searches
     created_by = Column(BigInteger, nullable=False)  # Discord user who created it
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -293,12 +325,146 @@ class BotStats(Base):
     metadata_json = Column(Text)  # Additional data as JSON
     recorded_at = Column(DateTime, default=datetime.utcnow)
 
+# Columns added after the initial schema: (table, column, DDL type).
+# create_all() only creates missing tables, so these are added to existing tables on startup.
+SCHEMA_COLUMN_UPDATES = [
+    ('task_templates', 'criteria_summary', 'TEXT'),
+    ('saved_searches', 'criteria_summary', 'TEXT'),
+    ('saved_searches', 'criteria_summary_short', 'TEXT'),
+    ('time_entries', 'clock_in_ts', 'BIGINT'),
+]
+
+# Columns that used to hold JSON-or-plain strings and now use ConfigValue
+SCHEMA_JSON_COLUMNS = [
+    ('guild_configs', 'value'),
+    ('global_configs', 'value'),
+]
+
+def upsert_statement(session, model, values: Dict[str, Any], conflict_columns: tuple):
+    """Build an INSERT ... ON CONFLICT DO UPDATE for model on the session's dialect.
+
+    Every column in values other than conflict_columns is overwritten on conflict,
+    and updated_at is bumped since onupdate doesn't apply to the conflict branch.
+    """
+    dialect = postgresql if session.get_bind().dialect.name == 'postgresql' else sqlite
+    stmt = dialect.insert(model).values(**values)
+    updates = {name: stmt.excluded[name] for name in values if name not in conflict_columns}
+    updates['updated_at'] = datetime.utcnow()
+    return stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=updates)
+
+def build_saved_search_summaries(search_params: Dict[str, Any], assignee_name: str = None) -> tuple:
+    """Render the (full, short) criteria summaries stored on a saved search."""
+    criteria = []
+    short_criteria = []
+
+    search_query = search_params.get('search_query')
+    if search_query:
+        criteria.append(f"Query: `{search_query}`")
+        short_criteria.append(f"Query: `{search_query[:30]}{'...' if len(search_query) > 30 else ''}`")
+    if search_params.get('assignee_user_id'):
+        criteria.append(f"Assignee: <@{search_params['assignee_user_id']}>")
+        short_criteria.append(f"Assignee: {assignee_name or '<@' + str(search_params['assignee_user_id']) + '>'}")
+    if search_params.get('project_id'):
+        criteria.append(f"Project: `{search_params['project_id']}`")
+        short_criteria.append(f"Project: `{search_params['project_id']}`")
+    if search_params.get('status_filter'):
+        criteria.append(f"Status: {search_params['status_filter']}")
+        short_criteria.append(f"Status: {search_params['status_filter']}")
+    if search_params.get('due_date_filter'):
+        criteria.append(f"Due: {search_params['due_date_filter']}")
+        short_criteria.append(f"Due: {search_params['due_date_filter']}")
+    criteria.append(f"Sort: {search_params.get('sort_by') or 'created_at'} ({search_params.get('sort_order') or 'desc'})")
+    criteria.append(f"Max Results: {search_params.get('max_results') or 10}")
+
+    short_summary = ' • '.join(short_criteria[:2])
+    if len(short_criteria) > 2:
+        short_summary += f" • +{len(short_criteria) - 2} more"
+
+    return "\n".join(criteria), short_summary
+
+def build_task_template_summary(template_params: Dict[str, Any]) -> str:
+    """Render the defaults summary stored on a task template."""
+    lines = [f"📝 `{template_params['task_name_template']}`"]
+    if template_params.get('default_assignee'):
+        lines.append("👤 Has default assignee")
+    if template_params.get('default_project'):
+        lines.append("📁 Has default project")
+    due_date_offset = template_params.get('due_date_offset')
+    if due_date_offset:
+        lines.append(f"📅 Due in {due_date_offset} day{'s' if due_date_offset != 1 else ''}")
+    return "\n".join(lines)
+
+def _task_template_to_dict(template: 'TaskTemplate') -> Dict[str, Any]:
+    """Serialize a TaskTemplate row into the dict shape the bot consumes."""
+    return {
+        'id': template.id,
+        'guild_id': template.guild_id,
+        'name': template.name,
+        'description': template.description,
+        'task_name_template': template.task_name_template,
+        'default_assignee': template.default_assignee,
+        'default_project': template.default_project,
+        'default_notes': template.default_notes,
+        'due_date_offset': template.due_date_offset,
+        'priority': template.priority,
+        'is_active': template.is_active,
+        'usage_count': template.usage_count,
+        'criteria_summary': template.criteria_summary,
+        'created_by': template.created_by,
+        'created_at': template.created_at,
+        'updated_at': template.updated_at
+    }
+
+# Time entry columns the timeclock embeds read, and the full set for callers that need everything
+TIME_ENTRY_SUMMARY_COLUMNS = ('id', 'clock_in_time', 'clock_in_ts', 'clock_out_time', 'duration_seconds', 'status', 'time_proof_link')
+TIME_ENTRY_ALL_COLUMNS = TIME_ENTRY_SUMMARY_COLUMNS + ('notes', 'asana_task_gid', 'created_at')
+
+def _user_mapping_to_dict(mapping: 'UserMapping') -> Dict[str, Any]:
+    """Serialize a UserMapping row into the dict shape the bot consumes."""
+    return {
+        'id': mapping.id,
+        'guild_id': mapping.guild_id,
+        'discord_user_id': mapping.discord_user_id,
+        'asana_user_id': mapping.asana_user_id,
+        'discord_username': mapping.discord_username,
+        'asana_user_name': mapping.asana_user_name,
+        'created_by': mapping.created_by,
+        'created_at': mapping.created_at,
+        'updated_at': mapping.updated_at
+    }
+
+def _active_time_entry_to_dict(entry: 'TimeEntry') -> Dict[str, Any]:
+    """Serialize an active TimeEntry row for the timeclock commands."""
+    return {
+        'id': entry.id,
+        'guild_id': entry.guild_id,
+        'discord_user_id': entry.discord_user_id,
+        'discord_username': entry.discord_username,
+        'clock_in_time': entry.clock_in_time,
+        'clock_in_ts': entry.clock_in_ts,
+        'status': entry.status,
+        'created_at': entry.created_at
+    }
+
 class DatabaseManager:
     """Manages database connections and operations."""
 
     def __init__(self):
         self.engine = None
         self.SessionLocal = None
+        # (guild_id, discord_user_id) -> mapping dict, or None for unmapped users
+        self._user_mapping_cache = TTLCache(maxsize=10_000, ttl=300)
+        # guild_id -> {asana_user_id: mapping dict}, built on first use and dropped on mapping changes
+        self._asana_mapping_index: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        # asana_user_id -> first mapping across all guilds (or None), for notification lookups
+        self._asana_user_mapping_cache = TTLCache(maxsize=10_000, ttl=300)
+        # (discord_user_id, guild_id) -> notification preferences dict, or None when unset
+        self._notification_prefs_cache = TTLCache(maxsize=10_000, ttl=60)
+        # (guild_id, discord_user_id) -> active time entry dict, or None when clocked out.
+        # Clock-in/out overwrite their entry; reads only fill a missing one (see get_active_time_entry).
+        self._active_entry_cache = TTLCache(maxsize=10_000, ttl=60)
+        # guild_id -> timeclock channel dict, or None when no channel is designated
+        self._timeclock_channel_cache = TTLCache(maxsize=1_000, ttl=300)
         self._initialize_database()
 
     def _initialize_database(self):
@@ -330,6 +496,7 @@ class DatabaseManager:
             # Create all tables
             try:
                 Base.metadata.create_all(bind=self.engine)
+                self._apply_schema_updates()
                 print("✅ Database initialized successfully")
             except Exception as e:
                 print(f"⚠️  Warning: Could not create tables: {e}")
@@ -340,22 +507,130 @@ class DatabaseManager:
             print(f"❌ Database initialization failed: {e}")
             raise
 
+    def _apply_schema_updates(self):
+        """Add columns and indexes that are missing on existing tables."""
+        inspector = inspect(self.engine)
+        existing_tables = set(inspector.get_table_names())
+
+        with self.engine.begin() as connection:
+            for table_name, column_name, column_type in SCHEMA_COLUMN_UPDATES:
+                if table_name not in existing_tables:
+                    continue
+                existing_columns = {column['name'] for column in inspector.get_columns(table_name)}
+                if column_name not in existing_columns:
+                    connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"))
+                    print(f"🔧 Added column {table_name}.{column_name}")
+
+            for table_name, column_name in SCHEMA_JSON_COLUMNS:
+                if table_name in existing_tables:
+                    self._convert_json_column(connection, inspector, table_name, column_name)
+
+            # Drop duplicate guild settings (keeping the newest) so the unique index can be built
+            if ('guild_configs' in existing_tables and 'uq_guild_configs_guild_key' not in
+                    {index['name'] for index in inspector.get_indexes('guild_configs')}):
+                removed = connection.execute(text(
+                    "DELETE FROM guild_configs WHERE id NOT IN "
+                    "(SELECT MAX(id) FROM guild_configs GROUP BY guild_id, key)"
+                )).rowcount
+                if removed:
+                    print(f"🔧 Removed {removed} duplicate guild config rows")
+
+            # create_all() skips tables that already exist, so add any new indexes here
+            for table in Base.metadata.sorted_tables:
+                if table.name not in existing_tables:
+                    continue
+                existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+                for index in table.indexes:
+                    # Expression indexes aren't always reflected, so rely on IF NOT EXISTS as well
+                    if index.name not in existing_indexes:
+                        connection.execute(CreateIndex(index, if_not_exists=True))
+                        print(f"🔧 Ensured index {index.name}")
+
+    def _convert_json_column(self, connection, inspector, table_name: str, column_name: str):
+        """Move a legacy text column holding JSON-or-plain strings onto ConfigValue.
+
+        Plain strings (e.g. values written with str()) are re-encoded as JSON strings
+        so every row parses, then PostgreSQL columns are switched to jsonb.
+        """
+        is_postgres = connection.dialect.name == 'postgresql'
+        if is_postgres:
+            column_type = next(
+                column['type'] for column in inspector.get_columns(table_name)
+                if column['name'] == column_name
+            )
+            if isinstance(column_type, JSONB):
+                return
+        elif connection.dialect.name != 'sqlite':
+            return
+
+        rows = connection.execute(
+            text(f"SELECT id, {column_name} FROM {table_name} WHERE {column_name} IS NOT NULL")
+        ).all()
+        fixed = []
+        for row_id, value in rows:
+            if not isinstance(value, str):
+                continue
+            try:
+                json.loads(value)
+            except ValueError:
+                fixed.append({'row_id': row_id, 'value': json.dumps(value)})
+        if fixed:
+            connection.execute(
+                text(f"UPDATE {table_name} SET {column_name} = :value WHERE id = :row_id"),
+                fixed
+            )
+
+        if is_postgres:
+            connection.execute(text(
+                f"ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE jsonb USING {column_name}::jsonb"
+            ))
+            print(f"🔧 Converted {table_name}.{column_name} to jsonb")
+        elif fixed:
+            print(f"🔧 Re-encoded {len(fixed)} plain values in {table_name}.{column_name} as JSON")
+
     def get_session(self):
         """Get a database session."""
         return self.SessionLocal()
 
-    def ensure_guild_exists(self, guild_id: int, guild_name: str = None):
-        """Ensure a guild record exists in the database."""
-        with self.get_session() as session:
-            guild = session.query(Guild).filter(Guild.id == guild_id).first()
-            if not guild:
-                guild = Guild(id=guild_id, name=guild_name or f"Guild {guild_id}")
-                session.add(guild)
+    def ensure_guild_exists(self, guild_id: int, guild_name: str = None, session=None):
+        """Ensure a guild record exists in the database.
+
+        When a session is given the guild is only flushed into it, so it is committed
+        together with the caller's own writes.
+        """
+        if session is None:
+            with self.get_session() as session:
+                guild = self.ensure_guild_exists(guild_id, guild_name, session)
                 session.commit()
-            return guild
+                return guild
+
+        guild = session.get(Guild, guild_id)
+        if not guild:
+            guild = Guild(id=guild_id, name=guild_name or f"Guild {guild_id}")
+            session.add(guild)
+            session.flush()
+        return guild
 
     def get_user_mapping(self, guild_id: int, discord_user_id: int) -> Optional[Dict[str, Any]]:
-        """Get the Asana user mapping for a Discord user."""
+        """Get the Asana user mapping for a Discord user (cached for a few minutes)."""
+        cache_key = (guild_id, discord_user_id)
+        mapping = self._user_mapping_cache.get(cache_key, CACHE_MISS)
+        if mapping is not CACHE_MISS:
+            return mapping
+
+        mapping = self._load_user_mapping(guild_id, discord_user_id)
+        self._user_mapping_cache.set(cache_key, mapping)
+        return mapping
+
+    def invalidate_user_mapping(self, guild_id: int, discord_user_id: int):
+        """Drop cached lookups for a user mapping after it changes."""
+        self._user_mapping_cache.pop((guild_id, discord_user_id))
+        self._asana_mapping_index.pop(guild_id, None)
+        # Keyed by Asana ID, which the caller may not know, so drop it all
+        self._asana_user_mapping_cache.clear()
+
+    def _load_user_mapping(self, guild_id: int, discord_user_id: int) -> Optional[Dict[str, Any]]:
+        """Query the Asana user mapping for a Discord user."""
         with self.get_session() as session:
             mapping = session.query(UserMapping).filter(
                 UserMapping.guild_id == guild_id,
@@ -363,19 +638,39 @@ class DatabaseManager:
             ).first()
 
             if mapping:
-                return {
-                    'id': mapping.id,
-                    'guild_id': mapping.guild_id,
-                    'discord_user_id': mapping.discord_user_id,
-                    'asana_user_id': mapping.asana_user_id,
-                    'discord_username': mapping.discord_username,
-                    'asana_user_name': mapping.asana_user_name,
-                    'created_by': mapping.created_by,
-                    'created_at': mapping.created_at,
-                    'updated_at': mapping.updated_at
-                }
+                return _user_mapping_to_dict(mapping)
             return None
 
+    def get_user_mappings_bulk(self, guild_id: int, discord_user_ids: List[int]) -> Dict[int, Optional[Dict[str, Any]]]:
+        """Get the Asana user mappings for several Discord users, keyed by Discord user ID.
+
+        Users missing from get_user_mapping's cache are loaded with one IN query;
+        unmapped users map to None.
+        """
+        mappings = {}
+        missing_ids = []
+        for discord_user_id in dict.fromkeys(discord_user_ids):
+            mapping = self._user_mapping_cache.get((guild_id, discord_user_id), CACHE_MISS)
+            if mapping is not CACHE_MISS:
+                mappings[discord_user_id] = mapping
+            else:
+                missing_ids.append(discord_user_id)
+
+        if missing_ids:
+            with self.get_session() as session:
+                rows = session.query(UserMapping).filter(
+                    UserMapping.guild_id == guild_id,
+                    UserMapping.discord_user_id.in_(missing_ids)
+                ).all()
+                loaded = {row.discord_user_id: _user_mapping_to_dict(row) for row in rows}
+
+            for discord_user_id in missing_ids:
+                mapping = loaded.get(discord_user_id)
+                self._user_mapping_cache.set((guild_id, discord_user_id), mapping)
+                mappings[discord_user_id] = mapping
+
+        return mappings
+
     def set_user_mapping(self, guild_id: int, discord_user_id: int, asana_user_id: str,
                         discord_username: str = None, asana_user_name: str = None,
                         created_by: int = None) -> bool:
@@ -383,7 +678,7 @@ class DatabaseManager:
         try:
             with self.get_session() as session:
                 # Ensure guild exists
-                self.ensure_guild_exists(guild_id)
+                self.ensure_guild_exists(guild_id, session=session)
 
                 # Check if mapping already exists
                 existing = session.query(UserMapping).filter(
@@ -410,6 +705,7 @@ class DatabaseManager:
                     session.add(mapping)
 
                 session.commit()
+                self.invalidate_user_mapping(guild_id, discord_user_id)
                 return True
         except Exception as e:
             print(f"Error setting user mapping: {e}")
@@ -427,12 +723,24 @@ class DatabaseManager:
                 if mapping:
                     session.delete(mapping)
                     session.commit()
+                    self.invalidate_user_mapping(guild_id, discord_user_id)
                     return True
                 return False
         except Exception as e:
             print(f"Error removing user mapping: {e}")
             return False
 
+    def _get_asana_mapping_index(self, guild_id: int) -> Dict[str, Dict[str, Any]]:
+        """Return the guild's asana_user_id -> mapping index, loading it with one query if needed."""
+        index = self._asana_mapping_index.get(guild_id)
+        if index is None:
+            index = {}
+            for mapping in self.list_user_mappings(guild_id):
+                mapping['guild_id'] = guild_id
+                index[mapping['asana_user_id']] = mapping
+            self._asana_mapping_index[guild_id] = index
+        return index
+
     def list_user_mappings(self, guild_id: int) -> list:
         """List all user mappings for a guild."""
         with self.get_session() as session:
@@ -448,18 +756,33 @@ class DatabaseManager:
                 'created_at': m.created_at
             } for m in mappings]
 
-    def get_user_mapping_by_asana_id(self, asana_user_id: str) -> Optional[Dict[str, Any]]:
-        """Get Discord user mapping by Asana user ID (returns first match across all guilds)."""
+    def get_user_mapping_by_asana_id(self, asana_user_id: str, guild_id: int = None) -> Optional[Dict[str, Any]]:
+        """Get Discord user mapping by Asana user ID.
+
+        Scoped to guild_id when given (served from the guild's in-memory index);
+        otherwise returns the first match across all guilds.
+        """
+        if guild_id is not None:
+            try:
+                return self._get_asana_mapping_index(guild_id).get(asana_user_id)
+            except Exception as e:
+                print(f"Error getting user mapping by Asana ID: {e}")
+                return None
+
+        cached = self._asana_user_mapping_cache.get(asana_user_id, CACHE_MISS)
+        if cached is not CACHE_MISS:
+            return cached
+
         try:
             with self.get_session() as session:
-                # Get all mappings for this Asana user and return the first one
                 # In practice, one Asana user might be mapped in multiple guilds
                 mapping = session.query(UserMapping).filter(
                     UserMapping.asana_user_id == asana_user_id
                 ).first()
 
+                result = None
                 if mapping:
-                    return {
+                    result = {
                         'id': mapping.id,
                         'guild_id': mapping.guild_id,
                         'discord_user_id': mapping.discord_user_id,
@@ -469,13 +792,104 @@ class DatabaseManager:
                         'created_by': mapping.created_by,
                         'created_at': mapping.created_at
                     }
-                return None
         except Exception as e:
             print(f"Error getting user mapping by Asana ID: {e}")
             return None
 
+        self._asana_user_mapping_cache.set(asana_user_id, result)
+        return result
+
+    def get_user_mappings_by_asana_ids(self, asana_user_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Bulk form of get_user_mapping_by_asana_id (no guild scope), keyed by Asana user ID.
+
+        Uncached IDs are loaded with one IN query; unmapped IDs map to None.
+        """
+        mappings = {}
+        missing_ids = []
+        for asana_user_id in dict.fromkeys(asana_user_ids):
+            cached = self._asana_user_mapping_cache.get(asana_user_id, CACHE_MISS)
+            if cached is not CACHE_MISS:
+                mappings[asana_user_id] = cached
+            else:
+                missing_ids.append(asana_user_id)
+
+        if missing_ids:
+            try:
+                with self.get_session() as session:
+                    rows = session.query(UserMapping).filter(
+                        UserMapping.asana_user_id.in_(missing_ids)
+                    ).order_by(UserMapping.id).all()
+
+                    loaded = {}
+                    for mapping in rows:
+                        # Keep the first mapping per Asana user, as the single lookup does
+                        loaded.setdefault(mapping.asana_user_id, {
+                            'id': mapping.id,
+                            'guild_id': mapping.guild_id,
+                            'discord_user_id': mapping.discord_user_id,
+                            'discord_username': mapping.discord_username,
+                            'asana_user_id': mapping.asana_user_id,
+                            'asana_user_name': mapping.asana_user_name,
+                            'created_by': mapping.created_by,
+                            'created_at': mapping.created_at
+                        })
+            except Exception as e:
+                print(f"Error getting user mappings by Asana ID: {e}")
+                return mappings
+
+            for asana_user_id in missing_ids:
+                mapping = loaded.get(asana_user_id)
+                self._asana_user_mapping_cache.set(asana_user_id, mapping)
+                mappings[asana_user_id] = mapping
+
+        return mappings
+
+    def get_notification_preferences_bulk(self, user_keys: List[tuple]) -> Dict[tuple, Optional[Dict[str, Any]]]:
+        """Get notification preferences for several (discord_user_id, guild_id) pairs with at most one query."""
+        preferences = {}
+        missing_keys = []
+        for cache_key in dict.fromkeys(user_keys):
+            cached = self._notification_prefs_cache.get(cache_key, CACHE_MISS)
+            if cached is not CACHE_MISS:
+                preferences[cache_key] = cached
+            else:
+                missing_keys.append(cache_key)
+
+        if missing_keys:
+            try:
+                with self.get_session() as session:
+                    rows = session.query(UserNotificationPreferences).filter(
+                        tuple_(UserNotificationPreferences.discord_user_id,
+                               UserNotificationPreferences.guild_id).in_(missing_keys)
+                    ).all()
+
+                    loaded = {
+                        (pref.discord_user_id, pref.guild_id): {
+                            'due_date_reminder': pref.due_date_reminder,
+                            'assignment_notifications': pref.assignment_notifications,
+                            'created_at': pref.created_at,
+                            'updated_at': pref.updated_at
+                        }
+                        for pref in rows
+                    }
+            except Exception as e:
+                print(f"Error getting notification preferences: {e}")
+                return preferences
+
+            for cache_key in missing_keys:
+                pref = loaded.get(cache_key)
+                self._notification_prefs_cache.set(cache_key, pref)
+                preferences[cache_key] = pref
+
+        return preferences
+
     def get_notification_preferences(self, discord_user_id: int, guild_id: int) -> Optional[Dict[str, Any]]:
-        """Get notification preferences for a user."""
+        """Get notification preferences for a user (cached for a minute)."""
+        cache_key = (discord_user_id, guild_id)
+        cached = self._notification_prefs_cache.get(cache_key, CACHE_MISS)
+        if cached is not CACHE_MISS:
+            return cached
+
         try:
             with self.get_session() as session:
                 pref = session.query(UserNotificationPreferences).filter(
@@ -483,18 +897,21 @@ class DatabaseManager:
                     UserNotificationPreferences.guild_id == guild_id
                 ).first()
 
+                result = None
                 if pref:
-                    return {
+                    result = {
                         'due_date_reminder': pref.due_date_reminder,
                         'assignment_notifications': pref.assignment_notifications,
                         'created_at': pref.created_at,
                         'updated_at': pref.updated_at
                     }
-                return None
         except Exception as e:
             print(f"Error getting notification preferences: {e}")
             return None
 
+        self._notification_prefs_cache.set(cache_key, result)
+        return result
+
     def set_notification_preferences(self, discord_user_id: int, guild_id: int,
                                    due_date_reminder: str = '1_day',
                                    assignment_notifications: str = 'enabled') -> bool:
@@ -522,11 +939,40 @@ class DatabaseManager:
                     session.add(prefs)
 
                 session.commit()
+                self._notification_prefs_cache.pop((discord_user_id, guild_id))
                 return True
         except Exception as e:
             print(f"Error setting notification preferences: {e}")
             return False
 
+    def set_notification_preference(self, discord_user_id: int, guild_id: int, field: str, value: str) -> bool:
+        """Set a single notification preference for a user, leaving the other untouched."""
+        if field not in NOTIFICATION_PREFERENCE_FIELDS:
+            print(f"Unknown notification preference: {field}")
+            return False
+
+        try:
+            with self.get_session() as session:
+                updated = session.query(UserNotificationPreferences).filter(
+                    UserNotificationPreferences.discord_user_id == discord_user_id,
+                    UserNotificationPreferences.guild_id == guild_id
+                ).update({field: value, 'updated_at': datetime.utcnow()}, synchronize_session=False)
+
+                if not updated:
+                    # No row yet; the other preference keeps its column default
+                    session.add(UserNotificationPreferences(
+                        discord_user_id=discord_user_id,
+                        guild_id=guild_id,
+                        **{field: value}
+                    ))
+
+                session.commit()
+                self._notification_prefs_cache.pop((discord_user_id, guild_id))
+                return True
+        except Exception as e:
+            print(f"Error setting notification preference: {e}")
+            return False
+
     def get_chat_channel(self, guild_id: int) -> Optional[Dict[str, Any]]:
         """Get the designated chat channel for a guild."""
         try:
@@ -606,6 +1052,12 @@ class DatabaseManager:
                     default_notes=default_notes,
                     due_date_offset=due_date_offset,
                     priority=priority,
+                    criteria_summary=build_task_template_summary({
+                        'task_name_template': task_name_template,
+                        'default_assignee': default_assignee,
+                        'default_project': default_project,
+                        'due_date_offset': due_date_offset
+                    }),
                     created_by=created_by
                 )
                 session.add(template)
@@ -624,54 +1076,59 @@ class DatabaseManager:
                     query = query.filter(TaskTemplate.is_active == True)
                 templates = query.order_by(TaskTemplate.priority, TaskTemplate.name).all()
 
-                return [{
-                    'id': t.id,
-                    'name': t.name,
-                    'description': t.description,
-                    'task_name_template': t.task_name_template,
-                    'default_assignee': t.default_assignee,
-                    'default_project': t.default_project,
-                    'default_notes': t.default_notes,
-                    'due_date_offset': t.due_date_offset,
-                    'priority': t.priority,
-                    'is_active': t.is_active,
-                    'usage_count': t.usage_count,
-                    'created_by': t.created_by,
-                    'created_at': t.created_at,
-                    'updated_at': t.updated_at
-                } for t in templates]
+                return [_task_template_to_dict(t) for t in templates]
         except Exception as e:
             print(f"Error getting task templates: {e}")
             return []
 
+    def get_task_templates_by_name(self, guild_id: int, active_only: bool = True) -> 'OrderedDict[str, Dict[str, Any]]':
+        """Get a guild's task templates keyed by lowercased name, in list order."""
+        return OrderedDict(
+            (t['name'].lower(), t) for t in self.get_task_templates(guild_id, active_only)
+        )
+
+    def get_task_template_by_name(self, guild_id: int, name: str, active_only: bool = True) -> Optional[Dict[str, Any]]:
+        """Get a task template by name (case-insensitive)."""
+        try:
+            with self.get_session() as session:
+                query = session.query(TaskTemplate).filter(
+                    TaskTemplate.guild_id == guild_id,
+                    func.lower(TaskTemplate.name) == name.lower()
+                )
+                if active_only:
+                    query = query.filter(TaskTemplate.is_active == True)
+                template = query.first()
+                return _task_template_to_dict(template) if template else None
+        except Exception as e:
+            print(f"Error getting task template by name: {e}")
+            return None
+
     def get_task_template(self, template_id: int) -> Optional[Dict[str, Any]]:
         """Get a specific task template by ID."""
         try:
             with self.get_session() as session:
                 template = session.query(TaskTemplate).filter(TaskTemplate.id == template_id).first()
                 if template:
-                    return {
-                        'id': template.id,
-                        'guild_id': template.guild_id,
-                        'name': template.name,
-                        'description': template.description,
-                        'task_name_template': template.task_name_template,
-                        'default_assignee': template.default_assignee,
-                        'default_project': template.default_project,
-                        'default_notes': template.default_notes,
-                        'due_date_offset': template.due_date_offset,
-                        'priority': template.priority,
-                        'is_active': template.is_active,
-                        'usage_count': template.usage_count,
-                        'created_by': template.created_by,
-                        'created_at': template.created_at,
-                        'updated_at': template.updated_at
-                    }
+                    return _task_template_to_dict(template)
                 return None
         except Exception as e:
             print(f"Error getting task template: {e}")
             return None
 
+    def update_task_template_summary(self, template_id: int, criteria_summary: str) -> bool:
+        """Store a re-rendered defaults summary for a task template."""
+        try:
+            with self.get_session() as session:
+                template = session.query(TaskTemplate).filter(TaskTemplate.id == template_id).first()
+                if template:
+                    template.criteria_summary = criteria_summary
+                    session.commit()
+                    return True
+                return False
+        except Exception as e:
+            print(f"Error updating template summary: {e}")
+            return False
+
     def update_task_template_usage(self, template_id: int) -> bool:
         """Increment the usage count for a template."""
         try:
@@ -702,12 +1159,16 @@ class DatabaseManager:
             return False
 
     def get_timeclock_channel(self, guild_id: int) -> Optional[Dict[str, Any]]:
-        """Get the designated timeclock channel for a guild."""
+        """Get the designated timeclock channel for a guild (cached for a few minutes)."""
+        if guild_id in self._timeclock_channel_cache:
+            return self._timeclock_channel_cache.get(guild_id)
+
         try:
             with self.get_session() as session:
                 channel = session.query(TimeclockChannel).filter(TimeclockChannel.guild_id == guild_id).first()
+                timeclock_channel = None
                 if channel:
-                    return {
+                    timeclock_channel = {
                         'id': channel.id,
                         'guild_id': channel.guild_id,
                         'channel_id': channel.channel_id,
@@ -716,7 +1177,8 @@ class DatabaseManager:
                         'created_at': channel.created_at,
                         'updated_at': channel.updated_at
                     }
-                return None
+                self._timeclock_channel_cache.set(guild_id, timeclock_channel)
+                return timeclock_channel
         except Exception as e:
             print(f"Error getting timeclock channel: {e}")
             return None
@@ -739,6 +1201,7 @@ class DatabaseManager:
                 )
                 session.add(channel)
                 session.commit()
+                self._timeclock_channel_cache.pop(guild_id)
                 return True
         except Exception as e:
             print(f"Error setting timeclock channel: {e}")
@@ -752,6 +1215,7 @@ class DatabaseManager:
                 if channel:
                     session.delete(channel)
                     session.commit()
+                    self._timeclock_channel_cache.pop(guild_id)
                     return True
                 return False
         except Exception as e:
@@ -771,17 +1235,21 @@ class DatabaseManager:
 
                 if active_entry:
                     # User is already clocked in, return existing entry ID
+                    self._active_entry_cache.set((guild_id, discord_user_id), _active_time_entry_to_dict(active_entry))
                     return active_entry.id
 
                 # Create new time entry
+                clock_in_time = datetime.utcnow()
                 entry = TimeEntry(
                     guild_id=guild_id,
                     discord_user_id=discord_user_id,
                     discord_username=discord_username,
-                    clock_in_time=datetime.utcnow()
+                    clock_in_time=clock_in_time,
+                    clock_in_ts=int(clock_in_time.replace(tzinfo=timezone.utc).timestamp())
                 )
                 session.add(entry)
                 session.commit()
+                self._active_entry_cache.set((guild_id, discord_user_id), _active_time_entry_to_dict(entry))
                 return entry.id
 
         except Exception as e:
@@ -808,8 +1276,10 @@ class DatabaseManager:
                 entry.time_proof_link = time_proof_link
                 entry.notes = notes
                 entry.updated_at = now
+                cache_key = (entry.guild_id, entry.discord_user_id)
 
                 session.commit()
+                self._active_entry_cache.set(cache_key, None)
                 return True
 
         except Exception as e:
@@ -818,6 +1288,11 @@ class DatabaseManager:
 
     def get_active_time_entry(self, guild_id: int, discord_user_id: int) -> Optional[Dict[str, Any]]:
         """Get the active time entry for a user."""
+        cache_key = (guild_id, discord_user_id)
+        active_entry = self._active_entry_cache.get(cache_key, CACHE_MISS)
+        if active_entry is not CACHE_MISS:
+            return active_entry
+
         try:
             with self.get_session() as session:
                 entry = session.query(TimeEntry).filter(
@@ -826,47 +1301,75 @@ class DatabaseManager:
                     TimeEntry.status == 'active'
                 ).first()
 
-                if entry:
-                    return {
-                        'id': entry.id,
-                        'guild_id': entry.guild_id,
-                        'discord_user_id': entry.discord_user_id,
-                        'discord_username': entry.discord_username,
-                        'clock_in_time': entry.clock_in_time,
-                        'status': entry.status,
-                        'created_at': entry.created_at
-                    }
-                return None
+                active_entry = _active_time_entry_to_dict(entry) if entry else None
+                # add() rather than set(): a clock-in/out that landed during the query wins
+                self._active_entry_cache.add(cache_key, active_entry)
+                return active_entry
 
         except Exception as e:
             print(f"Error getting active time entry: {e}")
             return None
 
-    def get_user_time_entries(self, guild_id: int, discord_user_id: int, limit: int = 10) -> list:
-        """Get recent time entries for a user."""
+    def get_user_time_entries(self, guild_id: int, discord_user_id: int, limit: int = 10,
+                              columns: Optional[tuple] = TIME_ENTRY_SUMMARY_COLUMNS) -> list:
+        """Get recent time entries for a user.
+
+        Only the given columns are selected; pass columns=None for every field.
+        """
+        if columns is None:
+            columns = TIME_ENTRY_ALL_COLUMNS
+
         try:
             with self.get_session() as session:
-                entries = session.query(TimeEntry).filter(
+                rows = session.query(*(getattr(TimeEntry, column) for column in columns)).filter(
                     TimeEntry.guild_id == guild_id,
                     TimeEntry.discord_user_id == discord_user_id
                 ).order_by(TimeEntry.created_at.desc()).limit(limit).all()
 
-                return [{
-                    'id': entry.id,
-                    'clock_in_time': entry.clock_in_time,
-                    'clock_out_time': entry.clock_out_time,
-                    'duration_seconds': entry.duration_seconds,
-                    'time_proof_link': entry.time_proof_link,
-                    'notes': entry.notes,
-                    'status': entry.status,
-                    'asana_task_gid': entry.asana_task_gid,
-                    'created_at': entry.created_at
-                } for entry in entries]
+                return [dict(zip(columns, row)) for row in rows]
 
         except Exception as e:
             print(f"Error getting user time entries: {e}")
             return []
 
+    def get_history_with_summary(self, guild_id: int, discord_user_id: int, limit: int = 10) -> tuple:
+        """Get recent time entries plus (total_seconds, completed_count) over those entries."""
+        try:
+            with self.get_session() as session:
+                recent = session.query(TimeEntry).filter(
+                    TimeEntry.guild_id == guild_id,
+                    TimeEntry.discord_user_id == discord_user_id
+                ).order_by(TimeEntry.created_at.desc()).limit(limit).subquery('recent')
+
+                is_completed = recent.c.status == 'completed'
+                rows = session.query(
+                    recent.c.id,
+                    recent.c.clock_in_time,
+                    recent.c.clock_in_ts,
+                    recent.c.duration_seconds,
+                    recent.c.time_proof_link,
+                    recent.c.status,
+                    func.sum(case((is_completed, recent.c.duration_seconds), else_=0)).over().label('total_seconds'),
+                    func.sum(case((is_completed, 1), else_=0)).over().label('completed_count')
+                ).order_by(recent.c.created_at.desc()).all()
+
+                if not rows:
+                    return [], 0, 0
+
+                entries = [{
+                    'id': row.id,
+                    'clock_in_time': row.clock_in_time,
+                    'clock_in_ts': row.clock_in_ts,
+                    'duration_seconds': row.duration_seconds,
+                    'time_proof_link': row.time_proof_link,
+                    'status': row.status
+                } for row in rows]
+                return entries, int(rows[0].total_seconds or 0), int(rows[0].completed_count or 0)
+
+        except Exception as e:
+            print(f"Error getting time history: {e}")
+            return [], 0, 0
+
     def get_all_active_entries(self, guild_id: int) -> list:
         """Get all active time entries for a guild."""
         try:
@@ -881,6 +1384,7 @@ class DatabaseManager:
                     'discord_user_id': entry.discord_user_id,
                     'discord_username': entry.discord_username,
                     'clock_in_time': entry.clock_in_time,
+                    'clock_in_ts': entry.clock_in_ts,
                     'created_at': entry.created_at
                 } for entry in entries]
 
@@ -888,14 +1392,18 @@ class DatabaseManager:
             print(f"Error getting active entries: {e}")
             return []
 
-    def create_saved_search(self, guild_id: int, name: str, created_by: int, **search_params) -> bool:
-        """Create a new saved search."""
+    def create_saved_search(self, guild_id: int, name: str, created_by: int,
+                            assignee_name: str = None, **search_params) -> bool:
+        """Create a new saved search, pre-rendering its criteria summaries."""
         try:
             with self.get_session() as session:
+                criteria_summary, criteria_summary_short = build_saved_search_summaries(search_params, assignee_name)
                 search = SavedSearch(
                     guild_id=guild_id,
                     name=name,
                     created_by=created_by,
+                    criteria_summary=criteria_summary,
+                    criteria_summary_short=criteria_summary_short,
                     **search_params
                 )
                 session.add(search)
@@ -929,6 +1437,8 @@ class DatabaseManager:
                     'max_results': s.max_results,
                     'is_active': s.is_active,
                     'usage_count': s.usage_count,
+                    'criteria_summary': s.criteria_summary,
+                    'criteria_summary_short': s.criteria_summary_short,
                     'created_by': s.created_by,
                     'created_at': s.created_at,
                     'updated_at': s.updated_at
@@ -959,6 +1469,8 @@ class DatabaseManager:
                         'max_results': search.max_results,
                         'is_active': search.is_active,
                         'usage_count': search.usage_count,
+                        'criteria_summary': search.criteria_summary,
+                        'criteria_summary_short': search.criteria_summary_short,
                         'created_by': search.created_by,
                         'created_at': search.created_at,
                         'updated_at': search.updated_at
@@ -968,19 +1480,41 @@ class DatabaseManager:
             print(f"Error getting saved search: {e}")
             return None
 
-    def update_saved_search_usage(self, search_id: int) -> bool:
-        """Increment the usage count for a saved search."""
+    def update_saved_search_summaries(self, search_id: int, criteria_summary: str, criteria_summary_short: str) -> bool:
+        """Store re-rendered criteria summaries for a saved search."""
         try:
             with self.get_session() as session:
                 search = session.query(SavedSearch).filter(SavedSearch.id == search_id).first()
                 if search:
-                    search.usage_count += 1
-                    search.updated_at = datetime.utcnow()
+                    search.criteria_summary = criteria_summary
+                    search.criteria_summary_short = criteria_summary_short
                     session.commit()
                     return True
                 return False
         except Exception as e:
-            print(f"Error updating search usage: {e}")
+            print(f"Error updating search summaries: {e}")
+            return False
+
+    def increment_saved_search_usage(self, usage_counts: Dict[int, int]) -> bool:
+        """Apply batched usage count increments ({search_id: increment}) in a single transaction."""
+        if not usage_counts:
+            return True
+
+        try:
+            with self.get_session() as session:
+                table = SavedSearch.__table__
+                stmt = table.update().where(table.c.id == bindparam('search_id')).values(
+                    usage_count=table.c.usage_count + bindparam('increment'),
+                    updated_at=datetime.utcnow()
+                )
+                session.execute(stmt, [
+                    {'search_id': search_id, 'increment': increment}
+                    for search_id, increment in usage_counts.items()
+                ])
+                session.commit()
+                return True
+        except Exception as e:
+            print(f"Error incrementing search usage: {e}")
             return False
 
     def delete_saved_search(self, search_id: int) -> bool:
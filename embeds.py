@@ -0,0 +1,93 @@
+"""
+Embed builders shared by Botsana's slash commands.
+Builds the common error/success layouts from plain dicts in one Embed.from_dict call.
+"""
+
+import discord
+import functools
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+# Embed colors as raw ints, resolved once at import
+ERROR_COLOR = discord.Color.red().value
+SUCCESS_COLOR = discord.Color.green().value
+INFO_COLOR = discord.Color.blue().value
+WARNING_COLOR = discord.Color.yellow().value
+NOTICE_COLOR = discord.Color.orange().value
+NEUTRAL_COLOR = discord.Color.grey().value
+
+# (name, value, inline)
+EmbedField = Tuple[str, str, bool]
+
+
+def embed_dict(title: str, description: Optional[str], color: int,
+               fields: Iterable[EmbedField] = (), timestamp: Optional[datetime] = None,
+               footer: Optional[str] = None) -> dict:
+    """Build the Embed.from_dict payload for an embed from its parts."""
+    data = {
+        'type': 'rich',
+        'title': title,
+        'color': color,
+        'fields': [{'name': name, 'value': value, 'inline': inline} for name, value, inline in fields]
+    }
+    if description is not None:
+        data['description'] = description
+    if timestamp is not None:
+        data['timestamp'] = timestamp.isoformat()
+    if footer is not None:
+        data['footer'] = {'text': footer}
+    return data
+
+
+def build_embed(title: str, description: Optional[str], color: int,
+                fields: Iterable[EmbedField] = (), timestamp: Optional[datetime] = None,
+                footer: Optional[str] = None) -> discord.Embed:
+    """Build an embed from its parts without a chain of add_field calls."""
+    return discord.Embed.from_dict(embed_dict(title, description, color, fields, timestamp, footer))
+
+
+def embed_from_template(template: dict) -> discord.Embed:
+    """Build an embed from a prebuilt embed_dict() payload.
+
+    Embed.from_dict keeps the list it is given, so the field list is copied to
+    keep the shared template intact if the embed is changed afterwards.
+    """
+    return discord.Embed.from_dict({**template, 'fields': list(template['fields'])})
+
+
+def error_embed(title: str, description: str, fields: Iterable[EmbedField] = ()) -> discord.Embed:
+    """Build a red error embed."""
+    return build_embed(title, description, ERROR_COLOR, fields)
+
+
+def success_embed(title: str, description: str, fields: Iterable[EmbedField] = (),
+                  color: int = SUCCESS_COLOR, timestamp: Optional[datetime] = None,
+                  footer: Optional[str] = None) -> discord.Embed:
+    """Build a success embed (green unless another color is given)."""
+    return build_embed(title, description, color, fields, timestamp, footer)
+
+
+def already_clocked_in_embed(clock_in_ts: int, duration: str) -> discord.Embed:
+    """Build the warning shown when a user runs /clock-in during an active session."""
+    return build_embed(
+        "⚠️ Already Clocked In",
+        "You are already clocked in for work.",
+        WARNING_COLOR,
+        (
+            ("🕐 Clock In Time", f"<t:{clock_in_ts}:F>", True),
+            ("⏱️ Current Session", duration, True),
+            ("💡 To Clock Out", "Use `/clock-out` with your time proof link", False),
+        )
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def admin_required_embed(action: str) -> discord.Embed:
+    """Build (once per action) the embed shown when a non-admin runs an admin command.
+
+    The returned embed is shared between calls, so callers must not modify it.
+    """
+    return error_embed(
+        "❌ Administrator Required",
+        f"You need Administrator permissions to {action}."
+    )
@@ -3,12 +3,13 @@ Comprehensive error logging and reporting system for Botsana.
 Handles logging to Discord audit channels and provides detailed error analysis.
 """
 
+import asyncio
 import logging
 import discord
 import json
 import traceback
-from datetime import datetime
-from typing import Optional, Dict, Any
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Tuple
 from config import bot_config
 from database import db_manager, ErrorLog
 
@@ -24,7 +25,7 @@ class ErrorLogger:
 
     async def log_error(self, error: Exception, context: str = "", user_id: Optional[int] = None,
                         guild_id: Optional[int] = None, command: Optional[str] = None,
-                        severity: str = "ERROR") -> bool:
+                        severity: str = "ERROR", timestamp: Optional[datetime] = None) -> bool:
         """
         Log an error with comprehensive context to both database and Discord.
 
@@ -35,13 +36,30 @@ class ErrorLogger:
             guild_id: Discord guild ID where the error occurred
             command: Command that was being executed
             severity: Error severity (ERROR, CRITICAL, WARNING)
+            timestamp: When the error happened, if the caller already read the clock (defaults to now)
 
         Returns:
             bool: True if logged to audit channel, False otherwise
         """
+        error_info, error_log = self._prepare_error(error, context, user_id, guild_id, command, severity, timestamp)
+
+        # Save to database in a worker thread so the event loop isn't blocked on the commit
+        await asyncio.to_thread(self._save_error_logs, [error_log])
+
+        # Send to audit log channel if configured
+        success = await self._send_to_audit_channel(error_info, severity)
+        return success
+
+    def _prepare_error(self, error: Exception, context: str, user_id: Optional[int],
+                       guild_id: Optional[int], command: Optional[str],
+                       severity: str, timestamp: Optional[datetime] = None) -> Tuple[Dict[str, Any], ErrorLog]:
+        """Write the console log line for an error and build its audit info and database row."""
+        # Read the clock once (UTC) for both the audit info and the database row
+        timestamp = timestamp or datetime.now(timezone.utc)
+
         # Create detailed error log
         error_info = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp.isoformat(),
             'severity': severity,
             'error_type': type(error).__name__,
             'error_message': str(error),
@@ -72,31 +90,32 @@ class ErrorLogger:
         else:
             logger.error(log_message)
 
-        # Save to database
+        error_log = ErrorLog(
+            guild_id=guild_id,
+            user_id=user_id,
+            severity=severity,
+            error_type=type(error).__name__,
+            error_message=str(error),
+            context=context,
+            command=command,
+            stack_trace=stack_trace[:5000],  # Limit stack trace length
+            # created_at is stored as naive UTC, like the utcnow default
+            created_at=timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        )
+        return error_info, error_log
+
+    def _save_error_logs(self, error_logs: List[ErrorLog]):
+        """Save error log rows to the database in one session."""
         try:
             with db_manager.get_session() as session:
-                if guild_id:
-                    db_manager.ensure_guild_exists(guild_id)
-
-                error_log = ErrorLog(
-                    guild_id=guild_id,
-                    user_id=user_id,
-                    severity=severity,
-                    error_type=type(error).__name__,
-                    error_message=str(error),
-                    context=context,
-                    command=command,
-                    stack_trace=stack_trace[:5000]  # Limit stack trace length
-                )
-                session.add(error_log)
+                for guild_id in {error_log.guild_id for error_log in error_logs if error_log.guild_id}:
+                    db_manager.ensure_guild_exists(guild_id, session=session)
+
+                session.add_all(error_logs)
                 session.commit()
         except Exception as db_error:
             logger.error(f"Failed to save error to database: {db_error}")
 
-        # Send to audit log channel if configured
-        success = await self._send_to_audit_channel(error_info, severity)
-        return success
-
     async def log_command_error(self, interaction: discord.Interaction, error: Exception,
                                command_name: str) -> bool:
         """Log a command execution error."""
@@ -126,18 +145,45 @@ class ErrorLogger:
 
     async def log_system_event(self, event_type: str, message: str,
                               details: Optional[Dict[str, Any]] = None,
-                              severity: str = "INFO") -> bool:
+                              severity: str = "INFO", timestamp: Optional[datetime] = None) -> bool:
         """Log a system event."""
-        context = f"System Event: {event_type} - {message}"
-        if details:
-            context += f" | Details: {json.dumps(details)}"
-
         return await self.log_error(
             error=Exception(message),  # Using Exception to fit the interface
-            context=context,
-            severity=severity
+            context=self._system_event_context(event_type, message, details),
+            severity=severity,
+            timestamp=timestamp
         )
 
+    async def log_system_event_batch(self, events: List[Tuple[str, str, Optional[Dict[str, Any]], str, Optional[datetime]]]) -> int:
+        """
+        Log several system events, saving them to the database in one session.
+
+        Args:
+            events: (event_type, message, details, severity, timestamp) tuples; timestamp may be None
+
+        Returns:
+            int: Number of events logged to the audit channel
+        """
+        prepared = [
+            self._prepare_error(Exception(message), self._system_event_context(event_type, message, details),
+                                None, None, None, severity, timestamp)
+            for event_type, message, details, severity, timestamp in events
+        ]
+        await asyncio.to_thread(self._save_error_logs, [error_log for _, error_log in prepared])
+
+        sent = 0
+        for (error_info, _), event in zip(prepared, events):
+            if await self._send_to_audit_channel(error_info, event[3]):
+                sent += 1
+        return sent
+
+    def _system_event_context(self, event_type: str, message: str, details: Optional[Dict[str, Any]]) -> str:
+        """Build the logged context line for a system event."""
+        context = f"System Event: {event_type} - {message}"
+        if details:
+            context += f" | Details: {json.dumps(details)}"
+        return context
+
     async def _send_to_audit_channel(self, error_info: Dict[str, Any], severity: str) -> bool:
         """Send error information to the configured audit log channel."""
         try: